@@ -109,10 +109,7 @@
               editableOverlay = workspace.mkEditablePyprojectOverlay { root = "$REPO_ROOT"; };
               editablePythonSet = pythonSet.overrideScope editableOverlay;
               virtualenv = editablePythonSet.mkVirtualEnv "grafana-sync-dev-env" {
-                grafana-sync = [
-                  "generate"
-                  "test"
-                ];
+                grafana-sync = [ "test" ];
               };
             in
             pkgs.mkShell {
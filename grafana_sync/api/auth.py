@@ -0,0 +1,287 @@
+import asyncio
+import base64
+import logging
+import re
+import time
+import uuid
+from collections.abc import AsyncGenerator, Generator
+
+import httpx
+
+from grafana_sync.exceptions import GrafanaApiError
+
+logger = logging.getLogger(__name__)
+
+# default name of the Grafana login cookie
+SESSION_COOKIE_NAME = "grafana_session"
+
+# name prefix of the temporary service accounts created for token auth
+SERVICE_ACCOUNT_PREFIX = "grafana-sync-"
+
+# service accounts of other runs are only swept once they are this old, so
+# a run which has not minted its token yet keeps its account
+STALE_SERVICE_ACCOUNT_AGE = 300
+
+# names of the service accounts created by this module, other accounts with
+# the prefix were not created by grafana-sync and are never swept
+SERVICE_ACCOUNT_NAME = re.compile(
+    re.escape(SERVICE_ACCOUNT_PREFIX) + r"(\d+)-[0-9a-f]{8}"
+)
+
+SERVICE_ACCOUNT_SEARCH_PAGE_SIZE = 100
+
+
+def basic_auth_header(username: str, password: str) -> str:
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return f"Basic {credentials}"
+
+
+class LoginAuth(httpx.Auth):
+    """Base class for authentication schemes which log in once per run.
+
+    The credential obtained by ``login_flow`` is shared by all requests of the
+    client. Concurrent requests wait for a login in progress instead of
+    logging in themselves. When a request is rejected with 401, the credential
+    is refreshed once and the request is repeated.
+    """
+
+    requires_response_body = True
+
+    def __init__(self, base_url: str, username: str, password: str) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self._credential: str | None = None
+        self._lock = asyncio.Lock()
+
+    def login_flow(self) -> Generator[httpx.Request, httpx.Response, str]:
+        """Send the login requests and return the obtained credential."""
+        raise NotImplementedError
+
+    def apply(self, request: httpx.Request, credential: str) -> None:
+        """Attach the credential to a request."""
+        raise NotImplementedError
+
+    def update(self, response: httpx.Response) -> None:
+        """Pick up a credential rotated by the server."""
+
+    def cleanup_request(self) -> httpx.Request | None:
+        """Get a request releasing server-side resources at the end of the run."""
+        return None
+
+    def sync_auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        msg = f"{type(self).__name__} only supports async clients"
+        raise RuntimeError(msg)
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        stale = None
+        while True:
+            async with self._lock:
+                if self._credential is None or self._credential == stale:
+                    logger.debug("logging in to %s", self.base_url)
+                    flow = self.login_flow()
+                    login_request = next(flow)
+                    while True:
+                        login_response = yield login_request
+                        try:
+                            login_request = flow.send(login_response)
+                        except StopIteration as stop:
+                            self._credential = stop.value
+                            break
+                credential = self._credential
+
+            self.apply(request, credential)
+            response = yield request
+
+            if response.status_code != 401 or stale is not None:
+                self.update(response)
+                return
+
+            logger.debug("credential rejected, logging in again")
+            stale = credential
+
+
+class SessionAuth(LoginAuth):
+    """Authenticate with the session cookie obtained from a single login.
+
+    This avoids Grafana verifying the password hash on every request.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        cookie_name: str = SESSION_COOKIE_NAME,
+    ) -> None:
+        super().__init__(base_url, username, password)
+        self.cookie_name = cookie_name
+
+    def login_flow(self) -> Generator[httpx.Request, httpx.Response, str]:
+        response = yield httpx.Request(
+            "POST",
+            f"{self.base_url}/login",
+            json={"user": self.username, "password": self.password},
+        )
+        if response.is_error:
+            raise GrafanaApiError(response)
+
+        session = response.cookies.get(self.cookie_name)
+        if session is None:
+            raise GrafanaApiError(
+                response, f"Login did not return a '{self.cookie_name}' cookie"
+            )
+        return session
+
+    def apply(self, request: httpx.Request, credential: str) -> None:
+        request.headers["Cookie"] = f"{self.cookie_name}={credential}"
+
+    def update(self, response: httpx.Response) -> None:
+        if rotated := response.cookies.get(self.cookie_name):
+            self._credential = rotated
+
+
+class ServiceAccountTokenAuth(LoginAuth):
+    """Authenticate with a short-lived service account token.
+
+    A temporary service account is created with the basic credentials and a
+    token with a limited lifetime is minted for it. The service account is
+    deleted again via ``cleanup_request`` when the client is closed.
+
+    A run which crashes cannot delete its service account. Such accounts are
+    recognised by their generated name, ``grafana-sync-<created>-<random>``,
+    and are deleted at the next login once none of their tokens is valid
+    anymore.
+
+    The service account has the Admin role of the organization, it cannot
+    call the server admin API, e.g. to log out users.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        seconds_to_live: int = 3600,
+    ) -> None:
+        super().__init__(base_url, username, password)
+        self.seconds_to_live = seconds_to_live
+        self.name = f"{SERVICE_ACCOUNT_PREFIX}{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        self.service_account_id: int | None = None
+        self._token_count = 0
+
+    def _basic_request(self, method: str, path: str, **kwargs) -> httpx.Request:
+        return httpx.Request(
+            method,
+            f"{self.base_url}{path}",
+            headers={"Authorization": basic_auth_header(self.username, self.password)},
+            **kwargs,
+        )
+
+    def sweep_flow(self) -> Generator[httpx.Request, httpx.Response, None]:
+        """Delete the service accounts left behind by crashed runs."""
+        now = time.time()
+        candidates = []
+        page = 1
+        while True:
+            response = yield self._basic_request(
+                "GET",
+                "/api/serviceaccounts/search",
+                params={
+                    "query": SERVICE_ACCOUNT_PREFIX,
+                    "perpage": SERVICE_ACCOUNT_SEARCH_PAGE_SIZE,
+                    "page": page,
+                },
+            )
+            if response.is_error:
+                logger.warning(
+                    "cannot search for stale service accounts: %s",
+                    GrafanaApiError(response),
+                )
+                return
+
+            result = response.json()
+            accounts = result["serviceAccounts"]
+            candidates.extend(
+                account
+                for account in accounts
+                if (created := service_account_created(account["name"])) is not None
+                and now - created > STALE_SERVICE_ACCOUNT_AGE
+            )
+            if (
+                not accounts
+                or page * SERVICE_ACCOUNT_SEARCH_PAGE_SIZE >= result["totalCount"]
+            ):
+                break
+            page += 1
+
+        for account in candidates:
+            if account.get("tokens", 1) > 0:
+                response = yield self._basic_request(
+                    "GET", f"/api/serviceaccounts/{account['id']}/tokens"
+                )
+                if response.is_error:
+                    continue
+                if any(not token.get("hasExpired") for token in response.json()):
+                    continue
+
+            response = yield self._basic_request(
+                "DELETE", f"/api/serviceaccounts/{account['id']}"
+            )
+            if response.is_error:
+                logger.warning(
+                    "cannot delete stale service account %s: %s",
+                    account["name"],
+                    GrafanaApiError(response),
+                )
+            else:
+                logger.info("deleted stale service account %s", account["name"])
+
+    def login_flow(self) -> Generator[httpx.Request, httpx.Response, str]:
+        if self.service_account_id is None:
+            yield from self.sweep_flow()
+            response = yield self._basic_request(
+                "POST",
+                "/api/serviceaccounts",
+                json={"name": self.name, "role": "Admin", "isDisabled": False},
+            )
+            if response.is_error:
+                raise GrafanaApiError(response)
+            self.service_account_id = response.json()["id"]
+
+        self._token_count += 1
+        response = yield self._basic_request(
+            "POST",
+            f"/api/serviceaccounts/{self.service_account_id}/tokens",
+            json={
+                "name": f"{self.name}-{self._token_count}",
+                "secondsToLive": self.seconds_to_live,
+            },
+        )
+        if response.is_error:
+            raise GrafanaApiError(response)
+        return response.json()["key"]
+
+    def apply(self, request: httpx.Request, credential: str) -> None:
+        request.headers["Authorization"] = f"Bearer {credential}"
+
+    def cleanup_request(self) -> httpx.Request | None:
+        if self.service_account_id is None:
+            return None
+        return self._basic_request(
+            "DELETE", f"/api/serviceaccounts/{self.service_account_id}"
+        )
+
+
+def service_account_created(name: str) -> int | None:
+    """Get the creation time from the name of a temporary service account.
+
+    Returns None if the name was not generated by ServiceAccountTokenAuth.
+    """
+    if match := SERVICE_ACCOUNT_NAME.fullmatch(name):
+        return int(match.group(1))
+    return None
@@ -0,0 +1,152 @@
+import datetime
+import logging
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from pydantic import BaseModel
+
+from grafana_sync.api.models import VERSION_CREATED_TOLERANCE
+
+logger = logging.getLogger(__name__)
+
+# default upper bound of the on-disk dashboard cache
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class _VersionedDashboard(BaseModel):
+    version: int | None = None
+
+
+class _UpdatedMeta(BaseModel):
+    updated: datetime.datetime | None = None
+
+
+class _VersionedDashboardResponse(BaseModel):
+    """Minimal view of a dashboard response, used to stamp cache entries."""
+
+    dashboard: _VersionedDashboard
+    meta: _UpdatedMeta = _UpdatedMeta()
+
+
+class DashboardCache:
+    """On-disk cache of dashboard API responses keyed by uid and version.
+
+    Every entry holds the raw response body of ``/api/dashboards/uid/<uid>``
+    in a file named after the uid, the dashboard version and the time of its
+    last update. A cached body is only served for the version reported by
+    the server, and only if that version was created when the cached body
+    was updated. A dashboard deleted and created again restarts its version
+    numbering, its cached body is then not served for the new dashboard.
+    Entries are evicted in least recently used order once the cache exceeds
+    max_bytes.
+    """
+
+    def __init__(
+        self, path: Path | str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # uid -> (version, updated, size), updated in seconds since the epoch
+        self._entries: dict[str, tuple[int, int, int]] = {}
+        self._size = 0
+        self._scan()
+
+    def _file(self, uid: str, version: int, updated: int) -> Path:
+        return self.path / f"{quote(uid, safe='')}.v{version}.{updated}.json"
+
+    def _entry_file(self, uid: str) -> Path:
+        version, updated, _ = self._entries[uid]
+        return self._file(uid, version, updated)
+
+    def _scan(self) -> None:
+        for entry in self.path.glob("*.v*.*.json"):
+            stem, _, updated = entry.name.removesuffix(".json").rpartition(".")
+            name, _, version = stem.rpartition(".v")
+            try:
+                self._add(
+                    unquote(name), int(version), int(updated), entry.stat().st_size
+                )
+            except (ValueError, OSError):
+                logger.debug("ignoring unexpected cache file %s", entry)
+
+    def _add(self, uid: str, version: int, updated: int, size: int) -> None:
+        self.discard(uid)
+        self._entries[uid] = (version, updated, size)
+        self._size += size
+
+    def version(self, uid: str) -> int | None:
+        """Get the version of the cached dashboard, if any."""
+        entry = self._entries.get(uid)
+        return entry[0] if entry else None
+
+    def get(self, uid: str, version: int, created: datetime.datetime) -> bytes | None:
+        """Get the cached response body if it matches the given version.
+
+        Args:
+            uid: The uid of the dashboard
+            version: The latest version of the dashboard
+            created: The creation time of the latest version
+        """
+        entry = self._entries.get(uid)
+        if (
+            entry is None
+            or entry[0] != version
+            or abs(created.timestamp() - entry[1]) > VERSION_CREATED_TOLERANCE
+        ):
+            return None
+
+        file = self._entry_file(uid)
+        try:
+            content = file.read_bytes()
+            # refresh the modification time used for LRU eviction
+            os.utime(file)
+        except OSError:
+            self.discard(uid)
+            return None
+
+        return content
+
+    def put(self, uid: str, content: bytes) -> None:
+        """Store a dashboard response body."""
+        response = _VersionedDashboardResponse.model_validate_json(content)
+        version = response.dashboard.version
+        if version is None or response.meta.updated is None:
+            return
+        updated = round(response.meta.updated.timestamp())
+
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        self._add(uid, version, updated, len(content))
+        os.replace(tmp, self._file(uid, version, updated))
+
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def discard(self, uid: str) -> None:
+        """Remove the cached entry of a dashboard."""
+        entry = self._entries.pop(uid, None)
+        if entry is None:
+            return
+
+        version, updated, size = entry
+        self._size -= size
+        self._file(uid, version, updated).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        def last_used(uid: str) -> float:
+            try:
+                return self._entry_file(uid).stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for uid in sorted(self._entries, key=last_used):
+            if self._size <= self.max_bytes:
+                break
+            logger.debug("evicting dashboard %s from cache", uid)
+            self.discard(uid)
@@ -1,32 +1,71 @@
+import asyncio
+import hashlib
 import logging
 import os
-import random
 import ssl
-from collections.abc import AsyncGenerator
+from collections import defaultdict, deque
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+)
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Self
 from urllib.parse import urlparse
 
-import certifi
 import httpx
 from httpx import Response
-
+from httpx._utils import get_environment_proxies
+
+from grafana_sync import tracing
+from grafana_sync.api.auth import LoginAuth, ServiceAccountTokenAuth, SessionAuth
+from grafana_sync.api.cache import DEFAULT_CACHE_MAX_BYTES, DashboardCache
+from grafana_sync.api.instrumentation import (
+    DEFAULT_LOG_BODY_LIMIT,
+    RequestHooks,
+    RequestObserver,
+)
+from grafana_sync.api.memo import RequestMemo
+from grafana_sync.api.metrics import ApiMetrics
 from grafana_sync.api.models import (
     CreateDatasourceResponse,
+    CreateFolderRequest,
     CreateFolderResponse,
     CreateReportResponse,
     DashboardData,
+    DashboardVersion,
     DatasourceDefinition,
+    GetDashboardMetaResponse,
     GetDashboardResponse,
+    GetDashboardVersionsResponse,
     GetDatasourcesResponse,
     GetFolderResponse,
     GetFoldersResponse,
+    GetFoldersResponseItem,
     GetReportResponse,
     GetReportsResponse,
+    MoveFolderRequest,
     SearchDashboardsResponse,
+    SearchDashboardsResponseItem,
+    SearchUsersResponse,
+    SearchUsersResponseItem,
     UpdateDashboardRequest,
     UpdateDashboardResponse,
+    UpdateFolderRequest,
     UpdateFolderResponse,
 )
+from grafana_sync.api.transport import (
+    AdaptiveLimiter,
+    ConnectionStats,
+    GrafanaTransport,
+    RetryPolicy,
+    TokenBucket,
+)
+from grafana_sync.checkpoint import Checkpoint
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY, map_as_completed, run_all
 from grafana_sync.exceptions import (
     ExistingDashboardsError,
     ExistingDatasourcesError,
@@ -42,6 +81,55 @@ FOLDER_GENERAL = "general"
 # virtual folder
 FOLDER_SHAREDWITHME = "sharedwithme"
 
+# ways of using username and password for authentication
+AUTH_MODE_BASIC = "basic"
+AUTH_MODE_SESSION = "session"
+AUTH_MODE_TOKEN = "token"
+AUTH_MODES = (AUTH_MODE_BASIC, AUTH_MODE_SESSION, AUTH_MODE_TOKEN)
+
+# connection pool defaults, matching those of httpx
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_TIMEOUT = 5.0
+
+# maximum page size accepted by the Grafana search API
+SEARCH_PAGE_SIZE = 5000
+
+# default page size of the Grafana folders API
+FOLDERS_PAGE_SIZE = 1000
+
+# page size of the Grafana user search API
+USERS_PAGE_SIZE = 1000
+
+
+@lru_cache
+def ssl_context(cafile: str | None = None, capath: str | None = None) -> ssl.SSLContext:
+    """Get the SSL context of the CA configuration, shared by all clients.
+
+    Loading the CA bundle is expensive, so the context is created once per
+    configuration. Without a CA file the certifi bundle is used.
+    """
+    if cafile is None:
+        import certifi
+
+        cafile = certifi.where()
+    return ssl.create_default_context(cafile=cafile, capath=capath)
+
+
+class LogoutResult:
+    """Progress and outcome of logging out all users."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.logged_out = 0
+        self.skipped = 0
+        self.failed: dict[str, Exception] = {}
+
+    @property
+    def processed(self) -> int:
+        return self.logged_out + self.skipped + len(self.failed)
+
 
 class GrafanaClient:
     def __init__(
@@ -50,8 +138,56 @@ class GrafanaClient:
         api_key: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        *,
+        auth_mode: str = AUTH_MODE_BASIC,
+        retry_policy: RetryPolicy | None = None,
+        read_rate: float | None = None,
+        write_rate: float | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int | None = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        memoize: bool = False,
+        cache_dir: Path | str | None = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        log_body_limit: int = DEFAULT_LOG_BODY_LIMIT,
+        collect_metrics: bool = False,
+        concurrency_limiter: AdaptiveLimiter | None = None,
     ) -> None:
-        """Create a Grafana API client from connection parameters."""
+        """Create a Grafana API client from connection parameters.
+
+        Args:
+            url: The Grafana URL, optionally including credentials
+            api_key: API key for token authentication
+            username: Username for basic authentication
+            password: Password for basic authentication
+            auth_mode: How username and password are used: "basic" sends them
+                with every request, "session" logs in once and reuses the session
+                cookie, "token" mints a short-lived service account token
+            retry_policy: Retry policy for transient errors (default: RetryPolicy())
+            read_rate: Optional maximum number of read requests per second
+            write_rate: Optional maximum number of write requests per second
+            max_connections: Maximum number of concurrent connections (None for
+                no limit)
+            max_keepalive: Maximum number of idle keep-alive connections
+            keepalive_expiry: Seconds after which idle connections are closed
+            timeout: Timeout in seconds for connecting, reading and writing
+            http2: Multiplex requests over HTTP/2 connections (requires the
+                h2 package)
+            memoize: Memoize folder and datasource reads for the lifetime of
+                the client, writes through this client invalidate the affected
+                entries. Concurrent reads of the same dashboard share one
+                request, dashboard bodies are not kept
+            cache_dir: Optional directory for an on-disk cache of dashboards,
+                validated against the current dashboard version on every read
+            cache_max_bytes: Maximum size of the on-disk dashboard cache
+            log_body_limit: Number of body bytes included in debug logs
+            collect_metrics: Collect per-endpoint request metrics in
+                self.metrics
+            concurrency_limiter: Optional adaptive limit of the requests in
+                flight, use one limiter per client
+        """
         self.url = url
         self.api_key = api_key
         parsed_url = urlparse(url)
@@ -68,11 +204,11 @@ class GrafanaClient:
         self.username = username
         self.password = password
 
-        if api_key:
-            auth = (api_key, "")
-        elif username and password:
-            auth = (username, password)
-        else:
+        if auth_mode not in AUTH_MODES:
+            msg = f"Unsupported auth mode '{auth_mode}'"
+            raise ValueError(msg)
+
+        if not api_key and not (username and password):
             msg = "Either --api-key or both --username and --password must be provided (via parameters or URL)"
             raise ValueError(msg)
 
@@ -85,40 +221,148 @@ class GrafanaClient:
         if url_path_prefix:
             base_url = f"{base_url}/{url_path_prefix}"
 
-        # Create SSL context using environment variables or certifi
-        ssl_context = ssl.create_default_context(
-            cafile=os.getenv("REQUESTS_CA_BUNDLE")
-            or os.getenv("SSL_CERT_FILE")
-            or certifi.where(),
-            capath=os.getenv("SSL_CERT_DIR"),
+        auth: httpx.Auth | tuple[str, str]
+        if api_key:
+            auth = (api_key, "")
+        elif auth_mode == AUTH_MODE_SESSION:
+            auth = SessionAuth(base_url, username, password)
+        elif auth_mode == AUTH_MODE_TOKEN:
+            auth = ServiceAccountTokenAuth(base_url, username, password)
+        else:
+            auth = (username, password)
+
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as ex:
+                msg = (
+                    "h2 package is required for HTTP/2. "
+                    "Install it with: pip install 'grafana-sync[http2]'"
+                )
+                raise ImportError(msg) from ex
+
+        verify = ssl_context(
+            os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("SSL_CERT_FILE"),
+            os.getenv("SSL_CERT_DIR"),
+        )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
         )
+        read_limiter = TokenBucket(read_rate) if read_rate else None
+        write_limiter = TokenBucket(write_rate) if write_rate else None
+
+        def grafana_transport(proxy: str | None = None) -> GrafanaTransport:
+            # all transports share the limiters, so they apply to proxied
+            # requests as well
+            return GrafanaTransport(
+                httpx.AsyncHTTPTransport(
+                    proxy=proxy, verify=verify, http2=http2, limits=limits
+                ),
+                retry_policy=retry_policy or RetryPolicy(),
+                read_limiter=read_limiter,
+                write_limiter=write_limiter,
+                concurrency_limiter=concurrency_limiter,
+            )
+
+        self.transport = grafana_transport()
+        # httpx ignores the proxy environment variables when a transport is
+        # passed, so the proxies are mounted the same way httpx would do it
+        self.proxy_mounts = {
+            pattern: grafana_transport(proxy) if proxy else None
+            for pattern, proxy in get_environment_proxies().items()
+        }
 
+        self.hooks = RequestHooks(log_body_limit)
         self.client = httpx.AsyncClient(
             base_url=base_url,
             auth=auth,
             headers={"Content-Type": "application/json"},
             follow_redirects=True,
-            verify=ssl_context,
+            transport=self.transport,
+            mounts=self.proxy_mounts,
+            timeout=timeout,
+            event_hooks=self.hooks.event_hooks,
+        )
+        self.memo = RequestMemo() if memoize else None
+
+        self.metrics = (
+            ApiMetrics(concurrency=concurrency_limiter) if collect_metrics else None
+        )
+        if self.metrics is not None:
+            self.add_request_observer(self.metrics)
+
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.dashboard_cache = (
+            DashboardCache(
+                # keep the dashboards of different instances apart
+                Path(cache_dir) / hashlib.sha256(base_url.encode()).hexdigest()[:16],
+                cache_max_bytes,
+            )
+            if cache_dir
+            else None
         )
 
     async def __aenter__(self) -> Self:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if isinstance(self.client.auth, LoginAuth) and (
+            request := self.client.auth.cleanup_request()
+        ):
+            try:
+                response = await self.client.send(request, auth=None)
+                self._handle_error(response)
+            except Exception:
+                logger.warning("Failed to clean up authentication", exc_info=True)
+
+        stats = self.connection_stats()
+        logger.debug(
+            "%s: %d requests over %d connections (%d reused)",
+            self.url,
+            stats.requests,
+            stats.connections,
+            stats.reused,
+        )
         await self.client.aclose()
 
-    def _log_request(self, response: Response) -> None:
-        """Log request and response details at debug level."""
-        logger.debug(
-            "HTTP %s %s\nHeaders: %s\nRequest Body: %s\nResponse Status: %d\nResponse Body: %s",
-            response.request.method,
-            response.request.url,
-            response.request.headers,
-            response.request.content.decode() if response.request.content else "None",
-            response.status_code,
-            response.text,
+    def connection_stats(self) -> ConnectionStats:
+        """Get the number of requests sent and connections opened so far."""
+        transports = [self.transport, *filter(None, self.proxy_mounts.values())]
+        return ConnectionStats(
+            sum(t.stats.requests for t in transports),
+            sum(t.stats.connections for t in transports),
         )
 
+    def add_request_observer(self, observer: RequestObserver) -> None:
+        """Register a callback receiving a RequestRecord for every response."""
+        self.hooks.observers.append(observer)
+
+    async def _get_memoized(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[Response]] | None = None,
+        keep: bool = True,
+    ) -> Response:
+        """Send a GET request (or call fetch), served from the memo if enabled."""
+        if fetch is None:
+            fetch = partial(self.client.get, url)
+
+        if self.memo is None:
+            return await fetch()
+        return await self.memo.get(url, fetch, keep)
+
+    def _invalidate(self, *urls: str, prefix: str | None = None) -> None:
+        """Drop memoized responses affected by a write."""
+        if self.memo is None:
+            return
+        for url in urls:
+            self.memo.invalidate(url)
+        if prefix is not None:
+            self.memo.invalidate_prefix(prefix)
+
     def _handle_error(self, response: Response) -> None:
         """Handle error responses from Grafana API.
 
@@ -128,7 +372,6 @@ class GrafanaClient:
         Raises:
             GrafanaApiError: If the response indicates an error
         """
-        self._log_request(response)
         if response.is_error:
             raise GrafanaApiError(response)
 
@@ -148,15 +391,18 @@ class GrafanaClient:
         Raises:
             HTTPError: If the request fails
         """
-        data = {"title": title}
-        if uid:
-            data["uid"] = uid
-        if parent_uid:
-            data["parentUid"] = parent_uid
+        data = CreateFolderRequest(
+            title=title, uid=uid or None, parentUid=parent_uid or None
+        )
 
-        response = await self.client.post("/api/folders", json=data)
+        response = await self.client.post(
+            "/api/folders",
+            content=data.model_dump_json(exclude_none=True, by_alias=True),
+        )
         self._handle_error(response)
-        return CreateFolderResponse.model_validate_json(response.content)
+        folder = CreateFolderResponse.model_validate_json(response.content)
+        self._invalidate(f"/api/folders/{folder.uid}")
+        return folder
 
     async def delete_folder(self, uid: str) -> None:
         """Delete a folder in Grafana.
@@ -168,27 +414,70 @@ class GrafanaClient:
             HTTPError: If the request fails
         """
         response = await self.client.delete(f"/api/folders/{uid}")
+        # deleting a folder cascades to its subfolders and dashboards
+        self._invalidate(prefix="/api/folders/")
+        self._invalidate(prefix="/api/dashboards/uid/")
         self._handle_error(response)
 
-    async def get_folders(self, parent_uid: str | None = None) -> GetFoldersResponse:
-        """Get all folders in Grafana, optionally filtered by parent UID.
+    async def iter_folders(
+        self, parent_uid: str | None = None, page_size: int = FOLDERS_PAGE_SIZE
+    ) -> AsyncGenerator[GetFoldersResponseItem, None]:
+        """Iterate over folders in Grafana page by page.
+
+        Pages are requested lazily and parsed one at a time, iteration stops on
+        the first page with fewer than page_size items.
 
         Args:
             parent_uid: Optional parent folder UID to filter by
+            page_size: Number of folders requested per page
 
-        Returns:
-            GetFoldersResponse: List of folders
+        Yields:
+            GetFoldersResponseItem: The folders
 
         Raises:
             GrafanaApiError: If the request fails
         """
-        params = {}
+        params: dict = {"limit": page_size}
         if parent_uid and parent_uid != FOLDER_GENERAL:
             params["parentUid"] = parent_uid
 
-        response = await self.client.get("/api/folders", params=params)
-        self._handle_error(response)
-        return GetFoldersResponse.model_validate_json(response.content)
+        page = 1
+        while True:
+            params["page"] = page
+            response = await self.client.get("/api/folders", params=params)
+            self._handle_error(response)
+            folders = GetFoldersResponse.model_validate_json(response.content).root
+
+            for folder in folders:
+                yield folder
+
+            if len(folders) < page_size:
+                return
+            page += 1
+
+    async def get_folders(
+        self, parent_uid: str | None = None, page_size: int = FOLDERS_PAGE_SIZE
+    ) -> GetFoldersResponse:
+        """Get all folders in Grafana, optionally filtered by parent UID.
+
+        Args:
+            parent_uid: Optional parent folder UID to filter by
+            page_size: Number of folders requested per page
+
+        Returns:
+            GetFoldersResponse: List of folders
+
+        Raises:
+            GrafanaApiError: If the request fails
+        """
+        return GetFoldersResponse(
+            root=[
+                folder
+                async for folder in self.iter_folders(
+                    parent_uid=parent_uid, page_size=page_size
+                )
+            ]
+        )
 
     async def get_folder(self, uid: str) -> GetFolderResponse:
         """Get a specific folder by UID.
@@ -202,7 +491,7 @@ class GrafanaClient:
         Raises:
             GrafanaApiError: If the request fails or folder doesn't exist
         """
-        response = await self.client.get(f"/api/folders/{uid}")
+        response = await self._get_memoized(f"/api/folders/{uid}")
         self._handle_error(response)
         return GetFolderResponse.model_validate_json(response.content)
 
@@ -234,16 +523,18 @@ class GrafanaClient:
             msg = "version must be provided when overwrite=False"
             raise ValueError(msg)
 
-        data = {
-            "title": title,
-            "overwrite": overwrite,
-        }
-        if not overwrite:
-            data["version"] = version
-        if parent_uid:
-            data["parentUid"] = parent_uid
+        data = UpdateFolderRequest(
+            title=title,
+            overwrite=overwrite,
+            version=None if overwrite else version,
+            parentUid=parent_uid or None,
+        )
 
-        response = await self.client.put(f"/api/folders/{uid}", json=data)
+        response = await self.client.put(
+            f"/api/folders/{uid}",
+            content=data.model_dump_json(exclude_none=True, by_alias=True),
+        )
+        self._invalidate(f"/api/folders/{uid}")
         self._handle_error(response)
         return UpdateFolderResponse.model_validate_json(response.content)
 
@@ -261,33 +552,41 @@ class GrafanaClient:
             GrafanaApiError: If the request fails
         """
         # Update folder with new parent
+        data = MoveFolderRequest(parentUid=new_parent_uid)
+
         response = await self.client.post(
-            f"/api/folders/{uid}/move", json={"parentUid": new_parent_uid}
+            f"/api/folders/{uid}/move", content=data.model_dump_json(by_alias=True)
         )
+        self._invalidate(f"/api/folders/{uid}")
         self._handle_error(response)
 
-    async def search_dashboards(
+    async def iter_search_dashboards(
         self,
         folder_uids: list[str] | None = None,
         query: str | None = None,
         tag: list[str] | None = None,
         type_: str = "dash-db",
-    ) -> SearchDashboardsResponse:
-        """Search for dashboards in Grafana.
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> AsyncGenerator[SearchDashboardsResponseItem, None]:
+        """Iterate over dashboard search results page by page.
+
+        Pages are requested lazily and parsed one at a time, iteration stops on
+        the first page with fewer than page_size items.
 
         Args:
             folder_uids: Optional list of folder UIDs to search in
             query: Optional search query string
             tag: Optional list of tags to filter by
             type_: Type of dashboard to search for (default: dash-db)
+            page_size: Number of results requested per page
 
-        Returns:
-            SearchDashboardsResponse: List of matching dashboards
+        Yields:
+            SearchDashboardsResponseItem: The matching dashboards
 
         Raises:
             GrafanaApiError: If the request fails
         """
-        params: dict = {"type": type_}
+        params: dict = {"type": type_, "limit": page_size}
 
         if folder_uids:
             params["folderUIDs"] = ",".join(folder_uids)
@@ -296,9 +595,57 @@ class GrafanaClient:
         if tag:
             params["tag"] = tag
 
-        response = await self.client.get("/api/search", params=params)
-        self._handle_error(response)
-        return SearchDashboardsResponse.model_validate_json(response.content)
+        page = 1
+        while True:
+            params["page"] = page
+            response = await self.client.get("/api/search", params=params)
+            self._handle_error(response)
+            dashboards = SearchDashboardsResponse.model_validate_json(
+                response.content
+            ).root
+
+            for dashboard in dashboards:
+                yield dashboard
+
+            if len(dashboards) < page_size:
+                return
+            page += 1
+
+    async def search_dashboards(
+        self,
+        folder_uids: list[str] | None = None,
+        query: str | None = None,
+        tag: list[str] | None = None,
+        type_: str = "dash-db",
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> SearchDashboardsResponse:
+        """Search for dashboards in Grafana.
+
+        Args:
+            folder_uids: Optional list of folder UIDs to search in
+            query: Optional search query string
+            tag: Optional list of tags to filter by
+            type_: Type of dashboard to search for (default: dash-db)
+            page_size: Number of results requested per page
+
+        Returns:
+            SearchDashboardsResponse: List of matching dashboards
+
+        Raises:
+            GrafanaApiError: If the request fails
+        """
+        return SearchDashboardsResponse(
+            root=[
+                dashboard
+                async for dashboard in self.iter_search_dashboards(
+                    folder_uids=folder_uids,
+                    query=query,
+                    tag=tag,
+                    type_=type_,
+                    page_size=page_size,
+                )
+            ]
+        )
 
     async def update_dashboard(
         self, dashboard_data: DashboardData, folder_uid: str | None = None
@@ -325,8 +672,11 @@ class GrafanaClient:
 
         response = await self.client.post(
             "/api/dashboards/db",
-            json=payload.model_dump(exclude={"dashboard": {"id"}}, by_alias=True),
+            content=payload.model_dump_json(
+                exclude={"dashboard": {"id"}}, by_alias=True
+            ),
         )
+        self._invalidate(f"/api/dashboards/uid/{dashboard_data.uid}")
         self._handle_error(response)
         return UpdateDashboardResponse.model_validate_json(response.content)
 
@@ -340,6 +690,9 @@ class GrafanaClient:
             GrafanaApiError: If the request fails
         """
         response = await self.client.delete(f"/api/dashboards/uid/{uid}")
+        self._invalidate(f"/api/dashboards/uid/{uid}")
+        if self.dashboard_cache is not None:
+            self.dashboard_cache.discard(uid)
         self._handle_error(response)
 
     async def get_dashboard(self, uid: str) -> GetDashboardResponse:
@@ -354,12 +707,129 @@ class GrafanaClient:
         Raises:
             GrafanaApiError: If the request fails or dashboard doesn't exist
         """
-        response = await self.client.get(f"/api/dashboards/uid/{uid}")
+        response = await self._get_dashboard_response(uid)
         self._handle_error(response)
         return GetDashboardResponse.model_validate_json(response.content)
 
+    async def get_dashboard_meta(self, uid: str) -> GetDashboardMetaResponse:
+        """Get the meta information and top-level fields of a dashboard.
+
+        Only uid, title and version of the dashboard are parsed, so this is much
+        cheaper than get_dashboard for large dashboards. Both share the memo and
+        the on-disk cache.
+
+        Args:
+            uid: The unique identifier of the dashboard
+
+        Returns:
+            GetDashboardMetaResponse: The dashboard summary and meta information
+
+        Raises:
+            GrafanaApiError: If the request fails or dashboard doesn't exist
+        """
+        response = await self._get_dashboard_response(uid)
+        self._handle_error(response)
+        return GetDashboardMetaResponse.model_validate_json(response.content)
+
+    async def get_dashboards(
+        self, uids: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> AsyncGenerator[tuple[str, GetDashboardResponse | Exception], None]:
+        """Get many dashboards with bounded concurrency.
+
+        Dashboards are yielded in completion order. A failed request does not
+        abort the others, its exception is yielded in place of the dashboard.
+
+        Args:
+            uids: The unique identifiers of the dashboards
+            concurrency: Maximum number of requests in flight
+
+        Yields:
+            Tuples of dashboard UID and GetDashboardResponse or exception
+        """
+        async for uid, result in map_as_completed(
+            uids, self.get_dashboard, concurrency
+        ):
+            yield uid, result
+
+    async def _get_dashboard_response(self, uid: str) -> Response:
+        # dashboards are large and usually read once, so only concurrent
+        # reads are coalesced
+        return await self._get_memoized(
+            f"/api/dashboards/uid/{uid}",
+            lambda: self._fetch_dashboard(uid),
+            keep=False,
+        )
+
+    async def _fetch_dashboard(self, uid: str) -> Response:
+        """Fetch a dashboard, served from the on-disk cache if it is unchanged."""
+        url = f"/api/dashboards/uid/{uid}"
+        cache = self.dashboard_cache
+
+        if cache is not None and cache.version(uid) is not None:
+            try:
+                latest = await self.get_latest_dashboard_version(uid)
+            except GrafanaApiError:
+                latest = None
+
+            if latest is not None and (
+                content := cache.get(uid, latest.version, latest.created)
+            ):
+                logger.debug("serving dashboard %s v%d from cache", uid, latest.version)
+                return Response(
+                    200, content=content, request=self.client.build_request("GET", url)
+                )
+
+        response = await self.client.get(url)
+        if cache is not None:
+            if response.is_success:
+                cache.put(uid, response.content)
+            elif response.status_code == 404:
+                cache.discard(uid)
+        return response
+
+    async def get_dashboard_version(self, uid: str) -> int:
+        """Get the current version of a dashboard without fetching its body.
+
+        Args:
+            uid: The unique identifier of the dashboard
+
+        Returns:
+            int: The latest version number of the dashboard
+
+        Raises:
+            GrafanaApiError: If the request fails or dashboard doesn't exist
+        """
+        return (await self.get_latest_dashboard_version(uid)).version
+
+    async def get_latest_dashboard_version(self, uid: str) -> DashboardVersion:
+        """Get the latest version of a dashboard without fetching its body.
+
+        Args:
+            uid: The unique identifier of the dashboard
+
+        Returns:
+            DashboardVersion: The number and creation time of the latest version
+
+        Raises:
+            GrafanaApiError: If the request fails or dashboard doesn't exist
+        """
+        response = await self.client.get(
+            f"/api/dashboards/uid/{uid}/versions", params={"limit": 1}
+        )
+        self._handle_error(response)
+
+        # Grafana < 11 returns a plain list of versions
+        content = response.content
+        if content.lstrip().startswith(b"["):
+            content = b'{"versions":' + content + b"}"
+
+        versions = GetDashboardVersionsResponse.model_validate_json(content).versions
+        if not versions:
+            raise GrafanaApiError(response, f"Dashboard {uid} has no versions")
+        return versions[0]
+
     async def get_datasources(self) -> GetDatasourcesResponse:
-        response = await self.client.get("/api/datasources")
+        response = await self._get_memoized("/api/datasources")
         self._handle_error(response)
         return GetDatasourcesResponse.model_validate_json(response.content)
 
@@ -367,14 +837,16 @@ class GrafanaClient:
         self, ds: DatasourceDefinition
     ) -> CreateDatasourceResponse:
         response = await self.client.post(
-            "/api/datasources", json=ds.model_dump(by_alias=True)
+            "/api/datasources", content=ds.model_dump_json(by_alias=True)
         )
+        self._invalidate("/api/datasources")
         self._handle_error(response)
         return CreateDatasourceResponse.model_validate_json(response.content)
 
     async def delete_datasource(self, uid: str) -> None:
         """Delete a datasource in Grafana."""
         response = await self.client.delete(f"/api/datasources/uid/{uid}")
+        self._invalidate("/api/datasources")
         self._handle_error(response)
 
     async def get_reports(self) -> GetReportsResponse:
@@ -419,7 +891,8 @@ class GrafanaClient:
             GrafanaApiError: If the request fails
         """
         response = await self.client.post(
-            "/api/reports", json=report.model_dump(exclude={"id"}, by_alias=True)
+            "/api/reports",
+            content=report.model_dump_json(exclude={"id"}, by_alias=True),
         )
         self._handle_error(response)
         return CreateReportResponse.model_validate_json(response.content)
@@ -436,64 +909,264 @@ class GrafanaClient:
         response = await self.client.delete(f"/api/reports/{report_id}")
         self._handle_error(response)
 
-    async def logout_all_users(self, skip_username: str | None = None) -> None:
+    async def iter_user_pages(
+        self, page_size: int = USERS_PAGE_SIZE
+    ) -> AsyncGenerator[SearchUsersResponse, None]:
+        """Iterate over all users of the instance page by page.
+
+        Requires server admin privileges. Pages are requested lazily,
+        iteration stops after the page reaching the total user count.
+
+        Args:
+            page_size: Number of users requested per page
+
+        Yields:
+            SearchUsersResponse: The pages of users
+
+        Raises:
+            GrafanaApiError: If the request fails
+        """
+        page = 1
+        seen = 0
+        while True:
+            response = await self.client.get(
+                "/api/users/search", params={"perpage": page_size, "page": page}
+            )
+            self._handle_error(response)
+            result = SearchUsersResponse.model_validate_json(response.content)
+            yield result
+
+            seen += len(result.users)
+            if not result.users or seen >= result.total_count:
+                return
+            page += 1
+
+    async def logout_all_users(
+        self,
+        skip_username: str | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        checkpoint: Checkpoint | None = None,
+        progress: Callable[[LogoutResult], None] | None = None,
+        raise_on_error: bool = True,
+    ) -> LogoutResult:
         """Logout all users from Grafana by invalidating their sessions.
 
-        This fetches all users and logs each one out individually.
+        Users are fetched page by page and each page is logged out with
+        bounded concurrency, subject to the rate limits of the client. A failed
+        logout does not abort the others.
 
         Args:
             skip_username: Optional username to skip (e.g. current user)
+            concurrency: Maximum number of logouts in flight
+            checkpoint: Optional checkpoint of already logged out user ids,
+                these users are skipped and new ones are added to it
+            progress: Optional callback invoked after every processed user
+            raise_on_error: Raise the first error after all users have been
+                processed, otherwise failures are only part of the result
+
+        Returns:
+            LogoutResult: The number of logged out and skipped users and the
+                failures by username
 
         Raises:
             GrafanaApiError: If the request fails or user doesn't have admin privileges
         """
-        # Get all users
-        response = await self.client.get("/api/users")
-        self._handle_error(response)
-        users = response.json()
-
-        # Logout each user individually
-        for user in users:
-            if skip_username and user["login"] == skip_username:
-                continue
-            user_id = user["id"]
-            response = await self.client.post(f"/api/admin/users/{user_id}/logout")
+        result = LogoutResult()
+
+        async def logout(user: SearchUsersResponseItem) -> None:
+            response = await self.client.post(f"/api/admin/users/{user.id}/logout")
             self._handle_error(response)
 
+        with tracing.span("logout users"):
+            async for page in self.iter_user_pages():
+                result.total = page.total_count
+                users = []
+                for user in page.users:
+                    if (skip_username and user.login == skip_username) or (
+                        checkpoint is not None and str(user.id) in checkpoint
+                    ):
+                        result.skipped += 1
+                    else:
+                        users.append(user)
+                if progress is not None:
+                    progress(result)
+
+                async for user, outcome in map_as_completed(users, logout, concurrency):
+                    if isinstance(outcome, Exception):
+                        logger.warning("Failed to logout %s: %s", user.login, outcome)
+                        result.failed[user.login] = outcome
+                    else:
+                        result.logged_out += 1
+                        if checkpoint is not None:
+                            checkpoint.add(str(user.id))
+                    if progress is not None:
+                        progress(result)
+
+        logger.info(
+            "logged out %d users, skipped %d, %d failed",
+            result.logged_out,
+            result.skipped,
+            len(result.failed),
+        )
+
+        if raise_on_error and result.failed:
+            raise next(iter(result.failed.values()))
+        return result
+
+    async def get_dashboard_inventory(
+        self,
+    ) -> dict[str, list[SearchDashboardsResponseItem]]:
+        """Get all dashboards of the instance bucketed by their folder UID.
+
+        The dashboards are fetched with a paged search over the whole instance
+        instead of one search per folder. Dashboards in the top-level directory
+        are bucketed under FOLDER_GENERAL.
+
+        Returns:
+            Mapping of folder UID to the dashboards in that folder
+
+        Raises:
+            GrafanaApiError: If the request fails
+        """
+        inventory: dict[str, list[SearchDashboardsResponseItem]] = defaultdict(list)
+
+        with tracing.span("dashboard inventory", cat="walk"):
+            async for dashboard in self.iter_search_dashboards(type_="dash-db"):
+                inventory[dashboard.folder_uid or FOLDER_GENERAL].append(dashboard)
+
+        return inventory
+
+    async def _walk_folder(
+        self,
+        folder_uid: str,
+        include_dashboards: bool,
+        inventory: Mapping[str, list[SearchDashboardsResponseItem]] | None = None,
+    ) -> tuple[str, GetFoldersResponse, SearchDashboardsResponse]:
+        """Fetch the subfolders and optionally the dashboards of a single folder."""
+        with tracing.span("walk folder", cat="walk", uid=folder_uid):
+            logger.debug("fetching folders for folder_uid %s", folder_uid)
+            subfolders = await self.get_folders(parent_uid=folder_uid)
+
+            if include_dashboards and inventory is not None:
+                dashboards = SearchDashboardsResponse(
+                    root=inventory.get(folder_uid, [])
+                )
+            elif include_dashboards:
+                logger.debug("searching dashboards for folder_uid %s", folder_uid)
+                dashboards = await self.search_dashboards(
+                    folder_uids=[folder_uid],
+                    type_="dash-db",
+                )
+            else:
+                dashboards = SearchDashboardsResponse(root=[])
+
+        return folder_uid, subfolders, dashboards
+
+    async def _walk_sequential(
+        self,
+        folder_uid: str,
+        recursive: bool,
+        include_dashboards: bool,
+        inventory: Mapping[str, list[SearchDashboardsResponseItem]] | None,
+    ) -> AsyncGenerator[tuple[str, GetFoldersResponse, SearchDashboardsResponse], None]:
+        res = await self._walk_folder(folder_uid, include_dashboards, inventory)
+        yield res
+
+        if recursive:
+            for folder in res[1].root:
+                async for sub_res in self._walk_sequential(
+                    folder.uid, recursive, include_dashboards, inventory
+                ):
+                    yield sub_res
+
     async def walk(
         self,
         folder_uid: str = FOLDER_GENERAL,
         recursive: bool = False,
         include_dashboards: bool = True,
+        *,
+        max_concurrency: int = 1,
+        ordered: bool = False,
+        inventory: bool = False,
     ) -> AsyncGenerator[tuple[str, GetFoldersResponse, SearchDashboardsResponse], None]:
         """Walk through Grafana folder structure, similar to os.walk.
 
+        With ``max_concurrency > 1`` the folder tree is walked breadth-first by a
+        pool of concurrent fetches and results are yielded as each folder
+        finishes. A folder is always yielded before any of its subfolders.
+
         Args:
             folder_uid: The folder UID to start walking from (default: "general")
             recursive: Whether to recursively walk through subfolders
             include_dashboards: Whether to include dashboards in the results
+            max_concurrency: Maximum number of folders fetched concurrently
+            ordered: Yield in the same depth-first order as a sequential walk
+                instead of completion order (only relevant for concurrent walks)
+            inventory: Fetch all dashboards upfront with a paged search (see
+                get_dashboard_inventory) instead of searching every folder
 
         Yields:
             Tuple of (folder_uid, subfolders, dashboards)
         """
-        logger.debug("fetching folders for folder_uid %s", folder_uid)
-        subfolders = await self.get_folders(parent_uid=folder_uid)
-
-        if include_dashboards:
-            logger.debug("searching dashboards for folder_uid %s", folder_uid)
-            dashboards = await self.search_dashboards(
-                folder_uids=[folder_uid],
-                type_="dash-db",
-            )
-        else:
-            dashboards = SearchDashboardsResponse(root=[])
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
 
-        yield folder_uid, subfolders, dashboards
+        dashboard_inventory = (
+            await self.get_dashboard_inventory()
+            if include_dashboards and inventory
+            else None
+        )
 
-        if recursive:
-            for folder in subfolders.root:
-                async for res in self.walk(folder.uid, recursive, include_dashboards):
-                    yield res
+        if max_concurrency == 1 or not recursive:
+            async for res in self._walk_sequential(
+                folder_uid, recursive, include_dashboards, dashboard_inventory
+            ):
+                yield res
+            return
+
+        queue: deque[str] = deque([folder_uid])
+        pending: set[asyncio.Task] = set()
+        # results buffered until their turn when ordered output is requested
+        finished: dict[
+            str, tuple[str, GetFoldersResponse, SearchDashboardsResponse]
+        ] = {}
+        emit_stack = [folder_uid]
+
+        try:
+            while queue or pending:
+                while queue and len(pending) < max_concurrency:
+                    pending.add(
+                        asyncio.create_task(
+                            self._walk_folder(
+                                queue.popleft(), include_dashboards, dashboard_inventory
+                            )
+                        )
+                    )
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    res = task.result()
+                    queue.extend(folder.uid for folder in res[1].root)
+
+                    if not ordered:
+                        yield res
+                        continue
+
+                    finished[res[0]] = res
+                    while emit_stack and emit_stack[-1] in finished:
+                        next_res = finished.pop(emit_stack.pop())
+                        emit_stack.extend(
+                            folder.uid for folder in reversed(next_res[1].root)
+                        )
+                        yield next_res
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def generate_test_data(
         self,
@@ -501,85 +1174,143 @@ class GrafanaClient:
         max_subfolders: int = 3,
         max_depth: int = 2,
         max_dashboards: int = 3,
+        *,
+        seed: int = 0,
+        max_panels: int = 12,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
-        """Generate random test folders and dashboards.
+        """Generate deterministic test folders and dashboards.
 
         Args:
             num_folders: Number of top-level folders to create
             max_subfolders: Maximum number of subfolders per folder
             max_depth: Maximum folder nesting depth
             max_dashboards: Maximum number of dashboards per folder
+            seed: Seed of the generated data
+            max_panels: Maximum number of panels per dashboard
+            concurrency: Maximum number of requests in flight
         """
-        from faker import Faker
-
-        fake = Faker()
-
-        async def create_folder_tree(depth: int, parent_uid: str | None = None) -> None:
-            if depth > max_depth:
-                return
-
-            # Create random number of folders at this level
-            num_subfolders = random.randint(0, max_subfolders)
-            for _ in range(num_subfolders):
-                title = fake.unique.company()
-                folder = await self.create_folder(title=title, parent_uid=parent_uid)
-
-                # Create random dashboards in this folder
-                num_dash = random.randint(0, max_dashboards)
-                for _ in range(num_dash):
-                    dash_title = fake.catch_phrase()
-                    dashboard = {
-                        "uid": fake.unique.uuid4(),
-                        "title": dash_title,
-                        "tags": [fake.word() for _ in range(random.randint(0, 3))],
-                        "timezone": "browser",
-                        "panels": [],
-                        "version": 1,
-                    }
-                    await self.update_dashboard(
-                        DashboardData.model_validate(dashboard), folder_uid=folder.uid
-                    )
-
-                # Recursively create subfolders
-                await create_folder_tree(depth + 1, folder.uid)
-
-        # Create top-level folders
-        for _ in range(num_folders):
-            await create_folder_tree(0, None)
+        from grafana_sync.generate import TestDataGenerator
+
+        generator = TestDataGenerator(
+            seed,
+            num_folders=num_folders,
+            max_subfolders=max_subfolders,
+            max_depth=max_depth,
+            max_dashboards=max_dashboards,
+            max_panels=max_panels,
+        )
+        await generator.upload(self, concurrency)
 
     async def check_pristine(self) -> None:
-        datasources = (await self.get_datasources()).root
-        if len(datasources) > 0:
-            raise ExistingDatasourcesError(len(datasources))
+        """Check that the instance has no datasources, folders or dashboards.
 
-        folders = (await self.get_folders()).root
-        if len(folders) > 0:
-            raise ExistingFoldersError(len(folders))
+        The probes run concurrently and request a single item where the API
+        allows it, the first probe finding content aborts the others.
+
+        Raises:
+            GrafanaNotPristineError: If the instance has any content
+            GrafanaApiError: If a request fails
+        """
 
-        # Check for dashboards in the general folder
-        dashboards = (await self.search_dashboards()).root
-        if len(dashboards) > 0:
-            raise ExistingDashboardsError(len(dashboards))
+        async def probe_datasources() -> None:
+            # the datasources API is not paged
+            response = await self.client.get("/api/datasources")
+            self._handle_error(response)
+            datasources = GetDatasourcesResponse.model_validate_json(
+                response.content
+            ).root
+            if len(datasources) > 0:
+                raise ExistingDatasourcesError(len(datasources))
+
+        async def probe_folders() -> None:
+            response = await self.client.get(
+                "/api/folders", params={"limit": 1, "page": 1}
+            )
+            self._handle_error(response)
+            if GetFoldersResponse.model_validate_json(response.content).root:
+                raise ExistingFoldersError
 
-    async def delete_all_folders_and_dashboards_and_datasources(self) -> None:
+        async def probe_dashboards() -> None:
+            response = await self.client.get(
+                "/api/search", params={"type": "dash-db", "limit": 1}
+            )
+            self._handle_error(response)
+            if SearchDashboardsResponse.model_validate_json(response.content).root:
+                raise ExistingDashboardsError
+
+        probes = [
+            asyncio.ensure_future(probe())
+            for probe in (probe_datasources, probe_folders, probe_dashboards)
+        ]
+        try:
+            done, _ = await asyncio.wait(probes, return_when=asyncio.FIRST_EXCEPTION)
+            for probe in probes:
+                if probe in done and probe.exception() is not None:
+                    raise probe.exception()
+        finally:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
+
+    async def delete_all_folders_and_dashboards_and_datasources(
+        self, *, cascade: bool = False, concurrency: int = 1
+    ) -> None:
         """Delete all dashboards, folders and datasources in the Grafana instance.
 
         Dashboards are deleted first, then folders, since folders cannot be deleted
         while containing dashboards. Then datasources are deleted.
+
+        In cascade mode only the top-level folders are deleted, the server
+        deletes their subfolders and dashboards with them. Afterwards the
+        remaining dashboards of the General folder are deleted.
+
+        Args:
+            cascade: Rely on the server-side cascade of folder deletes
+            concurrency: Maximum number of deletes in flight
+
+        Raises:
+            GrafanaApiError: If a delete fails, after all deletes of the stage
+                have been attempted
         """
-        # First delete all dashboards
-        dashboards = (await self.search_dashboards()).root
-        for dashboard in dashboards:
-            logger.debug("Deleting dashboard %s", dashboard.uid)
-            await self.delete_dashboard(dashboard.uid)
-
-        # Then delete all folders
-        folders = (await self.get_folders()).root
-        for folder in folders:
-            logger.debug("Deleting folder %s", folder.uid)
-            await self.delete_folder(folder.uid)
+        if cascade:
+            folders = (await self.get_folders()).root
+            await self._delete_all(
+                [f.uid for f in folders], self.delete_folder, concurrency
+            )
+
+            dashboards = [d async for d in self.iter_search_dashboards(type_="dash-db")]
+            await self._delete_all(
+                [d.uid for d in dashboards], self.delete_dashboard, concurrency
+            )
+        else:
+            # First delete all dashboards
+            dashboards = (await self.search_dashboards()).root
+            await self._delete_all(
+                [d.uid for d in dashboards], self.delete_dashboard, concurrency
+            )
+
+            # Then delete all folders
+            folders = (await self.get_folders()).root
+            await self._delete_all(
+                [f.uid for f in folders], self.delete_folder, concurrency
+            )
 
         datasources = (await self.get_datasources()).root
-        for ds in datasources:
-            logger.debug("Deleting datasource %s", ds.uid)
-            await self.delete_datasource(ds.uid)
+        await self._delete_all(
+            [ds.uid for ds in datasources], self.delete_datasource, concurrency
+        )
+
+    async def _delete_all(
+        self,
+        uids: list[str],
+        delete: Callable[[str], Awaitable[None]],
+        concurrency: int,
+    ) -> None:
+        """Run delete for all uids, raising the first error at the end."""
+
+        def already_deleted(ex: Exception) -> bool:
+            # e.g. removed by a cascade
+            return isinstance(ex, GrafanaApiError) and ex.status_code == 404
+
+        await run_all(uids, delete, concurrency, ignore=already_deleted)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# default number of body bytes included in debug logs
+DEFAULT_LOG_BODY_LIMIT = 4096
+
+# request extension holding the time the request was handed to the client
+STARTED_EXTENSION = "grafana_sync.started"
+
+# path prefixes whose identifier segment is replaced to group requests
+ENDPOINT_PATTERNS = [
+    (re.compile(pattern), template)
+    for pattern, template in [
+        (r"^/api/dashboards/uid/[^/]+", "/api/dashboards/uid/{uid}"),
+        (r"^/api/datasources/uid/[^/]+", "/api/datasources/uid/{uid}"),
+        (r"^/api/folders/[^/]+", "/api/folders/{uid}"),
+        (r"^/api/reports/\d+", "/api/reports/{id}"),
+        (r"^/api/serviceaccounts/\d+", "/api/serviceaccounts/{id}"),
+        (r"^/api/admin/users/\d+", "/api/admin/users/{id}"),
+        (r"^/api/users/\d+", "/api/users/{id}"),
+    ]
+]
+
+
+def endpoint_template(path: str) -> str:
+    """Get the endpoint of a request path with identifiers replaced.
+
+    >>> endpoint_template("/api/folders/abc/move")
+    '/api/folders/{uid}/move'
+    """
+    for pattern, template in ENDPOINT_PATTERNS:
+        endpoint, count = pattern.subn(template, path, count=1)
+        if count:
+            return endpoint
+    return path
+
+
+def truncate_body(content: bytes, limit: int) -> str:
+    """Decode at most limit bytes of a body for logging."""
+    if not content:
+        return "None"
+    text = content[:limit].decode(errors="replace")
+    if len(content) > limit:
+        text += f"... ({len(content)} bytes)"
+    return text
+
+
+class RequestRecord(NamedTuple):
+    """Timing and size of a single HTTP request."""
+
+    method: str
+    endpoint: str
+    status_code: int
+    started: float  # time.perf_counter() when the request was sent
+    elapsed: float  # seconds, including retries and rate limiting
+    bytes_sent: int
+    bytes_received: int
+    task: str | None
+
+
+RequestObserver = Callable[[RequestRecord], None]
+
+
+class RequestHooks:
+    """httpx event hooks for debug logging and request instrumentation.
+
+    Bodies are only decoded when debug logging is enabled and are truncated to
+    log_body_limit bytes. Observers receive a RequestRecord for every
+    response. Without observers and debug logging the hooks do no work.
+    """
+
+    def __init__(self, log_body_limit: int = DEFAULT_LOG_BODY_LIMIT) -> None:
+        self.log_body_limit = log_body_limit
+        self.observers: list[RequestObserver] = []
+
+    @property
+    def event_hooks(self) -> dict[str, list]:
+        return {"request": [self.on_request], "response": [self.on_response]}
+
+    async def on_request(self, request: httpx.Request) -> None:
+        request.extensions = {
+            **request.extensions,
+            STARTED_EXTENSION: time.perf_counter(),
+        }
+
+    async def on_response(self, response: httpx.Response) -> None:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if not debug and not self.observers:
+            return
+
+        # the response is read by the client anyway, reading it here makes the
+        # body and the elapsed time available
+        await response.aread()
+        request = response.request
+
+        if debug:
+            logger.debug(
+                "HTTP %s %s\nHeaders: %s\nRequest Body: %s\nResponse Status: %d\nResponse Body: %s",
+                request.method,
+                request.url,
+                request.headers,
+                truncate_body(request.content, self.log_body_limit),
+                response.status_code,
+                truncate_body(response.content, self.log_body_limit),
+            )
+
+        if not self.observers:
+            return
+
+        now = time.perf_counter()
+        started = request.extensions.get(STARTED_EXTENSION, now)
+        task = asyncio.current_task()
+        record = RequestRecord(
+            method=request.method,
+            endpoint=endpoint_template(request.url.path),
+            status_code=response.status_code,
+            started=started,
+            elapsed=now - started,
+            bytes_sent=len(request.content),
+            # responses created without a stream (e.g. in tests) are not counted
+            bytes_received=response.num_bytes_downloaded or len(response.content),
+            task=task.get_name() if task is not None else None,
+        )
+        for observer in self.observers:
+            observer(record)
@@ -0,0 +1,70 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from httpx import Response
+
+
+class RequestMemo:
+    """Per-client memo of read responses with single-flight coalescing.
+
+    Concurrent reads of the same key share one in-flight request. Successful
+    responses and 404s (negative cache) are kept until invalidated, other
+    errors are only shared with the requests already waiting for them.
+    Responses read with keep=False are only shared while in flight.
+
+    Responses are cached instead of parsed models, so every caller validates
+    its own model and may modify it freely.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, asyncio.Task[Response]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Response]],
+        keep: bool = True,
+    ) -> Response:
+        """Get the response for key, calling fetch if it is not memoized yet.
+
+        With keep=False, the response is forgotten as soon as it arrives, so
+        only concurrent reads share it.
+        """
+        task = self._entries.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._entries[key] = task
+            task.add_done_callback(
+                (lambda t: self._discard(key, t))
+                if keep
+                else (lambda t: self._discard(key, t, always=True))
+            )
+        else:
+            self.hits += 1
+
+        # shield the shared fetch from the cancellation of a single caller
+        return await asyncio.shield(task)
+
+    def _discard(
+        self, key: str, task: asyncio.Task[Response], always: bool = False
+    ) -> None:
+        """Drop a finished entry unless it is a response worth keeping."""
+        if (
+            always
+            or task.cancelled()
+            or task.exception() is not None
+            or (task.result().is_error and task.result().status_code != 404)
+        ) and self._entries.get(key) is task:
+            del self._entries[key]
+
+    def invalidate(self, key: str) -> None:
+        """Forget the response memoized for key."""
+        self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Forget all responses memoized for keys starting with prefix."""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
@@ -0,0 +1,104 @@
+import math
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from grafana_sync.api.instrumentation import RequestRecord
+
+if TYPE_CHECKING:
+    from grafana_sync.api.transport import AdaptiveLimiter
+
+# latency percentiles included in the summary
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Get the p-th percentile of sorted values (nearest rank)."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class EndpointMetrics:
+    """Counters of the requests sent to a single endpoint."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.status_codes: Counter[int] = Counter()
+        self.latencies: list[float] = []
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def add(self, record: RequestRecord) -> None:
+        self.count += 1
+        self.status_codes[record.status_code] += 1
+        self.latencies.append(record.elapsed)
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.latencies)
+
+    def latency_percentiles(self) -> dict[int, float]:
+        """Get the latency percentiles in seconds."""
+        latencies = sorted(self.latencies)
+        return {p: percentile(latencies, p) for p in PERCENTILES}
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "status_codes": {
+                str(code): n for code, n in sorted(self.status_codes.items())
+            },
+            "total_time": self.total_time,
+            "latency": {
+                f"p{p}": value for p, value in self.latency_percentiles().items()
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class ApiMetrics:
+    """Per-endpoint request metrics, fed by RequestRecord observations.
+
+    Instances are request observers, see GrafanaClient.add_request_observer.
+    Endpoints are keyed by method and path template, e.g.
+    ``GET /api/dashboards/uid/{uid}``. The state of the adaptive concurrency
+    limiter of the client is included if there is one.
+    """
+
+    def __init__(self, concurrency: "AdaptiveLimiter | None" = None) -> None:
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.concurrency = concurrency
+
+    def __call__(self, record: RequestRecord) -> None:
+        key = f"{record.method} {record.endpoint}"
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints[key] = EndpointMetrics()
+        metrics.add(record)
+
+    def total(self) -> EndpointMetrics:
+        """Get the metrics of all endpoints combined."""
+        total = EndpointMetrics()
+        for metrics in self.endpoints.values():
+            total.count += metrics.count
+            total.status_codes.update(metrics.status_codes)
+            total.latencies.extend(metrics.latencies)
+            total.bytes_sent += metrics.bytes_sent
+            total.bytes_received += metrics.bytes_received
+        return total
+
+    def to_dict(self) -> dict:
+        data = {
+            "endpoints": {
+                key: metrics.to_dict()
+                for key, metrics in sorted(self.endpoints.items())
+            },
+            "total": self.total().to_dict(),
+        }
+        if self.concurrency is not None:
+            data["concurrency"] = self.concurrency.to_dict()
+        return data
@@ -7,6 +7,14 @@ from pydantic import BaseModel, ConfigDict, Field, RootModel
 from grafana_sync.dashboards.models import DashboardData, DSRef
 
 
+class CreateFolderRequest(BaseModel):
+    """Request model for folder creation API."""
+
+    title: str
+    uid: str | None = None
+    parent_uid: str | None = Field(alias="parentUid", default=None)
+
+
 class CreateFolderResponse(BaseModel):
     """Response model for folder creation API."""
 
@@ -126,6 +134,53 @@ class GetDashboardResponse(BaseModel):
     meta: DashboardMeta
 
 
+class DashboardSummary(BaseModel):
+    """Top-level dashboard fields, the panel tree is skipped while parsing."""
+
+    uid: str
+    title: str
+    version: int | None = None
+
+
+class GetDashboardMetaResponse(BaseModel):
+    """Response model for dashboard get API without the dashboard body."""
+
+    dashboard: DashboardSummary
+    meta: DashboardMeta
+
+
+# maximum difference in seconds between the update time of a dashboard and
+# the creation time of its latest version, both are set by the same save but
+# stored with a resolution of one second
+VERSION_CREATED_TOLERANCE = 1
+
+
+class DashboardVersion(BaseModel):
+    """Model for individual items in dashboard versions response."""
+
+    version: int
+    created: datetime.datetime
+
+    model_config = ConfigDict(extra="allow")
+
+    def saved_at(self, updated: datetime.datetime) -> bool:
+        """Check if this version was saved at the update time of a dashboard.
+
+        A dashboard deleted and created again restarts its version numbering,
+        its versions are then saved at other times than the old dashboard.
+        """
+        return (
+            abs((self.created - updated).total_seconds()) <= VERSION_CREATED_TOLERANCE
+        )
+
+
+class GetDashboardVersionsResponse(BaseModel):
+    """Response model for dashboard versions API."""
+
+    versions: list[DashboardVersion]
+    continue_token: str | None = Field(alias="continueToken", default=None)
+
+
 class GetReportResponse(BaseModel):
     """Response model for single report API."""
 
@@ -146,6 +201,21 @@ class GetReportsResponse(RootModel):
     root: list[GetReportResponse]
 
 
+class UpdateFolderRequest(BaseModel):
+    """Request model for folder update API."""
+
+    title: str
+    overwrite: bool
+    version: int | None = None
+    parent_uid: str | None = Field(alias="parentUid", default=None)
+
+
+class MoveFolderRequest(BaseModel):
+    """Request model for folder move API, a null parent moves to the root."""
+
+    parent_uid: str | None = Field(alias="parentUid")
+
+
 class UpdateFolderResponse(BaseModel):
     """Response model for folder update API."""
 
@@ -154,3 +224,21 @@ class UpdateFolderResponse(BaseModel):
     url: str
     version: int
     parent_uid: str | None = Field(alias="parentUid", default=None)
+
+
+class SearchUsersResponseItem(BaseModel):
+    """Response model for a user of the user search API."""
+
+    id: int
+    login: str
+
+    model_config = ConfigDict(extra="allow")
+
+
+class SearchUsersResponse(BaseModel):
+    """Response model for a page of the user search API."""
+
+    total_count: int = Field(alias="totalCount")
+    users: list[SearchUsersResponseItem]
+    page: int
+    per_page: int = Field(alias="perPage")
@@ -0,0 +1,427 @@
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import NamedTuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# methods which do not modify server state, throttled by the read budget
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# methods which can be safely repeated after a server error
+IDEMPOTENT_METHODS = READ_METHODS | {"PUT", "DELETE"}
+
+# status codes indicating a transient server condition
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# default bounds of the adaptive concurrency limit
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+class RetryPolicy:
+    """Exponential backoff policy for transient Grafana API errors.
+
+    Idempotent requests are retried on 5xx responses and transport errors,
+    all requests are retried on 429 since the server did not process them.
+    A Retry-After header takes precedence over the computed backoff.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+    ) -> None:
+        if max_retries < 0:
+            msg = "max_retries must not be negative"
+            raise ValueError(msg)
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def should_retry(self, method: str, status_code: int | None) -> bool:
+        """Check if a request may be repeated.
+
+        Args:
+            method: The HTTP method of the request
+            status_code: The response status, or None for a transport error
+        """
+        if status_code == 429:
+            return True
+
+        if method not in IDEMPOTENT_METHODS:
+            return False
+
+        return status_code is None or status_code in RETRY_STATUS_CODES
+
+    def backoff(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Get the delay in seconds before the given retry attempt (1-based)."""
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            # "full jitter" spreads retries of concurrent requests apart
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse the Retry-After header (seconds or HTTP date) of a response."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``burst``.
+    Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class LimiterSlot(NamedTuple):
+    """A slot acquired from an AdaptiveLimiter, to be passed to release."""
+
+    started: float  # time.monotonic() when the slot was acquired
+    saturations: int  # AdaptiveLimiter.saturations before the slot was acquired
+
+
+class AdaptiveLimiter:
+    """Adaptive concurrency limit using additive increase, multiplicative decrease.
+
+    The limit grows by one for every ``limit`` successful requests that were
+    in flight while the window was full, i.e. about once per round trip of a
+    full window. A run that never fills the window does not raise the limit
+    to a concurrency it has not tried. On a 429, a 5xx, a transport error
+    or a latency spike it is multiplied by ``backoff``. A latency spike is a
+    request slower than ``latency_tolerance`` times the moving average
+    latency and at least ``min_spike`` seconds above it. Requests started
+    before the last decrease do not decrease it again, so one overload burst
+    only halves the limit once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_spike: float = 0.05,
+        smoothing: float = 0.1,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = "limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            raise ValueError(msg)
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.min_spike = min_spike
+        self.smoothing = smoothing
+
+        self.limit = initial_limit
+        self._successes = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.saturations = 0  # times the window was filled
+        self.increases = 0
+        self.decreases = 0
+        self.baseline_latency: float | None = None
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> LimiterSlot:
+        """Wait for a free slot, returns the slot to pass to release."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            saturations = self.saturations
+            if self.in_flight >= self.limit:
+                self.saturations += 1
+        return LimiterSlot(time.monotonic(), saturations)
+
+    def _is_overload(self, status_code: int | None, latency: float) -> bool:
+        if status_code is None or status_code == 429 or status_code >= 500:
+            return True
+
+        baseline = self.baseline_latency
+        return (
+            baseline is not None
+            and latency > baseline * self.latency_tolerance
+            and latency - baseline > self.min_spike
+        )
+
+    async def release(
+        self,
+        slot: LimiterSlot,
+        status_code: int | None,
+        adapt: bool = True,
+        latency: float | None = None,
+    ) -> None:
+        """Free a slot and adapt the limit to the outcome of the request.
+
+        Args:
+            slot: The slot returned by acquire
+            status_code: The response status, or None for a transport error
+            adapt: Whether the outcome should change the limit
+            latency: Seconds until the response headers arrived (default: time
+                since the slot was acquired)
+        """
+        if latency is None:
+            latency = time.monotonic() - slot.started
+
+        async with self._condition:
+            self.in_flight -= 1
+
+            if not adapt:
+                pass
+            elif self._is_overload(status_code, latency):
+                if slot.started >= self._last_decrease:
+                    self.limit = max(self.min_limit, int(self.limit * self.backoff))
+                    self._successes = 0
+                    self._last_decrease = time.monotonic()
+                    self.decreases += 1
+                    logger.debug("concurrency limit decreased to %d", self.limit)
+            elif (
+                status_code < 400
+                and self.saturations > slot.saturations
+                and self.limit < self.max_limit
+            ):
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+                    self.increases += 1
+
+            if status_code is not None and status_code < 400:
+                self.baseline_latency = (
+                    latency
+                    if self.baseline_latency is None
+                    else self.baseline_latency
+                    + self.smoothing * (latency - self.baseline_latency)
+                )
+
+            self._condition.notify_all()
+
+    def to_dict(self) -> dict:
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "max_in_flight": self.max_in_flight,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream releasing a concurrency slot once it is closed.
+
+    The latency is measured up to the response headers, so downloading a large
+    body is not mistaken for a latency spike.
+    """
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        limiter: AdaptiveLimiter,
+        slot: LimiterSlot,
+        status_code: int,
+        latency: float,
+    ) -> None:
+        self.stream = stream
+        self.limiter = limiter
+        self.slot = slot
+        self.status_code = status_code
+        self.latency = latency
+        self.released = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.released:
+                self.released = True
+                await self.limiter.release(
+                    self.slot, self.status_code, latency=self.latency
+                )
+
+
+class ConnectionStats(NamedTuple):
+    """Connection reuse counters of a transport."""
+
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """Number of requests sent over an already established connection."""
+        return max(self.requests - self.connections, 0)
+
+
+class GrafanaTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper applying rate limits and retries to every request.
+
+    With a concurrency limiter, every attempt holds a slot until its response
+    body has been read.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retry_policy: RetryPolicy | None = None,
+        read_limiter: TokenBucket | None = None,
+        write_limiter: TokenBucket | None = None,
+        concurrency_limiter: AdaptiveLimiter | None = None,
+    ) -> None:
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.read_limiter = read_limiter
+        self.write_limiter = write_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.requests_sent = 0
+        self.connections_opened = 0
+
+    @property
+    def stats(self) -> ConnectionStats:
+        return ConnectionStats(self.requests_sent, self.connections_opened)
+
+    async def _trace(self, event_name: str, info: dict) -> None:
+        """Count new connections via the httpcore trace extension."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = (
+            self.read_limiter if request.method in READ_METHODS else self.write_limiter
+        )
+        policy = self.retry_policy
+        request.extensions = {**request.extensions, "trace": self._trace}
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire()
+
+            self.requests_sent += 1
+            try:
+                response = await self._send(request)
+            except httpx.TransportError as ex:
+                if attempt >= policy.max_retries or not policy.should_retry(
+                    request.method, None
+                ):
+                    raise
+                attempt += 1
+                delay = policy.backoff(attempt)
+                logger.warning(
+                    "%s %s failed (%s), retry %d/%d in %.1fs",
+                    request.method,
+                    request.url,
+                    ex,
+                    attempt,
+                    policy.max_retries,
+                    delay,
+                )
+            else:
+                if attempt >= policy.max_retries or not policy.should_retry(
+                    request.method, response.status_code
+                ):
+                    return response
+                attempt += 1
+                delay = policy.backoff(attempt, response)
+                logger.warning(
+                    "%s %s returned %d, retry %d/%d in %.1fs",
+                    request.method,
+                    request.url,
+                    response.status_code,
+                    attempt,
+                    policy.max_retries,
+                    delay,
+                )
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        concurrency = self.concurrency_limiter
+        if concurrency is None:
+            return await self.transport.handle_async_request(request)
+
+        slot = await concurrency.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            await concurrency.release(slot, None)
+            raise
+        except BaseException:
+            # e.g. cancelled, this says nothing about the server
+            await concurrency.release(slot, None, adapt=False)
+            raise
+        latency = time.monotonic() - slot.started
+
+        if response.is_stream_consumed:
+            # the body was read by the wrapped transport already
+            await concurrency.release(slot, response.status_code, latency=latency)
+        else:
+            response.stream = _ReleasingStream(
+                response.stream, concurrency, slot, response.status_code, latency
+            )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
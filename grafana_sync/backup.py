@@ -3,8 +3,10 @@ from collections.abc import Generator, Iterable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from grafana_sync import tracing
 from grafana_sync.api.client import FOLDER_GENERAL, FOLDER_SHAREDWITHME
 from grafana_sync.api.models import GetDashboardResponse, GetFoldersResponseItem
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY
 
 if TYPE_CHECKING:
     from grafana_sync.api.client import GrafanaClient
@@ -51,6 +53,22 @@ class GrafanaBackup:
             logger.error("Dashboard %s not found", dashboard_uid)
             return
 
+        self._write_dashboard(dashboard_uid, dashboard)
+
+    async def backup_dashboards(
+        self, dashboard_uids: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> None:
+        """Backup many dashboards, fetching up to concurrency at a time."""
+        async for dashboard_uid, dashboard in self.grafana.get_dashboards(
+            dashboard_uids, concurrency
+        ):
+            if isinstance(dashboard, Exception):
+                raise dashboard
+            self._write_dashboard(dashboard_uid, dashboard)
+
+    def _write_dashboard(
+        self, dashboard_uid: str, dashboard: GetDashboardResponse
+    ) -> None:
         dashboard_file = self.dashboards_path / f"{dashboard_uid}.json"
 
         with dashboard_file.open("w") as f:
@@ -129,26 +147,37 @@ class GrafanaBackup:
         folder_uid: str = FOLDER_GENERAL,
         include_dashboards: bool = True,
         include_reports: bool = False,
+        walk_concurrency: int = 1,
+        inventory: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
         """Recursively backup folders, dashboards, and reports starting from a folder."""
         self._ensure_backup_dirs()
 
-        async for wlk_folder_uid, _, dashboards in self.grafana.walk(
-            folder_uid,
-            recursive=True,
-            include_dashboards=include_dashboards,
-        ):
-            # Backup folder
-            if wlk_folder_uid != FOLDER_GENERAL:
-                await self.backup_folder(wlk_folder_uid)
-
-            # Backup dashboards
+        with tracing.span("backup", folder_uid=folder_uid):
+            dashboard_uids: list[str] = []
+            async for wlk_folder_uid, _, dashboards in self.grafana.walk(
+                folder_uid,
+                recursive=True,
+                include_dashboards=include_dashboards,
+                max_concurrency=walk_concurrency,
+                inventory=inventory,
+            ):
+                # Backup folder
+                if wlk_folder_uid != FOLDER_GENERAL:
+                    with tracing.span("backup folder", uid=wlk_folder_uid):
+                        await self.backup_folder(wlk_folder_uid)
+
+                dashboard_uids.extend(dashboard.uid for dashboard in dashboards.root)
+
+            # Backup dashboards of all folders at once
             if include_dashboards:
-                for dashboard in dashboards.root:
-                    await self.backup_dashboard(dashboard.uid)
-
-        # Backup reports
-        if include_reports:
-            reports = await self.grafana.get_reports()
-            for report in reports.root:
-                await self.backup_report(report.id)
+                with tracing.span("backup dashboards", count=len(dashboard_uids)):
+                    await self.backup_dashboards(dashboard_uids, concurrency)
+
+            # Backup reports
+            if include_reports:
+                with tracing.span("backup reports"):
+                    reports = await self.grafana.get_reports()
+                    for report in reports.root:
+                        await self.backup_report(report.id)
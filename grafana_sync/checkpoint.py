@@ -0,0 +1,41 @@
+from pathlib import Path
+from typing import Self
+
+
+class Checkpoint:
+    """Append-only file of processed keys, used to resume bulk operations.
+
+    Keys are stored one per line and flushed as soon as they are added, so an
+    interrupted run can pick up where it stopped.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.keys: set[str] = set()
+        if self.path.exists():
+            self.keys.update(
+                line for line in self.path.read_text().splitlines() if line
+            )
+        self._file = self.path.open("a")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str) -> None:
+        if key in self.keys:
+            return
+        self.keys.add(key)
+        self._file.write(f"{key}\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,23 +1,41 @@
+import json
 import logging
+from contextlib import nullcontext
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
 import asyncclick as click
-from rich import print as rprint
-from rich import print_json
-from rich.console import Console
-from rich.tree import Tree
 
-from grafana_sync.api.client import FOLDER_GENERAL, GrafanaClient
-from grafana_sync.backup import GrafanaBackup
-from grafana_sync.restore import GrafanaRestore
-from grafana_sync.sync import GrafanaSync
+from grafana_sync import tracing
+from grafana_sync.api.auth import ServiceAccountTokenAuth
+from grafana_sync.api.cache import DEFAULT_CACHE_MAX_BYTES
+from grafana_sync.api.client import (
+    AUTH_MODE_BASIC,
+    AUTH_MODES,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    DEFAULT_TIMEOUT,
+    FOLDER_GENERAL,
+    GrafanaClient,
+)
+from grafana_sync.api.transport import (
+    DEFAULT_INITIAL_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    AdaptiveLimiter,
+    RetryPolicy,
+)
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY, map_as_completed
+from grafana_sync.exceptions import GrafanaSyncError
 
+# subcommand modules and rich are imported by the commands using them, which
+# keeps the startup time of short invocations low
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from grafana_sync.api.client import LogoutResult
     from grafana_sync.api.models import (
-        GetDashboardResponse,
+        GetDashboardMetaResponse,
         GetFolderResponse,
         GetFoldersResponseItem,
         SearchDashboardsResponseItem,
@@ -25,14 +43,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# context meta key of the clients included in the --stats summary
+STATS_CLIENTS_KEY = "grafana_sync.stats_clients"
+
 
 @click.group()
 @click.version_option()
 @click.option(
     "--url",
     envvar="GRAFANA_URL",
-    required=True,
-    help="Grafana URL",
+    help="Grafana URL, required by all commands except offline test data generation",
 )
 @click.option(
     "--log-level",
@@ -66,15 +86,127 @@ logger = logging.getLogger(__name__)
     envvar="GRAFANA_PASSWORD",
     help="Grafana password for basic authentication",
 )
+@click.option(
+    "--auth-mode",
+    envvar="GRAFANA_AUTH_MODE",
+    type=click.Choice(AUTH_MODES),
+    default=AUTH_MODE_BASIC,
+    help="Use username and password for every request (basic), or log in once and reuse the session cookie (session) or a short-lived service account token (token, an organization admin which cannot run logout-all)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=3,
+    help="Maximum number of retries for transient API errors (429, 5xx)",
+)
+@click.option(
+    "--read-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum number of read requests per second",
+)
+@click.option(
+    "--write-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum number of write requests per second",
+)
+@click.option(
+    "--max-connections",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONNECTIONS,
+    help="Maximum number of concurrent connections",
+)
+@click.option(
+    "--max-keepalive",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_KEEPALIVE,
+    help="Maximum number of idle keep-alive connections",
+)
+@click.option(
+    "--keepalive-expiry",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_KEEPALIVE_EXPIRY,
+    help="Seconds after which idle connections are closed",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_TIMEOUT,
+    help="Timeout in seconds for requests",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    help="Multiplex requests over HTTP/2 (requires grafana-sync[http2])",
+)
+@click.option(
+    "--memoize",
+    is_flag=True,
+    help="Keep folder and datasource responses for the whole run instead of requesting them again",
+)
+@click.option(
+    "--adaptive-concurrency",
+    is_flag=True,
+    help="Adapt the number of concurrent requests to the latency and errors of the server",
+)
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENCY,
+    help="Upper bound of the adaptive concurrency limit",
+)
+@click.option(
+    "--cache-dir",
+    envvar="GRAFANA_SYNC_CACHE_DIR",
+    type=click.Path(file_okay=False),
+    help="Directory for caching dashboards between runs, validated by version",
+)
+@click.option(
+    "--cache-max-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+    help="Maximum size of the dashboard cache in MiB",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    help="Print per-endpoint API request statistics on exit",
+)
+@click.option(
+    "--stats-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write per-endpoint API request statistics as JSON to this file on exit",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write API requests and sync phases as Chrome trace events to this file",
+)
 @click.pass_context
 async def cli(
     ctx: click.Context,
-    url: str,
+    url: str | None,
     api_key: str | None,
     username: str | None,
     password: str | None,
     log_level: str,
     httpx_log_level: str,
+    auth_mode: str,
+    max_retries: int,
+    read_rate: float | None,
+    write_rate: float | None,
+    max_connections: int,
+    max_keepalive: int,
+    keepalive_expiry: float,
+    timeout: float,
+    http2: bool,
+    memoize: bool,
+    adaptive_concurrency: bool,
+    max_concurrency: int,
+    cache_dir: str | None,
+    cache_max_size: int,
+    stats: bool,
+    stats_file: str | None,
+    trace_file: str | None,
 ):
     """Sync Grafana dashboards and folders."""
     logging.basicConfig(level=getattr(logging, log_level.upper()))
@@ -82,13 +214,130 @@ async def cli(
     # Set httpx logging level
     logging.getLogger("httpx").setLevel(getattr(logging, httpx_log_level.upper()))
 
+    if url is None:
+        # the generate command can write a backup without a Grafana instance
+        if ctx.invoked_subcommand != "generate":
+            msg = "Missing option '--url'."
+            raise click.UsageError(msg, ctx)
+        return
+
     try:
         ctx.obj = await ctx.with_async_resource(
-            GrafanaClient(url, api_key, username, password)
+            GrafanaClient(
+                url,
+                api_key,
+                username,
+                password,
+                auth_mode=auth_mode,
+                retry_policy=RetryPolicy(max_retries=max_retries),
+                read_rate=read_rate,
+                write_rate=write_rate,
+                max_connections=max_connections,
+                max_keepalive=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+                timeout=timeout,
+                http2=http2,
+                memoize=memoize,
+                cache_dir=cache_dir,
+                cache_max_bytes=cache_max_size * 1024 * 1024,
+                collect_metrics=stats or stats_file is not None,
+                concurrency_limiter=make_concurrency_limiter(
+                    adaptive_concurrency, max_concurrency
+                ),
+            )
         )
-    except ValueError as ex:
+    except (ValueError, ImportError) as ex:
         raise click.UsageError(ex.args[0]) from ex
 
+    if ctx.obj.metrics is not None:
+        clients = ctx.meta[STATS_CLIENTS_KEY] = {"source": ctx.obj}
+        ctx.call_on_close(lambda: report_stats(clients, stats, stats_file))
+
+    if trace_file is not None:
+        tracer = tracing.start_tracing()
+        ctx.obj.add_request_observer(tracer.observe_request)
+        ctx.call_on_close(lambda: write_trace(trace_file))
+
+
+def make_concurrency_limiter(
+    adaptive: bool, max_concurrency: int
+) -> AdaptiveLimiter | None:
+    if not adaptive:
+        return None
+    return AdaptiveLimiter(
+        initial_limit=min(DEFAULT_INITIAL_CONCURRENCY, max_concurrency),
+        max_limit=max_concurrency,
+    )
+
+
+def write_trace(path: str) -> None:
+    """Stop tracing and write the collected trace events."""
+    tracer = tracing.stop_tracing()
+    if tracer is not None:
+        tracer.write(path)
+        logger.info("Wrote trace with %d events to %s", len(tracer.events), path)
+
+
+def report_stats(
+    clients: "Mapping[str, GrafanaClient]", show: bool, path: str | None
+) -> None:
+    """Print and/or write the request metrics of the clients."""
+    metrics = {
+        name: client.metrics
+        for name, client in clients.items()
+        if client.metrics is not None
+    }
+
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump({name: m.to_dict() for name, m in metrics.items()}, f, indent=2)
+
+    if not show:
+        return
+
+    from rich import filesize
+    from rich.console import Console
+    from rich.table import Table
+
+    from grafana_sync.api.metrics import PERCENTILES
+
+    console = Console(stderr=True)
+    for name, m in metrics.items():
+        table = Table(title=f"API requests ({name})")
+        table.add_column("Endpoint")
+        table.add_column("Requests", justify="right")
+        table.add_column("Status")
+        for p in PERCENTILES:
+            table.add_column(f"p{p} ms", justify="right")
+        table.add_column("Total s", justify="right")
+        table.add_column("Sent", justify="right")
+        table.add_column("Received", justify="right")
+
+        rows = sorted(m.endpoints.items())
+        for i, (endpoint, em) in enumerate([*rows, ("total", m.total())]):
+            table.add_row(
+                endpoint,
+                str(em.count),
+                " ".join(f"{code}:{n}" for code, n in sorted(em.status_codes.items())),
+                *(f"{v * 1000:.1f}" for v in em.latency_percentiles().values()),
+                f"{em.total_time:.2f}",
+                filesize.decimal(em.bytes_sent),
+                filesize.decimal(em.bytes_received),
+                style="bold" if i == len(rows) else None,
+                end_section=i == len(rows) - 1,
+            )
+
+        if (concurrency := m.concurrency) is not None:
+            table.caption = (
+                f"adaptive concurrency: limit {concurrency.limit}"
+                f" ({concurrency.min_limit}-{concurrency.max_limit}),"
+                f" max in flight {concurrency.max_in_flight},"
+                f" {concurrency.increases} increases,"
+                f" {concurrency.decreases} decreases"
+            )
+
+        console.print(table)
+
 
 @cli.command(name="list")
 @click.option(
@@ -121,6 +370,23 @@ async def cli(
     is_flag=True,
     help="Show extended dashboard details including update information",
 )
+@click.option(
+    "--walk-concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of folders fetched concurrently while walking the folder tree",
+)
+@click.option(
+    "--inventory",
+    is_flag=True,
+    help="Fetch all dashboards with a single paged search instead of one search per folder",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of dashboards fetched concurrently for --extended",
+)
 @click.pass_context
 async def list_folders(
     ctx: click.Context,
@@ -129,8 +395,15 @@ async def list_folders(
     include_dashboards: bool,
     output_json: bool,
     extended: bool,
+    walk_concurrency: int,
+    inventory: bool,
+    concurrency: int,
 ) -> None:
     """List folders in a Grafana instance."""
+    from rich import print as rprint
+    from rich import print_json
+    from rich.tree import Tree
+
     grafana = ctx.ensure_object(GrafanaClient)
 
     class TreeDashboardItem:
@@ -139,7 +412,7 @@ async def list_folders(
         def __init__(
             self,
             data: "SearchDashboardsResponseItem",
-            extended_data: "GetDashboardResponse | None" = None,
+            extended_data: "GetDashboardMetaResponse | None" = None,
         ) -> None:
             """Initialize dashboard item with API response data."""
             self.data = data
@@ -228,9 +501,14 @@ async def list_folders(
             return children_data
 
     folder_nodes: Mapping[str | None, TreeFolderItem] = {}
+    dashboard_items: list[TreeDashboardItem] = []
 
     async for root_uid, folders, dashboards in grafana.walk(
-        folder_uid, recursive, include_dashboards
+        folder_uid,
+        recursive,
+        include_dashboards,
+        max_concurrency=walk_concurrency,
+        inventory=inventory,
     ):
         if root_uid in folder_nodes:
             root_node = folder_nodes[root_uid]
@@ -246,12 +524,22 @@ async def list_folders(
                 root_node.children.append(itm)
 
         for dashboard in dashboards.root:
-            extended_data = None
-            if extended:
-                extended_data = await grafana.get_dashboard(dashboard.uid)
-            itm = TreeDashboardItem(dashboard, extended_data)
+            itm = TreeDashboardItem(dashboard)
+            dashboard_items.append(itm)
             root_node.children.append(itm)
 
+    if extended:
+
+        async def get_meta(itm: TreeDashboardItem) -> "GetDashboardMetaResponse":
+            return await grafana.get_dashboard_meta(itm.data.uid)
+
+        async for itm, extended_data in map_as_completed(
+            dashboard_items, get_meta, concurrency
+        ):
+            if isinstance(extended_data, Exception):
+                raise extended_data
+            itm.extended_data = extended_data
+
     main_node = folder_nodes[folder_uid]
     if output_json:
         print_json(data=main_node.to_obj())
@@ -281,6 +569,69 @@ async def list_folders(
     envvar="GRAFANA_DST_PASSWORD",
     help="Destination Grafana password for basic authentication",
 )
+@click.option(
+    "--dst-auth-mode",
+    envvar="GRAFANA_DST_AUTH_MODE",
+    type=click.Choice(AUTH_MODES),
+    default=AUTH_MODE_BASIC,
+    help="Destination authentication mode, see --auth-mode",
+)
+@click.option(
+    "--dst-max-retries",
+    type=click.IntRange(min=0),
+    default=3,
+    help="Maximum number of retries for transient destination API errors (429, 5xx)",
+)
+@click.option(
+    "--dst-read-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum number of destination read requests per second",
+)
+@click.option(
+    "--dst-write-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum number of destination write requests per second",
+)
+@click.option(
+    "--dst-max-connections",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONNECTIONS,
+    help="Maximum number of concurrent destination connections",
+)
+@click.option(
+    "--dst-max-keepalive",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_KEEPALIVE,
+    help="Maximum number of idle destination keep-alive connections",
+)
+@click.option(
+    "--dst-keepalive-expiry",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_KEEPALIVE_EXPIRY,
+    help="Seconds after which idle destination connections are closed",
+)
+@click.option(
+    "--dst-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_TIMEOUT,
+    help="Timeout in seconds for destination requests",
+)
+@click.option(
+    "--dst-http2",
+    is_flag=True,
+    help="Multiplex destination requests over HTTP/2 (requires grafana-sync[http2])",
+)
+@click.option(
+    "--dst-adaptive-concurrency",
+    is_flag=True,
+    help="Adapt the number of concurrent destination requests to its latency and errors",
+)
+@click.option(
+    "--dst-max-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENCY,
+    help="Upper bound of the adaptive destination concurrency limit",
+)
 @click.option(
     "-f",
     "--folder-uid",
@@ -329,6 +680,43 @@ async def list_folders(
     is_flag=True,
     help="Only print modifying changes",
 )
+@click.option(
+    "--walk-concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of folders fetched concurrently while walking the folder tree",
+)
+@click.option(
+    "--inventory",
+    is_flag=True,
+    help="Fetch all dashboards with a single paged search instead of one search per folder",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of dashboards synced concurrently while the folders are walked",
+)
+@click.option(
+    "--snapshot/--no-snapshot",
+    default=True,
+    help="Capture the destination folders and dashboards upfront instead of checking each object with a request",
+)
+@click.option(
+    "--state-file",
+    type=click.Path(dir_okay=False),
+    help="Journal of synced dashboards, dashboards unchanged on both sides since the last sync are skipped",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Compare all dashboards, even if the state file shows them unchanged",
+)
+@click.option(
+    "--plan-out",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the changes to a plan file for the apply command instead of syncing, implies --dry-run",
+)
 @click.pass_context
 async def sync_folders(
     ctx: click.Context,
@@ -336,6 +724,17 @@ async def sync_folders(
     dst_api_key: str | None,
     dst_username: str | None,
     dst_password: str | None,
+    dst_auth_mode: str,
+    dst_max_retries: int,
+    dst_read_rate: float | None,
+    dst_write_rate: float | None,
+    dst_max_connections: int,
+    dst_max_keepalive: int,
+    dst_keepalive_expiry: float,
+    dst_timeout: float,
+    dst_http2: bool,
+    dst_adaptive_concurrency: bool,
+    dst_max_concurrency: int,
     folder_uid: str,
     recursive: bool,
     include_dashboards: bool,
@@ -345,17 +744,69 @@ async def sync_folders(
     dst_parent_uid: str | None,
     migrate_datasources: bool,
     dry_run: bool,
+    walk_concurrency: int,
+    inventory: bool,
+    concurrency: int,
+    snapshot: bool,
+    state_file: str | None,
+    full: bool,
+    plan_out: str | None,
 ) -> None:
     """Sync folders from source to destination Grafana instance."""
+    from rich.console import Console
+
+    from grafana_sync.journal import SyncJournal
+    from grafana_sync.plan import SyncPlan
+    from grafana_sync.sync import GrafanaSync
+
     src_grafana = ctx.ensure_object(GrafanaClient)
-    async with GrafanaClient(
-        dst_url, dst_api_key, dst_username, dst_password
-    ) as dst_grafana:
+    try:
+        dst_grafana = GrafanaClient(
+            dst_url,
+            dst_api_key,
+            dst_username,
+            dst_password,
+            auth_mode=dst_auth_mode,
+            retry_policy=RetryPolicy(max_retries=dst_max_retries),
+            read_rate=dst_read_rate,
+            write_rate=dst_write_rate,
+            max_connections=dst_max_connections,
+            max_keepalive=dst_max_keepalive,
+            keepalive_expiry=dst_keepalive_expiry,
+            timeout=dst_timeout,
+            http2=dst_http2,
+            memoize=src_grafana.memo is not None,
+            cache_dir=src_grafana.cache_dir,
+            cache_max_bytes=src_grafana.cache_max_bytes,
+            collect_metrics=src_grafana.metrics is not None,
+            concurrency_limiter=make_concurrency_limiter(
+                dst_adaptive_concurrency, dst_max_concurrency
+            ),
+        )
+    except (ValueError, ImportError) as ex:
+        raise click.UsageError(ex.args[0]) from ex
+
+    if STATS_CLIENTS_KEY in ctx.meta:
+        ctx.meta[STATS_CLIENTS_KEY]["destination"] = dst_grafana
+    if (tracer := tracing.current_tracer()) is not None:
+        dst_grafana.add_request_observer(tracer.observe_request)
+
+    plan = (
+        SyncPlan(
+            source=str(src_grafana.client.base_url),
+            destination=str(dst_grafana.client.base_url),
+        )
+        if plan_out
+        else None
+    )
+
+    async with dst_grafana:
         syncer = GrafanaSync(
             src_grafana,
             dst_grafana,
             dst_parent_uid=dst_parent_uid,
             migrate_datasources=migrate_datasources,
+            plan=plan,
         )
 
         table = await syncer.get_datasource_mapping_cli_table()
@@ -363,15 +814,48 @@ async def sync_folders(
         console = Console()
         console.print(table)
 
-        await syncer.sync(
-            folder_uid=folder_uid,
-            recursive=recursive,
-            include_dashboards=include_dashboards,
-            prune=prune,
-            relocate_folders=relocate_folders,
-            relocate_dashboards=relocate_dashboards,
-            dry_run=dry_run,
-        )
+        if state_file:
+            scope = {
+                "source": str(src_grafana.client.base_url),
+                "destination": str(dst_grafana.client.base_url),
+                "migrate_datasources": str(migrate_datasources),
+            }
+            if migrate_datasources:
+                scope["datasources"] = await syncer.get_datasource_digest()
+            syncer.journal = SyncJournal(state_file, scope=scope)
+
+        try:
+            await syncer.sync(
+                folder_uid=folder_uid,
+                recursive=recursive,
+                include_dashboards=include_dashboards,
+                prune=prune,
+                relocate_folders=relocate_folders,
+                relocate_dashboards=relocate_dashboards,
+                dry_run=dry_run or plan is not None,
+                walk_concurrency=walk_concurrency,
+                inventory=inventory,
+                concurrency=concurrency,
+                snapshot=snapshot,
+                full=full,
+            )
+        except GrafanaSyncError as ex:
+            raise_sync_errors(ex)
+
+    if plan is not None and plan_out:
+        plan.save(plan_out)
+        click.echo(f"Wrote {len(plan.steps)} change(s) to {plan_out}")
+
+
+def raise_sync_errors(ex: GrafanaSyncError) -> NoReturn:
+    """List the failed folders and dashboards and exit with an error."""
+    for kind, errors in [
+        ("folder", ex.folder_errors),
+        ("dashboard", ex.dashboard_errors),
+    ]:
+        for uid, error in errors.items():
+            click.echo(f"Failed to sync {kind} {uid}: {error}", err=True)
+    raise click.ClickException(str(ex)) from ex
 
 
 @cli.command(name="backup")
@@ -404,6 +888,23 @@ async def sync_folders(
     is_flag=True,
     help="Include reports in the backup",
 )
+@click.option(
+    "--walk-concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of folders fetched concurrently while walking the folder tree",
+)
+@click.option(
+    "--inventory",
+    is_flag=True,
+    help="Fetch all dashboards with a single paged search instead of one search per folder",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of dashboards fetched concurrently",
+)
 @click.pass_context
 async def backup_folders(
     ctx: click.Context,
@@ -412,8 +913,13 @@ async def backup_folders(
     include_dashboards: bool,
     backup_path: str,
     include_reports: bool,
+    walk_concurrency: int,
+    inventory: bool,
+    concurrency: int,
 ) -> None:
     """Backup folders and dashboards from Grafana instance to local storage."""
+    from grafana_sync.backup import GrafanaBackup
+
     grafana = ctx.ensure_object(GrafanaClient)
     backup = GrafanaBackup(grafana, backup_path)
 
@@ -423,7 +929,14 @@ async def backup_folders(
 
     if recursive:
         # Recursively backup from the specified folder
-        await backup.backup_recursive(folder_uid, include_dashboards, include_reports)
+        await backup.backup_recursive(
+            folder_uid,
+            include_dashboards,
+            include_reports,
+            walk_concurrency=walk_concurrency,
+            inventory=inventory,
+            concurrency=concurrency,
+        )
     elif include_dashboards:
         # Non-recursive, just backup dashboards in the specified folder
         async for _, _, dashboards in grafana.walk(
@@ -431,13 +944,14 @@ async def backup_folders(
             recursive=False,
             include_dashboards=True,
         ):
-            for dashboard in dashboards.root:
-                await backup.backup_dashboard(dashboard.uid)
+            await backup.backup_dashboards(
+                [dashboard.uid for dashboard in dashboards.root], concurrency
+            )
 
 
 @cli.command(
     name="generate",
-    help="Generate random test folders and dashboards in Grafana instance.",
+    help="Generate deterministic test folders and dashboards in a Grafana instance or a backup directory.",
 )
 @click.option(
     "--num-folders",
@@ -447,22 +961,46 @@ async def backup_folders(
 )
 @click.option(
     "--max-subfolders",
-    type=int,
+    type=click.IntRange(min=0),
     default=3,
     help="Maximum number of subfolders per folder",
 )
 @click.option(
     "--max-depth",
-    type=int,
+    type=click.IntRange(min=0),
     default=2,
     help="Maximum folder nesting depth",
 )
 @click.option(
     "--max-dashboards",
-    type=int,
+    type=click.IntRange(min=0),
     default=3,
     help="Maximum number of dashboards per folder",
 )
+@click.option(
+    "--max-panels",
+    type=click.IntRange(min=1),
+    default=12,
+    help="Maximum number of panels per dashboard",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed of the generated data, the same seed generates the same data",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of folders and dashboards created concurrently",
+)
+@click.option(
+    "-o",
+    "--backup-path",
+    type=click.Path(file_okay=False),
+    help="Write the data to this backup directory instead of a Grafana instance, --url is not required",
+)
 @click.pass_context
 async def generate_test_data(
     ctx: click.Context,
@@ -470,22 +1008,35 @@ async def generate_test_data(
     max_subfolders: int,
     max_depth: int,
     max_dashboards: int,
+    max_panels: int,
+    seed: int,
+    concurrency: int,
+    backup_path: str | None,
 ) -> None:
-    try:
-        grafana = ctx.ensure_object(GrafanaClient)
-        await grafana.generate_test_data(
-            num_folders=num_folders,
-            max_subfolders=max_subfolders,
-            max_depth=max_depth,
-            max_dashboards=max_dashboards,
-        )
-        click.echo("Test data generation complete")
-    except ImportError as ex:
-        msg = (
-            "Faker package is required for test data generation. "
-            "Install it with: pip install 'grafana-sync[generate]'"
-        )
-        raise click.UsageError(msg) from ex
+    from grafana_sync.generate import TestDataGenerator
+
+    generator = TestDataGenerator(
+        seed,
+        num_folders=num_folders,
+        max_subfolders=max_subfolders,
+        max_depth=max_depth,
+        max_dashboards=max_dashboards,
+        max_panels=max_panels,
+    )
+
+    if backup_path is not None:
+        generator.write_backup(backup_path)
+    else:
+        grafana = ctx.find_object(GrafanaClient)
+        if grafana is None:
+            msg = "Either --url or --backup-path must be specified"
+            raise click.UsageError(msg)
+        await generator.upload(grafana, concurrency)
+
+    click.echo(
+        f"Generated {len(generator.folders)} folders"
+        f" and {len(generator.dashboard_uids)} dashboards"
+    )
 
 
 @cli.command(name="restore")
@@ -526,6 +1077,8 @@ async def restore_folders(
     include_reports: bool,
 ) -> None:
     """Restore folders and dashboards from local storage to Grafana instance."""
+    from grafana_sync.restore import GrafanaRestore
+
     grafana = ctx.ensure_object(GrafanaClient)
     restore = GrafanaRestore(grafana, backup_path)
 
@@ -540,6 +1093,43 @@ async def restore_folders(
         raise click.UsageError(msg)
 
 
+@cli.command(name="apply")
+@click.argument("plan_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of changes applied concurrently",
+)
+@click.pass_context
+async def apply_changes(ctx: click.Context, plan_path: str, concurrency: int) -> None:
+    """Apply a plan written by sync --plan-out to the Grafana instance."""
+    from pydantic import ValidationError
+
+    from grafana_sync.plan import SyncPlan, apply_plan
+
+    try:
+        plan = SyncPlan.load(plan_path)
+    except (ValueError, ValidationError) as ex:
+        msg = f"Invalid plan file {plan_path}: {ex}"
+        raise click.ClickException(msg) from ex
+
+    grafana = ctx.ensure_object(GrafanaClient)
+    if plan.destination != str(grafana.client.base_url):
+        logger.warning(
+            "plan was computed for %s, applying it to %s",
+            plan.destination,
+            grafana.client.base_url,
+        )
+
+    try:
+        await apply_plan(grafana, plan, concurrency)
+    except GrafanaSyncError as ex:
+        raise_sync_errors(ex)
+
+    click.echo(f"Applied {len(plan.steps)} change(s)")
+
+
 @cli.command(name="logout-all")
 @click.confirmation_option(
     prompt="Are you sure you want to logout all users?",
@@ -549,9 +1139,63 @@ async def restore_folders(
     "--skip-username",
     help="Username to skip (e.g. current user)",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Number of users logged out concurrently",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="File recording the logged out user ids, users listed in it are skipped to resume an interrupted run",
+)
 @click.pass_context
-async def logout_all_users(ctx: click.Context, skip_username: str | None) -> None:
+async def logout_all_users(
+    ctx: click.Context,
+    skip_username: str | None,
+    concurrency: int,
+    checkpoint: str | None,
+) -> None:
     """Logout all users from Grafana by invalidating all active sessions."""
+    from rich.console import Console
+    from rich.progress import Progress
+
+    from grafana_sync.checkpoint import Checkpoint
+
     grafana = ctx.ensure_object(GrafanaClient)
-    await grafana.logout_all_users(skip_username)
-    click.echo("All users have been logged out")
+    if isinstance(grafana.client.auth, ServiceAccountTokenAuth):
+        # the service account is an organization admin, not a server admin
+        msg = (
+            "logout-all requires the server admin API, use --auth-mode basic or session"
+        )
+        raise click.UsageError(msg)
+
+    with (
+        Progress(console=Console(stderr=True), transient=True) as progress,
+        Checkpoint(checkpoint) if checkpoint else nullcontext() as done,
+    ):
+        task = progress.add_task("Logging out users", total=None)
+
+        def update(result: "LogoutResult") -> None:
+            progress.update(task, total=result.total, completed=result.processed)
+
+        result = await grafana.logout_all_users(
+            skip_username,
+            concurrency=concurrency,
+            checkpoint=done,
+            progress=update,
+            raise_on_error=False,
+        )
+
+    for login, error in result.failed.items():
+        click.echo(f"Failed to logout {login}: {error}", err=True)
+
+    if result.failed:
+        msg = f"{len(result.failed)} of {result.total} users could not be logged out"
+        raise click.ClickException(msg)
+
+    click.echo(
+        f"All users have been logged out ({result.logged_out} logged out,"
+        f" {result.skipped} skipped)"
+    )
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from typing import Generic, Self, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+# default number of concurrent requests of bulk operations
+DEFAULT_CONCURRENCY = 8
+
+
+async def map_as_completed(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncGenerator[tuple[T, R | Exception], None]:
+    """Apply func to all items with bounded concurrency.
+
+    Results are yielded in completion order as ``(item, result)`` pairs, an
+    exception raised by func is yielded in place of the result instead of
+    aborting the other calls. Items are consumed lazily, at most concurrency
+    calls are in flight. Calls still running when the consumer stops iterating
+    are cancelled.
+
+    Args:
+        items: The items to process
+        func: The coroutine function called for every item
+        concurrency: Maximum number of concurrent calls
+    """
+    if concurrency < 1:
+        msg = "concurrency must be at least 1"
+        raise ValueError(msg)
+
+    remaining = iter(items)
+    pending: dict[asyncio.Future[R], T] = {}
+
+    def fill() -> None:
+        while len(pending) < concurrency:
+            try:
+                item = next(remaining)
+            except StopIteration:
+                return
+            pending[asyncio.ensure_future(func(item))] = item
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            results = []
+            for task in done:
+                item = pending.pop(task)
+                ex = task.exception()
+                if ex is not None and not isinstance(ex, Exception):
+                    raise ex
+                results.append((item, ex if ex is not None else task.result()))
+
+            # start the next calls before handing out the results
+            fill()
+            for result in results:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def run_all(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[object]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ignore: Callable[[Exception], bool] | None = None,
+) -> None:
+    """Call func for all items, raising the first error at the end.
+
+    A failed call does not abort the others. Exceptions for which ignore
+    returns True are not raised.
+
+    Args:
+        items: The items to process
+        func: The coroutine function called for every item
+        concurrency: Maximum number of concurrent calls
+        ignore: Optional predicate for exceptions to ignore
+    """
+    error: Exception | None = None
+    async for item, result in map_as_completed(items, func, concurrency):
+        if not isinstance(result, Exception):
+            continue
+        if ignore is not None and ignore(result):
+            logger.debug("Ignoring failure of %s: %s", item, result)
+            continue
+        logger.warning("Failed to process %s: %s", item, result)
+        error = error or result
+
+    if error is not None:
+        raise error
+
+
+class WorkerPool(Generic[T]):
+    """Bounded pool of workers consuming items fed by a producer.
+
+    Items are passed to put, which waits while the queue is full, so a fast
+    producer cannot run arbitrarily far ahead of the workers. Exceptions
+    raised by func are collected in errors instead of stopping the pool.
+    Leaving the context waits for all queued items, unless it is left with an
+    exception, in which case the workers are cancelled.
+
+    Args:
+        func: The coroutine function called for every item
+        concurrency: Number of workers
+    """
+
+    def __init__(
+        self,
+        func: Callable[[T], Awaitable[object]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        if concurrency < 1:
+            msg = "concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self.func = func
+        self.concurrency = concurrency
+        self.errors: list[tuple[T, Exception]] = []
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=concurrency)
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def _work(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                await self.func(item)
+            except Exception as ex:
+                self.errors.append((item, ex))
+            finally:
+                self._queue.task_done()
+
+    async def put(self, item: T) -> None:
+        await self._queue.put(item)
+
+    async def __aenter__(self) -> Self:
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.concurrency)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self._queue.join()
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
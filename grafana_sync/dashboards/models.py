@@ -1,3 +1,4 @@
+import hashlib
 from collections.abc import Generator, Mapping
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -227,6 +228,10 @@ class Templating(BaseModel):
         return ct
 
 
+# volatile fields, assigned by the Grafana instance on every save
+DASHBOARD_VOLATILE_FIELDS = frozenset({"id", "version"})
+
+
 class DashboardData(BaseModel):
     uid: str
     title: str
@@ -250,6 +255,18 @@ class DashboardData(BaseModel):
     def datasource_count(self) -> int:
         return len(list(self.all_datasources))
 
+    def content_digest(self) -> str:
+        """Get a SHA-256 digest of the dashboard content, ignoring id and version.
+
+        The dashboard is dumped to JSON in a single pass, with the fields in
+        declaration order followed by the other keys in the order they were
+        read. Grafana serves dashboards with sorted keys, so the same content
+        read from any instance has the same digest. A different key order can
+        only make equal dashboards compare as different, never the reverse.
+        """
+        content = self.model_dump_json(exclude=DASHBOARD_VOLATILE_FIELDS, by_alias=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
     @property
     def variable_datasource_count(self) -> int:
         return len([ds for ds in self.all_datasources if ds.is_variable])
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from httpx import Response
 
 
@@ -13,27 +15,36 @@ class GrafanaNotPristineError(Exception):
 class ExistingFoldersError(GrafanaNotPristineError):
     """Raised when Grafana instance has existing folders."""
 
-    def __init__(self, folder_count: int):
+    def __init__(self, folder_count: int | None = None):
         self.folder_count = folder_count
-        message = f"Grafana instance has {folder_count} existing folder(s)"
+        if folder_count is None:
+            message = "Grafana instance has existing folder(s)"
+        else:
+            message = f"Grafana instance has {folder_count} existing folder(s)"
         super().__init__(message)
 
 
 class ExistingDatasourcesError(GrafanaNotPristineError):
     """Raised when Grafana instance has existing datasources."""
 
-    def __init__(self, datasource_count: int):
+    def __init__(self, datasource_count: int | None = None):
         self.datasource_count = datasource_count
-        message = f"Grafana instance has {datasource_count} existing datasource(s)"
+        if datasource_count is None:
+            message = "Grafana instance has existing datasource(s)"
+        else:
+            message = f"Grafana instance has {datasource_count} existing datasource(s)"
         super().__init__(message)
 
 
 class ExistingDashboardsError(GrafanaNotPristineError):
     """Raised when Grafana instance has existing dashboards."""
 
-    def __init__(self, dashboard_count: int):
+    def __init__(self, dashboard_count: int | None = None):
         self.dashboard_count = dashboard_count
-        message = f"Grafana instance has {dashboard_count} existing dashboard(s)"
+        if dashboard_count is None:
+            message = "Grafana instance has existing dashboard(s)"
+        else:
+            message = f"Grafana instance has {dashboard_count} existing dashboard(s)"
         super().__init__(message)
 
 
@@ -55,6 +66,41 @@ class DestinationParentNotFoundError(Exception):
         super().__init__(message)
 
 
+class FolderNotSyncedError(Exception):
+    """Raised when an object is skipped because its folder failed to sync."""
+
+    def __init__(self, uid: str, folder_uid: str):
+        self.uid = uid
+        self.folder_uid = folder_uid
+        super().__init__(f"Skipped {uid}, its folder {folder_uid} failed to sync")
+
+
+class GrafanaSyncError(Exception):
+    """Raised after a sync when folders or dashboards failed to sync."""
+
+    def __init__(
+        self,
+        folder_errors: "Mapping[str, Exception]",
+        dashboard_errors: "Mapping[str, Exception]",
+    ):
+        self.folder_errors = folder_errors
+        self.dashboard_errors = dashboard_errors
+        message = (
+            f"Failed to sync {len(folder_errors)} folder(s)"
+            f" and {len(dashboard_errors)} dashboard(s)"
+        )
+        super().__init__(message)
+
+
+class PlanStepError(Exception):
+    """Raised when a step of a sync plan cannot be applied."""
+
+    def __init__(self, step: str, reason: str):
+        self.step = step
+        self.reason = reason
+        super().__init__(f"Cannot {step}: {reason}")
+
+
 class GrafanaRestoreError(Exception):
     """Base exception for restore operations."""
 
@@ -0,0 +1,366 @@
+"""Deterministic generation of synthetic folders and dashboards.
+
+The generated corpus only depends on the seed and the size parameters, so
+scale tests and benchmarks can be reproduced exactly. Dashboards are modeled
+on real-world dashboards: datasource and query variables, rows with nested
+panels and targets referencing the datasource variable or fixed datasources.
+
+The corpus can be uploaded to a Grafana instance or written to a backup
+directory, which can then be restored or used offline.
+"""
+
+import datetime
+import itertools
+import logging
+import random
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from grafana_sync import tracing
+from grafana_sync.api.models import (
+    DashboardMeta,
+    GetDashboardResponse,
+    GetFolderResponse,
+    GetFoldersResponseItem,
+)
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY, run_all
+from grafana_sync.dashboards.models import DashboardData
+
+if TYPE_CHECKING:
+    from grafana_sync.api.client import GrafanaClient
+
+logger = logging.getLogger(__name__)
+
+# timestamp of the generated dashboard metadata, fixed for reproducibility
+GENERATED_AT = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+ADJECTIVES = [
+    "Core", "Edge", "Legacy", "Internal", "Public", "Shared", "Regional",
+    "Global", "Primary", "Backup", "Staging", "Production", "Critical", "Batch",
+]  # fmt: skip
+NOUNS = [
+    "Payments", "Checkout", "Search", "Inventory", "Billing", "Identity",
+    "Gateway", "Storage", "Network", "Kubernetes", "Database", "Cache",
+    "Queue", "Frontend", "Ingest", "Reporting", "Scheduler", "Mail",
+]  # fmt: skip
+ASPECTS = [
+    "Overview", "Latency", "Errors", "Saturation", "Capacity", "Traffic",
+    "SLOs", "Health", "Usage", "Alerts", "Throughput", "Resources",
+]  # fmt: skip
+TAGS = ["prod", "staging", "infra", "app", "team-a", "team-b", "sla", "legacy"]
+
+# datasource plugin types and label names used in the generated queries
+DATASOURCE_TYPES = ["prometheus", "loki", "influxdb"]
+LABELS = ["instance", "job", "namespace", "pod", "service", "cluster"]
+METRICS = [
+    "http_requests_total",
+    "http_request_duration_seconds_bucket",
+    "process_cpu_seconds_total",
+    "process_resident_memory_bytes",
+    "node_network_receive_bytes_total",
+    "up",
+]
+PANEL_TYPES = ["timeseries", "timeseries", "stat", "gauge", "table", "bargauge"]
+UNITS = ["short", "percent", "bytes", "s", "reqps", "ms"]
+
+
+class TestDataGenerator:
+    """Seeded generator of a folder tree with dashboards.
+
+    The folder tree is built on construction. Dashboard bodies are generated
+    lazily, each from its own seeded random generator, so their content does
+    not depend on the order in which they are generated.
+
+    Args:
+        seed: Seed of the random generators
+        num_folders: Number of top-level folders
+        max_subfolders: Maximum number of subfolders per folder
+        max_depth: Maximum folder nesting depth
+        max_dashboards: Maximum number of dashboards per folder
+        max_panels: Maximum number of panels per dashboard
+        datasource_uids: Datasources referenced directly by some panels,
+            all other panels reference the datasource variable
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(
+        self,
+        seed: int = 0,
+        num_folders: int = 5,
+        max_subfolders: int = 3,
+        max_depth: int = 2,
+        max_dashboards: int = 3,
+        max_panels: int = 12,
+        datasource_uids: Sequence[str] = (),
+    ) -> None:
+        self.seed = seed
+        self.max_panels = max_panels
+        self.datasource_uids = list(datasource_uids)
+
+        self.folders: list[GetFoldersResponseItem] = []
+        # folder UID (None for the top-level directory) and dashboard UID
+        self.dashboard_uids: list[tuple[str | None, str]] = []
+
+        rng = random.Random(seed)
+
+        def add_dashboards(folder_uid: str | None) -> None:
+            for _ in range(rng.randint(0, max_dashboards)):
+                uid = f"gen-d{len(self.dashboard_uids):06d}"
+                self.dashboard_uids.append((folder_uid, uid))
+
+        def add_folder(depth: int, parent_uid: str | None) -> None:
+            uid = f"gen-f{len(self.folders):06d}"
+            title = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {len(self.folders)}"
+            self.folders.append(
+                GetFoldersResponseItem(uid=uid, title=title, parentUid=parent_uid)
+            )
+            add_dashboards(uid)
+
+            if depth < max_depth:
+                for _ in range(rng.randint(0, max_subfolders)):
+                    add_folder(depth + 1, uid)
+
+        add_dashboards(None)
+        for _ in range(num_folders):
+            add_folder(0, None)
+
+    def dashboards(self) -> Iterator[tuple[str | None, DashboardData]]:
+        """Generate all dashboards with the UID of their folder."""
+        for folder_uid, uid in self.dashboard_uids:
+            yield folder_uid, self.dashboard(uid)
+
+    def dashboard(self, uid: str) -> DashboardData:
+        """Generate the dashboard with the given UID."""
+        rng = random.Random(f"{self.seed}:{uid}")
+        ds_type = rng.choice(DATASOURCE_TYPES)
+        label = rng.choice(LABELS)
+        ds_var = {"type": ds_type, "uid": "${datasource}"}
+
+        templating = [
+            {
+                "current": {"text": "default", "value": "default"},
+                "includeAll": False,
+                "label": "Datasource",
+                "name": "datasource",
+                "options": [],
+                "query": ds_type,
+                "refresh": 1,
+                "regex": "",
+                "type": "datasource",
+            },
+            {
+                "current": {"text": ["All"], "value": ["$__all"]},
+                "datasource": ds_var,
+                "definition": f"label_values({label})",
+                "includeAll": True,
+                "label": label.capitalize(),
+                "multi": True,
+                "name": label,
+                "options": [],
+                "query": {
+                    "query": f"label_values({label})",
+                    "refId": f"PrometheusVariableQueryEditor-{label}",
+                },
+                "refresh": 1,
+                "regex": "",
+                "sort": 1,
+                "type": "query",
+            },
+            {
+                "current": {"text": "5m", "value": "5m"},
+                "name": "interval",
+                "options": [],
+                "query": "1m,5m,15m,1h",
+                "type": "custom",
+            },
+        ]
+
+        panel_ids = itertools.count(1)
+        y = 0
+
+        def make_panel(x: int, y: int) -> dict:
+            panel_type = rng.choice(PANEL_TYPES)
+            if self.datasource_uids and rng.random() < 0.3:
+                datasource = {"type": ds_type, "uid": rng.choice(self.datasource_uids)}
+            else:
+                datasource = ds_var
+
+            targets = []
+            for ref_id in "ABCD"[: rng.randint(1, 4)]:
+                metric = rng.choice(METRICS)
+                targets.append(
+                    {
+                        "datasource": datasource,
+                        "expr": f'sum by ({label}) (rate({metric}{{{label}=~"${label}"}}[$interval]))',
+                        "legendFormat": f"{{{{{label}}}}}",
+                        "range": True,
+                        "refId": ref_id,
+                    }
+                )
+
+            return {
+                "datasource": datasource,
+                "fieldConfig": {
+                    "defaults": {
+                        "color": {"mode": "palette-classic"},
+                        "mappings": [],
+                        "thresholds": {
+                            "mode": "absolute",
+                            "steps": [
+                                {"color": "green", "value": None},
+                                {"color": "red", "value": rng.choice([80, 90, 95])},
+                            ],
+                        },
+                        "unit": rng.choice(UNITS),
+                    },
+                    "overrides": [],
+                },
+                "gridPos": {"h": 8, "w": 12, "x": x, "y": y},
+                "id": next(panel_ids),
+                "options": {
+                    "legend": {"displayMode": "list", "placement": "bottom"},
+                    "tooltip": {"mode": "multi", "sort": "none"},
+                },
+                "targets": targets,
+                "title": f"{rng.choice(NOUNS)} {rng.choice(ASPECTS)}",
+                "type": panel_type,
+            }
+
+        def make_panels(count: int, y: int) -> list[dict]:
+            return [make_panel(12 * (i % 2), y + 8 * (i // 2)) for i in range(count)]
+
+        panels = []
+        remaining = rng.randint(1, max(self.max_panels, 1))
+        while remaining > 0:
+            count = min(rng.randint(1, 6), remaining)
+            remaining -= count
+            collapsed = rng.random() < 0.4
+            row = {
+                "collapsed": collapsed,
+                "gridPos": {"h": 1, "w": 24, "x": 0, "y": y},
+                "id": next(panel_ids),
+                "panels": [],
+                "title": rng.choice(ASPECTS),
+                "type": "row",
+            }
+            y += 1
+            children = make_panels(count, y)
+            if collapsed:
+                # collapsed rows nest their panels
+                row["panels"] = children
+                panels.append(row)
+            else:
+                panels.append(row)
+                panels.extend(children)
+                y += 8 * ((count + 1) // 2)
+
+        return DashboardData.model_validate(
+            {
+                "annotations": {"list": []},
+                "editable": True,
+                "graphTooltip": 1,
+                "links": [],
+                "panels": panels,
+                "refresh": "1m",
+                "schemaVersion": 39,
+                "tags": rng.sample(TAGS, rng.randint(0, 3)),
+                "templating": {"list": templating},
+                "time": {"from": "now-6h", "to": "now"},
+                "timezone": "browser",
+                "title": f"{rng.choice(NOUNS)} {rng.choice(ASPECTS)} {uid}",
+                "uid": uid,
+                "version": 1,
+            }
+        )
+
+    async def upload(
+        self, grafana: "GrafanaClient", concurrency: int = DEFAULT_CONCURRENCY
+    ) -> None:
+        """Create the folders and dashboards in a Grafana instance.
+
+        Folders are created level by level, so that parents exist before their
+        children, with up to concurrency requests in flight.
+
+        Raises:
+            GrafanaApiError: If a request fails, after the other requests of
+                the stage have been attempted
+        """
+
+        async def create_folder(folder: GetFoldersResponseItem) -> None:
+            await grafana.create_folder(
+                title=folder.title, uid=folder.uid, parent_uid=folder.parent_uid
+            )
+
+        async def create_dashboard(item: tuple[str | None, DashboardData]) -> None:
+            folder_uid, dashboard = item
+            await grafana.update_dashboard(dashboard, folder_uid)
+
+        created: set[str | None] = {None}
+        levels = []
+        remaining = self.folders
+        while remaining:
+            level = [f for f in remaining if f.parent_uid in created]
+            remaining = [f for f in remaining if f.parent_uid not in created]
+            created.update(f.uid for f in level)
+            levels.append(level)
+
+        with tracing.span("create folders"):
+            for level in levels:
+                await run_all(level, create_folder, concurrency)
+
+        with tracing.span("create dashboards"):
+            await run_all(self.dashboards(), create_dashboard, concurrency)
+
+        logger.info(
+            "generated %d folders and %d dashboards",
+            len(self.folders),
+            len(self.dashboard_uids),
+        )
+
+    def write_backup(self, backup_path: Path | str) -> None:
+        """Write the folders and dashboards in the backup format.
+
+        The backup directory can be restored with GrafanaRestore, no Grafana
+        instance is required to write it.
+        """
+        backup_path = Path(backup_path)
+        folders_path = backup_path / "folders"
+        dashboards_path = backup_path / "dashboards"
+        folders_path.mkdir(parents=True, exist_ok=True)
+        dashboards_path.mkdir(parents=True, exist_ok=True)
+        (backup_path / "reports").mkdir(exist_ok=True)
+
+        for folder in self.folders:
+            data = GetFolderResponse(
+                uid=folder.uid,
+                title=folder.title,
+                url=f"/dashboards/f/{folder.uid}/",
+                parentUid=folder.parent_uid,
+            )
+            (folders_path / f"{folder.uid}.json").write_text(
+                data.model_dump_json(indent=2, by_alias=True)
+            )
+
+        for folder_uid, dashboard in self.dashboards():
+            data = GetDashboardResponse(
+                dashboard=dashboard,
+                meta=DashboardMeta(
+                    folderUid=folder_uid or "",
+                    created=GENERATED_AT,
+                    createdBy="grafana-sync",
+                    updated=GENERATED_AT,
+                    updatedBy="grafana-sync",
+                ),
+            )
+            (dashboards_path / f"{dashboard.uid}.json").write_text(
+                data.model_dump_json(indent=2, by_alias=True)
+            )
+
+        logger.info(
+            "wrote %d folders and %d dashboards to %s",
+            len(self.folders),
+            len(self.dashboard_uids),
+            backup_path,
+        )
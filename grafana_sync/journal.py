@@ -0,0 +1,96 @@
+import datetime
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FORMAT_VERSION = 1
+
+
+class JournalEntry(BaseModel):
+    """State of a dashboard after it was last synced."""
+
+    src_version: int
+    src_updated: datetime.datetime  # detects a source dashboard created again
+    dst_version: int
+    folder_uid: str | None  # destination folder, None for the top level
+    # content digest of the dashboard written to the destination, compared
+    # with the source if only the source changed
+    digest: str
+
+
+class _JournalFile(BaseModel):
+    format_version: int = JOURNAL_FORMAT_VERSION
+    scope: dict[str, str]
+    dashboards: dict[str, JournalEntry] = {}
+
+
+class SyncJournal:
+    """State file of the dashboards written by previous syncs.
+
+    A dashboard whose source and destination versions still match its entry
+    has not changed on either side since it was synced and can be skipped
+    without fetching it.
+
+    The journal is bound to a scope, e.g. the source and destination URLs. A
+    journal file written for another scope is ignored, so it can never cause
+    a dashboard to be skipped that was not synced with the same settings.
+    """
+
+    def __init__(self, path: Path | str, scope: dict[str, str]) -> None:
+        self.path = Path(path)
+        self.scope = scope
+        self.dashboards: dict[str, JournalEntry] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            journal = _JournalFile.model_validate_json(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValidationError) as ex:
+            logger.warning("ignoring unreadable sync journal %s: %s", self.path, ex)
+            return
+
+        if journal.format_version != JOURNAL_FORMAT_VERSION:
+            logger.warning(
+                "ignoring sync journal %s with format version %d",
+                self.path,
+                journal.format_version,
+            )
+        elif journal.scope != self.scope:
+            logger.warning(
+                "ignoring sync journal %s written for another sync: %s",
+                self.path,
+                journal.scope,
+            )
+        else:
+            self.dashboards = journal.dashboards
+
+    def __len__(self) -> int:
+        return len(self.dashboards)
+
+    def get(self, uid: str) -> JournalEntry | None:
+        return self.dashboards.get(uid)
+
+    def record(self, uid: str, entry: JournalEntry) -> None:
+        self.dashboards[uid] = entry
+
+    def discard(self, uid: str) -> None:
+        self.dashboards.pop(uid, None)
+
+    def save(self) -> None:
+        """Write the journal, replacing the previous file atomically."""
+        content = _JournalFile(
+            scope=self.scope, dashboards=self.dashboards
+        ).model_dump_json()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp, self.path)
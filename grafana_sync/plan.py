@@ -0,0 +1,217 @@
+import datetime
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Self
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from grafana_sync import tracing
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY, map_as_completed
+from grafana_sync.dashboards.models import DashboardData
+from grafana_sync.exceptions import GrafanaSyncError, PlanStepError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from grafana_sync.api.client import GrafanaClient
+
+logger = logging.getLogger(__name__)
+
+PLAN_FORMAT_VERSION = 1
+
+StepKind = Literal[
+    "create_folder",
+    "update_folder",
+    "move_folder",
+    "upsert_dashboard",
+    "delete_dashboard",
+]
+
+FOLDER_STEPS = frozenset({"create_folder", "update_folder", "move_folder"})
+
+
+class PlanStep(BaseModel):
+    """A single change of the destination instance."""
+
+    kind: StepKind
+    uid: str
+    title: str | None = None
+    # parent of a created or moved folder, None for the top level
+    parent_uid: str | None = None
+    # folder of an upserted dashboard, None for the top level
+    folder_uid: str | None = None
+    dashboard: DashboardData | None = None
+    digest: str | None = None  # content digest of the dashboard payload
+
+    def describe(self) -> str:
+        return f"{self.kind.replace('_', ' ')} {self.uid}"
+
+
+class SyncPlan(BaseModel):
+    """Serializable list of the changes a sync would make to the destination.
+
+    A plan is computed by a dry run of the sync and contains the complete
+    dashboard payloads, so it can be applied later without reading the source
+    or walking the destination again.
+    """
+
+    format_version: int = PLAN_FORMAT_VERSION
+    created: datetime.datetime = Field(
+        default_factory=lambda: datetime.datetime.now(datetime.UTC)
+    )
+    source: str
+    destination: str
+    steps: list[PlanStep] = []
+
+    _created_folders: set[str] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, context: object) -> None:
+        self._created_folders = {s.uid for s in self.steps if s.kind == "create_folder"}
+
+    def add(self, step: PlanStep) -> None:
+        self.steps.append(step)
+        if step.kind == "create_folder":
+            self._created_folders.add(step.uid)
+
+    def creates_folder(self, uid: str) -> bool:
+        return uid in self._created_folders
+
+    def upsert_dashboard(
+        self,
+        dashboard: DashboardData,
+        folder_uid: str | None,
+        digest: str | None = None,
+    ) -> None:
+        self.add(
+            PlanStep(
+                kind="upsert_dashboard",
+                uid=dashboard.uid,
+                title=dashboard.title,
+                folder_uid=folder_uid,
+                dashboard=dashboard,
+                digest=digest or dashboard.content_digest(),
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path | str) -> Self:
+        plan = cls.model_validate_json(Path(path).read_bytes())
+        if plan.format_version != PLAN_FORMAT_VERSION:
+            msg = f"Unsupported plan format version {plan.format_version}"
+            raise ValueError(msg)
+        return plan
+
+    def save(self, path: Path | str) -> None:
+        Path(path).write_text(self.model_dump_json(by_alias=True, indent=2))
+
+    def levels(self) -> list[list[PlanStep]]:
+        """Group the steps into levels that can be applied concurrently.
+
+        Every step is placed in a level after the creation of the folders it
+        depends on: a created folder after its parent, a folder move after
+        its new parent and a dashboard after its folder.
+        """
+        created = {s.uid: s for s in self.steps if s.kind == "create_folder"}
+        depth: dict[int, int] = {}
+
+        def step_depth(step: PlanStep) -> int:
+            if id(step) in depth:
+                return depth[id(step)]
+
+            depth[id(step)] = 0  # guard against cyclic plans
+            dependency = dependency_of(step)
+            level = (
+                step_depth(created[dependency]) + 1
+                if dependency in created and created[dependency] is not step
+                else 0
+            )
+            depth[id(step)] = level
+            return level
+
+        levels: list[list[PlanStep]] = []
+        for step in self.steps:
+            level = step_depth(step)
+            while len(levels) <= level:
+                levels.append([])
+            levels[level].append(step)
+        return levels
+
+
+def dependency_of(step: PlanStep) -> str | None:
+    """Get the uid of the folder a step depends on, if any."""
+    if step.kind in ("create_folder", "move_folder"):
+        return step.parent_uid
+    if step.kind == "upsert_dashboard":
+        return step.folder_uid
+    return None
+
+
+async def apply_plan(
+    grafana: "GrafanaClient",
+    plan: SyncPlan,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    """Apply the steps of a plan to the destination instance.
+
+    The steps are applied level by level with up to concurrency requests in
+    flight. A failed step does not abort the others, but the steps depending
+    on a folder that could not be created are not attempted.
+
+    Raises:
+        GrafanaSyncError: If any step failed
+    """
+    handlers: dict[str, Callable[[PlanStep], Awaitable[object]]] = {
+        "create_folder": lambda step: grafana.create_folder(
+            title=step.title, uid=step.uid, parent_uid=step.parent_uid
+        ),
+        "update_folder": lambda step: grafana.update_folder(
+            uid=step.uid, title=step.title, overwrite=True
+        ),
+        "move_folder": lambda step: grafana.move_folder(step.uid, step.parent_uid),
+        "upsert_dashboard": lambda step: grafana.update_dashboard(
+            verified_dashboard(step), step.folder_uid
+        ),
+        "delete_dashboard": lambda step: grafana.delete_dashboard(step.uid),
+    }
+
+    failed_folders: set[str] = set()
+    folder_errors: dict[str, Exception] = {}
+    dashboard_errors: dict[str, Exception] = {}
+
+    async def apply_step(step: PlanStep) -> None:
+        dependency = dependency_of(step)
+        if dependency is not None and dependency in failed_folders:
+            msg = f"folder {dependency} could not be created"
+            raise PlanStepError(step.describe(), msg)
+
+        with tracing.span(step.describe()):
+            await handlers[step.kind](step)
+
+    with tracing.span("apply plan", steps=len(plan.steps)):
+        for level in plan.levels():
+            async for step, result in map_as_completed(level, apply_step, concurrency):
+                if not isinstance(result, Exception):
+                    logger.info("applied %s", step.describe())
+                    continue
+
+                logger.error("failed to %s: %s", step.describe(), result)
+                if step.kind in FOLDER_STEPS:
+                    folder_errors[step.uid] = result
+                    if step.kind == "create_folder":
+                        failed_folders.add(step.uid)
+                else:
+                    dashboard_errors[step.uid] = result
+
+    if folder_errors or dashboard_errors:
+        raise GrafanaSyncError(folder_errors, dashboard_errors)
+
+
+def verified_dashboard(step: PlanStep) -> DashboardData:
+    """Get the dashboard payload of a step, checked against its digest."""
+    if step.dashboard is None:
+        raise PlanStepError(step.describe(), "the dashboard payload is missing")
+    if step.digest is not None and step.dashboard.content_digest() != step.digest:
+        raise PlanStepError(
+            step.describe(), "the dashboard payload does not match its digest"
+        )
+    return step.dashboard
@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from grafana_sync import tracing
 from grafana_sync.api.client import FOLDER_GENERAL, FOLDER_SHAREDWITHME
 from grafana_sync.api.models import (
     GetDashboardResponse,
@@ -101,16 +102,21 @@ class GrafanaRestore:
     async def restore_recursive(self, include_reports: bool = False) -> None:
         """Recursively restore all folders, dashboards and reports from backup."""
         backup = GrafanaBackup(self.grafana, self.backup_path)
-        # First restore all folders (except General)
-        for folder_uid, _, dashboards in backup.walk_backup():
-            if folder_uid not in [FOLDER_GENERAL, FOLDER_SHAREDWITHME]:
-                await self.restore_folder(folder_uid)
-            # Restore dashboards in this folder
-            for dashboard in dashboards:
-                await self.restore_dashboard(dashboard.dashboard.uid)
-
-        # Restore reports if requested
-        if include_reports:
-            for report_file in self.reports_path.glob("*.json"):
-                report_id = int(report_file.stem)
-                await self.restore_report(report_id)
+        with tracing.span("restore"):
+            # First restore all folders (except General)
+            for folder_uid, _, dashboards in backup.walk_backup():
+                if folder_uid not in [FOLDER_GENERAL, FOLDER_SHAREDWITHME]:
+                    with tracing.span("restore folder", uid=folder_uid):
+                        await self.restore_folder(folder_uid)
+                # Restore dashboards in this folder
+                for dashboard in dashboards:
+                    uid = dashboard.dashboard.uid
+                    with tracing.span("restore dashboard", uid=uid):
+                        await self.restore_dashboard(uid)
+
+            # Restore reports if requested
+            if include_reports:
+                with tracing.span("restore reports"):
+                    for report_file in self.reports_path.glob("*.json"):
+                        report_id = int(report_file.stem)
+                        await self.restore_report(report_id)
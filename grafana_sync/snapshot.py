@@ -0,0 +1,153 @@
+import logging
+from typing import TYPE_CHECKING, NamedTuple, Self
+
+from grafana_sync import tracing
+from grafana_sync.api.client import FOLDER_GENERAL
+from grafana_sync.exceptions import GrafanaApiError
+
+if TYPE_CHECKING:
+    from grafana_sync.api.client import GrafanaClient
+
+logger = logging.getLogger(__name__)
+
+# number of folder UIDs per dashboard search of a subtree snapshot
+SEARCH_FOLDER_BATCH_SIZE = 100
+
+
+class FolderEntry(NamedTuple):
+    title: str
+    parent_uid: str | None  # None for top-level folders
+
+
+class DashboardEntry(NamedTuple):
+    title: str
+    folder_uid: str  # FOLDER_GENERAL for the top-level directory
+
+
+class InstanceSnapshot:
+    """In-memory index of the folder tree and dashboards of an instance.
+
+    The snapshot is captured once with a folder walk and a paged dashboard
+    search. Afterwards existence, location and parent checks are answered
+    from memory. Changes made to the instance must be recorded with the
+    add/move/remove methods to keep the snapshot current.
+
+    A snapshot can be limited to the subtree of a folder. It is then not
+    complete: a folder or dashboard missing from it might still exist
+    elsewhere in the instance and has to be checked with a request.
+    """
+
+    def __init__(self, root_uid: str = FOLDER_GENERAL) -> None:
+        self.root_uid = root_uid
+        self.folders: dict[str, FolderEntry] = {}
+        self.dashboards: dict[str, DashboardEntry] = {}
+
+    @property
+    def complete(self) -> bool:
+        """Whether the snapshot covers the whole instance."""
+        return self.root_uid == FOLDER_GENERAL
+
+    @classmethod
+    async def capture(
+        cls,
+        grafana: "GrafanaClient",
+        walk_concurrency: int = 1,
+        folder_uid: str = FOLDER_GENERAL,
+    ) -> Self:
+        """Capture the folders and dashboards of an instance.
+
+        Args:
+            grafana: The instance to capture
+            walk_concurrency: Maximum number of folders fetched concurrently
+            folder_uid: Only capture this folder and the folders and
+                dashboards below it
+        """
+        snapshot = cls(folder_uid)
+
+        with tracing.span("capture snapshot", uid=folder_uid):
+            if not snapshot.complete:
+                try:
+                    root = await grafana.get_folder(folder_uid)
+                except GrafanaApiError as ex:
+                    if ex.status_code != 404:
+                        raise
+                    logger.info(
+                        "folder %s does not exist, nothing to capture", folder_uid
+                    )
+                    return snapshot
+                snapshot.folders[folder_uid] = FolderEntry(root.title, root.parent_uid)
+
+            async for root_uid, folders, _ in grafana.walk(
+                folder_uid,
+                recursive=True,
+                include_dashboards=False,
+                max_concurrency=walk_concurrency,
+            ):
+                parent_uid = None if root_uid == FOLDER_GENERAL else root_uid
+                for folder in folders.root:
+                    snapshot.folders[folder.uid] = FolderEntry(folder.title, parent_uid)
+
+            if snapshot.complete:
+                inventory = await grafana.get_dashboard_inventory()
+                for uid, dashboards in inventory.items():
+                    for dashboard in dashboards:
+                        snapshot.add_dashboard(dashboard.uid, dashboard.title, uid)
+            else:
+                # search only the captured folders, in batches to bound the
+                # length of the request URL
+                uids = list(snapshot.folders)
+                for i in range(0, len(uids), SEARCH_FOLDER_BATCH_SIZE):
+                    async for dashboard in grafana.iter_search_dashboards(
+                        folder_uids=uids[i : i + SEARCH_FOLDER_BATCH_SIZE]
+                    ):
+                        snapshot.add_dashboard(
+                            dashboard.uid, dashboard.title, dashboard.folder_uid
+                        )
+
+        logger.info(
+            "captured snapshot of %d folders and %d dashboards below %s",
+            len(snapshot.folders),
+            len(snapshot.dashboards),
+            folder_uid,
+        )
+        return snapshot
+
+    def add_folder(self, uid: str, title: str, parent_uid: str | None) -> None:
+        self.folders[uid] = FolderEntry(title, parent_uid)
+
+    def move_folder(self, uid: str, parent_uid: str | None) -> None:
+        if (folder := self.folders.get(uid)) is not None:
+            self.folders[uid] = folder._replace(parent_uid=parent_uid)
+
+    def add_dashboard(self, uid: str, title: str, folder_uid: str | None) -> None:
+        self.dashboards[uid] = DashboardEntry(title, folder_uid or FOLDER_GENERAL)
+
+    def remove_dashboard(self, uid: str) -> None:
+        self.dashboards.pop(uid, None)
+
+    def folder_uids(self, folder_uid: str, recursive: bool) -> set[str]:
+        """Get a folder and, if recursive, all folders below it."""
+        uids = {folder_uid}
+        if not recursive:
+            return uids
+
+        children: dict[str, list[str]] = {}
+        for uid, folder in self.folders.items():
+            children.setdefault(folder.parent_uid or FOLDER_GENERAL, []).append(uid)
+
+        stack = [folder_uid]
+        while stack:
+            for child in children.get(stack.pop(), []):
+                if child not in uids:
+                    uids.add(child)
+                    stack.append(child)
+        return uids
+
+    def dashboard_uids(self, folder_uid: str, recursive: bool) -> set[str]:
+        """Get the dashboards in a folder and, if recursive, its subfolders."""
+        folder_uids = self.folder_uids(folder_uid, recursive)
+        return {
+            uid
+            for uid, dashboard in self.dashboards.items()
+            if dashboard.folder_uid in folder_uids
+        }
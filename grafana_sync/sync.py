@@ -1,21 +1,31 @@
+import asyncio
+import hashlib
+import json
 import logging
 from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
+from grafana_sync import tracing
 from grafana_sync.api.client import FOLDER_GENERAL, FOLDER_SHAREDWITHME
 from grafana_sync.api.models import DatasourceDefinition
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY, WorkerPool
 from grafana_sync.dashboards.models import DataSource, DSRef
 from grafana_sync.datasource_mapper import map_datasources
 from grafana_sync.exceptions import (
     DashboardNotFoundError,
     DestinationParentNotFoundError,
+    FolderNotSyncedError,
+    GrafanaSyncError,
 )
+from grafana_sync.journal import JournalEntry, SyncJournal
+from grafana_sync.plan import PlanStep, SyncPlan
+from grafana_sync.snapshot import FolderEntry, InstanceSnapshot
 
 if TYPE_CHECKING:
     from rich.table import Table
 
     from grafana_sync.api.client import GrafanaClient
-    from grafana_sync.api.models import DashboardData
+    from grafana_sync.api.models import GetDashboardResponse
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,7 @@ class GrafanaSync:
     src_datasources: list[DatasourceDefinition] | None
     dst_datasources: list[DatasourceDefinition] | None
     src_ds_config: Mapping[str, DataSource] | None
+    dst_snapshot: InstanceSnapshot | None
 
     def __init__(
         self,
@@ -35,16 +46,43 @@ class GrafanaSync:
         *,
         dst_parent_uid: str | None = None,
         migrate_datasources: bool = False,
+        journal: SyncJournal | None = None,
+        plan: SyncPlan | None = None,
     ) -> None:
         self.src_grafana = src_grafana
         self.dst_grafana = dst_grafana
         self.folder_relocation_queue: dict[str, str] = {}
+        # folders that failed to be created in the destination
+        self.unsynced_folders: set[str] = set()
         self.dst_parent_uid = dst_parent_uid
         self.migrate_datasources = migrate_datasources
         self.ds_map = None
         self.src_datasources = None
         self.dst_datasources = None
         self.src_ds_config = None
+        self.dst_snapshot = None
+        self.journal = journal
+        self.plan = plan
+
+    async def get_dst_folder(self, folder_uid: str) -> FolderEntry | None:
+        """Get a destination folder, None if it does not exist.
+
+        Answered from the destination snapshot if there is one, otherwise the
+        folder is requested. A folder outside of a subtree snapshot is also
+        requested and then added to the snapshot.
+        """
+        if self.dst_snapshot is not None and (
+            folder_uid in self.dst_snapshot.folders or self.dst_snapshot.complete
+        ):
+            return self.dst_snapshot.folders.get(folder_uid)
+
+        try:
+            folder = await self.dst_grafana.get_folder(folder_uid)
+        except Exception:
+            return None
+        if self.dst_snapshot is not None:
+            self.dst_snapshot.add_folder(folder_uid, folder.title, folder.parent_uid)
+        return FolderEntry(folder.title, folder.parent_uid)
 
     async def sync_folder(
         self,
@@ -52,47 +90,60 @@ class GrafanaSync:
         can_move: bool,
         dry_run: bool,
     ) -> None:
-        """Sync a single folder from source to destination Grafana instance."""
+        """Sync a single folder from source to destination Grafana instance.
+
+        Raises:
+            FolderNotSyncedError: If the parent folder failed to be created
+            GrafanaApiError: If the folder cannot be created or updated
+        """
         src_folder = await self.src_grafana.get_folder(folder_uid)
         title = src_folder.title
         parent_uid = src_folder.parent_uid or self.dst_parent_uid or FOLDER_GENERAL
 
-        # Check if folder already exists
-        try:
-            existing_dst_folder = await self.dst_grafana.get_folder(folder_uid)
-        except Exception:
-            # Folder doesn't exist
+        if parent_uid in self.unsynced_folders:
+            self.unsynced_folders.add(folder_uid)
+            raise FolderNotSyncedError(folder_uid, parent_uid)
+
+        existing_dst_folder = await self.get_dst_folder(folder_uid)
+        if existing_dst_folder is None:
             logger.info(
                 "%s folder '%s' in destination",
                 "Would create" if dry_run else "Creating",
                 title,
             )
-            if dry_run:
-                return
-            try:
-                # Handle dst_parent_uid for top-level folders
-                if parent_uid == FOLDER_GENERAL:
-                    if self.dst_parent_uid == FOLDER_GENERAL:
-                        dst_parent_uid = None  # Explicitly place at root
-                    elif self.dst_parent_uid is not None:
-                        dst_parent_uid = self.dst_parent_uid
-                    else:
-                        dst_parent_uid = None
+            # Handle dst_parent_uid for top-level folders
+            if parent_uid == FOLDER_GENERAL:
+                if self.dst_parent_uid == FOLDER_GENERAL:
+                    dst_parent_uid = None  # Explicitly place at root
+                elif self.dst_parent_uid is not None:
+                    dst_parent_uid = self.dst_parent_uid
                 else:
-                    # Check if parent_uid is available in dst
-                    try:
-                        await self.dst_grafana.get_folder(parent_uid)
-                    except Exception:
-                        dst_parent_uid = None
-                    else:
-                        dst_parent_uid = parent_uid
+                    dst_parent_uid = None
+            # Check if parent_uid is available in dst, or will be with the plan
+            elif await self.get_dst_folder(parent_uid) is not None or (
+                self.plan is not None and self.plan.creates_folder(parent_uid)
+            ):
+                dst_parent_uid = parent_uid
+            else:
+                dst_parent_uid = None
 
-                await self.dst_grafana.create_folder(
-                    title=title, uid=folder_uid, parent_uid=dst_parent_uid
-                )
-                logger.info("Created folder '%s' (uid: %s)", title, folder_uid)
-            except Exception:
-                logger.exception("Failed to create folder '%s'", title)
+            if dry_run:
+                if self.plan is not None:
+                    self.plan.add(
+                        PlanStep(
+                            kind="create_folder",
+                            uid=folder_uid,
+                            title=title,
+                            parent_uid=dst_parent_uid,
+                        )
+                    )
+                return
+            await self.dst_grafana.create_folder(
+                title=title, uid=folder_uid, parent_uid=dst_parent_uid
+            )
+            if self.dst_snapshot is not None:
+                self.dst_snapshot.add_folder(folder_uid, title, dst_parent_uid)
+            logger.info("Created folder '%s' (uid: %s)", title, folder_uid)
         else:
             if existing_dst_folder.title != title:
                 logger.info(
@@ -100,15 +151,20 @@ class GrafanaSync:
                     "Would update" if dry_run else "Updating",
                     title,
                 )
-                if not dry_run:
-                    try:
-                        await self.dst_grafana.update_folder(
-                            uid=folder_uid,
-                            title=title,
-                            overwrite=True,
+                if dry_run and self.plan is not None:
+                    self.plan.add(
+                        PlanStep(kind="update_folder", uid=folder_uid, title=title)
+                    )
+                elif not dry_run:
+                    await self.dst_grafana.update_folder(
+                        uid=folder_uid,
+                        title=title,
+                        overwrite=True,
+                    )
+                    if self.dst_snapshot is not None:
+                        self.dst_snapshot.add_folder(
+                            folder_uid, title, existing_dst_folder.parent_uid
                         )
-                    except Exception:
-                        logger.exception("Failed to update folder '%s'", title)
 
             # check if the folder needs to be moved
             if (
@@ -118,11 +174,23 @@ class GrafanaSync:
                 # since a parent might not exist yet, we enqueue the relocations
                 self.folder_relocation_queue[folder_uid] = parent_uid
 
-    async def move_folders_to_new_parents(self, dry_run: bool = False) -> None:
+    async def move_folders_to_new_parents(
+        self, dry_run: bool = False
+    ) -> dict[str, Exception]:
+        """Move the folders queued for relocation.
+
+        Returns:
+            The exceptions of the folders that could not be moved, by uid
+        """
+        errors: dict[str, Exception] = {}
         for folder_uid, parent_uid in self.folder_relocation_queue.items():
             if folder_uid in [FOLDER_GENERAL, FOLDER_SHAREDWITHME]:
                 continue  # skip system folders
 
+            if parent_uid in self.unsynced_folders:
+                errors[folder_uid] = FolderNotSyncedError(folder_uid, parent_uid)
+                continue
+
             target_parent = parent_uid if parent_uid != FOLDER_GENERAL else None
             logger.info(
                 "%s folder '%s' to new parent '%s'",
@@ -131,34 +199,50 @@ class GrafanaSync:
                 parent_uid,
             )
 
-            if not dry_run:
+            if dry_run and self.plan is not None:
+                self.plan.add(
+                    PlanStep(
+                        kind="move_folder", uid=folder_uid, parent_uid=target_parent
+                    )
+                )
+            elif not dry_run:
                 try:
                     await self.dst_grafana.move_folder(folder_uid, target_parent)
-                except Exception:
+                except Exception as ex:
                     logger.exception(
                         "Failed to move folder '%s' to new parent '%s'",
                         folder_uid,
                         parent_uid,
                     )
+                    errors[folder_uid] = ex
                 else:
                     logger.info(
                         "Moved folder '%s' to new parent '%s'", folder_uid, parent_uid
                     )
+                    if self.dst_snapshot is not None:
+                        self.dst_snapshot.move_folder(folder_uid, target_parent)
 
         self.folder_relocation_queue.clear()
+        return errors
 
     async def get_folder_dashboards(
         self,
         grafana: "GrafanaClient",
         folder_uid: str,
         recursive: bool,
+        walk_concurrency: int = 1,
+        inventory: bool = False,
     ) -> set[str]:
         """Get all dashboard UIDs in a folder (and optionally its subfolders)."""
         dashboard_uids = set()
 
         try:
             async for _, _, dashboards in grafana.walk(
-                folder_uid, recursive, include_dashboards=True
+                folder_uid,
+                recursive,
+                include_dashboards=True,
+                max_concurrency=walk_concurrency,
+                inventory=inventory,
             ):
                 for dashboard in dashboards.root:
                     dashboard_uids.add(dashboard.uid)
@@ -167,20 +251,18 @@ class GrafanaSync:
 
         return dashboard_uids
 
-    async def delete_dashboard(self, dashboard_uid: str) -> bool:
-        """Delete a dashboard from destination Grafana instance."""
-        try:
-            await self.dst_grafana.delete_dashboard(dashboard_uid)
-        except Exception:
-            logger.exception("Failed to delete dashboard %s", dashboard_uid)
-            return False
-        else:
-            logger.info("Deleted dashboard with uid: %s", dashboard_uid)
-            return True
+    async def delete_dashboard(self, dashboard_uid: str) -> None:
+        """Delete a dashboard from destination Grafana instance.
 
-    def _clean_dashboard_for_comparison(self, dashboard_data: "DashboardData") -> dict:
-        """Remove dynamic fields from dashboard data for comparison."""
-        return dashboard_data.model_dump(exclude={"id", "version"}, by_alias=True)
+        Raises:
+            GrafanaApiError: If the dashboard cannot be deleted
+        """
+        await self.dst_grafana.delete_dashboard(dashboard_uid)
+        logger.info("Deleted dashboard with uid: %s", dashboard_uid)
+        if self.dst_snapshot is not None:
+            self.dst_snapshot.remove_dashboard(dashboard_uid)
+        if self.journal is not None:
+            self.journal.discard(dashboard_uid)
 
     async def get_src_datasources(self):
         if self.src_datasources is not None:
@@ -209,6 +291,27 @@ class GrafanaSync:
 
         return self.ds_map
 
+    async def get_datasource_digest(self) -> str:
+        """Get a digest of the datasource mapping applied to the dashboards.
+
+        Dashboards are migrated differently after a datasource was added or
+        renamed on either instance, a journal written with another mapping
+        must not be used.
+        """
+        ds_map = await self.get_ds_map()
+        src_ds_config = await self.get_src_ds_config()
+        content = json.dumps(
+            {
+                "map": {uid: ref.model_dump() for uid, ref in ds_map.items()},
+                "config": {
+                    name: ds.model_dump(by_alias=True)
+                    for name, ds in src_ds_config.items()
+                },
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
     async def get_datasource_mapping_cli_table(self) -> "Table":
         from rich.table import Table
 
@@ -253,14 +356,99 @@ class GrafanaSync:
 
         return self.src_ds_config
 
+    async def get_dst_dashboard(
+        self, dashboard_uid: str
+    ) -> "GetDashboardResponse | None":
+        """Get a destination dashboard, None if it does not exist.
+
+        Dashboards missing from a complete destination snapshot are not
+        requested.
+        """
+        if (
+            self.dst_snapshot is not None
+            and self.dst_snapshot.complete
+            and dashboard_uid not in self.dst_snapshot.dashboards
+        ):
+            return None
+
+        try:
+            return await self.dst_grafana.get_dashboard(dashboard_uid)
+        except Exception:
+            return None
+
+    async def probe_journal(
+        self, dashboard_uid: str
+    ) -> tuple[bool, JournalEntry | None]:
+        """Check which sides of a dashboard changed since it was last synced.
+
+        Only the latest versions of the source and destination dashboards are
+        requested and compared with the journal, the dashboards themselves are
+        not fetched. The source also must not have been created again since.
+
+        Returns:
+            Whether the source is unchanged, and the journal entry if the
+            destination still holds the dashboard written by the last sync
+        """
+        if self.journal is None or (entry := self.journal.get(dashboard_uid)) is None:
+            return False, None
+
+        if self.dst_snapshot is not None:
+            dst_entry = self.dst_snapshot.dashboards.get(dashboard_uid)
+            if dst_entry is None and self.dst_snapshot.complete:
+                return False, None
+            if dst_entry is not None and dst_entry.folder_uid != (
+                entry.folder_uid or FOLDER_GENERAL
+            ):
+                return False, None
+
+        try:
+            src_latest, dst_version = await asyncio.gather(
+                self.src_grafana.get_latest_dashboard_version(dashboard_uid),
+                self.dst_grafana.get_dashboard_version(dashboard_uid),
+            )
+        except Exception as ex:
+            logger.debug("Failed to probe versions of %s: %s", dashboard_uid, ex)
+            return False, None
+
+        src_unchanged = src_latest.version == entry.src_version and src_latest.saved_at(
+            entry.src_updated
+        )
+        return src_unchanged, entry if dst_version == entry.dst_version else None
+
     async def sync_dashboard(
         self,
         dashboard_uid: str,
         folder_uid: str | None = None,
         relocate=True,
         dry_run: bool = False,
+        full: bool = False,
     ) -> None:
-        """Sync a single dashboard from source to destination Grafana instance."""
+        """Sync a single dashboard from source to destination Grafana instance.
+
+        With a journal, the dashboard is skipped if neither side changed since
+        it was last synced, unless full is set.
+        """
+        if folder_uid == FOLDER_GENERAL:
+            target_folder = (
+                self.dst_parent_uid if self.dst_parent_uid != FOLDER_GENERAL else None
+            )
+        else:
+            target_folder = folder_uid
+
+        src_unchanged, synced = (
+            (False, None) if full else await self.probe_journal(dashboard_uid)
+        )
+        if (
+            src_unchanged
+            and synced is not None
+            and (synced.folder_uid == target_folder or not relocate)
+        ):
+            logger.info(
+                "Dashboard %s is unchanged since the last sync, skipping",
+                dashboard_uid,
+            )
+            return
+
         # Get dashboard from source
         src_dashboard = await self.src_grafana.get_dashboard(dashboard_uid)
         if not src_dashboard:
@@ -268,6 +456,7 @@ class GrafanaSync:
             raise DashboardNotFoundError(dashboard_uid)
 
         src_data = src_dashboard.dashboard
+        src_version = src_data.version
 
         if self.migrate_datasources:
             ds_map = await self.get_ds_map()
@@ -275,56 +464,108 @@ class GrafanaSync:
             src_data.upgrade_datasources(src_ds_config)
             src_data.update_datasources(ds_map)
 
-        if folder_uid == FOLDER_GENERAL:
-            target_folder = (
-                self.dst_parent_uid if self.dst_parent_uid != FOLDER_GENERAL else None
-            )
+        # Compare with the destination dashboard, ignoring id and version. If
+        # the destination is unchanged since the last sync, the digest of the
+        # dashboard written then is known and it is not fetched.
+        digest = src_data.content_digest()
+        if synced is not None:
+            dst_exists = True
+            dst_digest = synced.digest
+            dst_version = synced.dst_version
+            dst_folder = synced.folder_uid
+        elif (dst_dashboard := await self.get_dst_dashboard(dashboard_uid)) is not None:
+            dst_exists = True
+            dst_digest = dst_dashboard.dashboard.content_digest()
+            dst_version = dst_dashboard.dashboard.version
+            dst_folder = dst_dashboard.meta.folder_uid or None
         else:
-            target_folder = folder_uid
-
-        # Check if dashboard exists in destination
-        try:
-            dst_dashboard = await self.dst_grafana.get_dashboard(dashboard_uid)
-        except Exception:
-            # Dashboard doesn't exist in destination
-            dst_dashboard = None
-        else:
-            # Compare dashboards after cleaning
-            if self._clean_dashboard_for_comparison(
-                src_data
-            ) == self._clean_dashboard_for_comparison(dst_dashboard.dashboard) and (
-                target_folder == dst_dashboard.meta.folder_uid or not relocate
-            ):
-                logger.info(
-                    "Dashboard '%s' (uid: %s) is identical, skipping update",
-                    src_data.title,
-                    dashboard_uid,
+            dst_exists = False
+            dst_digest = dst_version = dst_folder = None
+
+        if (
+            dst_exists
+            and digest == dst_digest
+            and (
+                (target_folder or FOLDER_GENERAL) == (dst_folder or FOLDER_GENERAL)
+                or not relocate
+            )
+        ):
+            logger.info(
+                "Dashboard '%s' (uid: %s) is identical, skipping update",
+                src_data.title,
+                dashboard_uid,
+            )
+            if not dry_run:
+                self.record_dashboard(
+                    src_dashboard, src_version, dst_version, dst_folder, digest
                 )
-                return
+            return
 
-        if dst_dashboard is not None and not relocate:
-            target_folder = dst_dashboard.meta.folder_uid
+        if dst_exists and not relocate:
+            target_folder = dst_folder
 
         if dry_run:
             logger.info(
                 "Would %s dashboard '%s' (uid: %s) to folder '%s'",
-                "update" if dst_dashboard else "create",
+                "update" if dst_exists else "create",
                 src_data.title,
                 dashboard_uid,
                 target_folder or "General",
             )
+            if self.plan is not None:
+                self.plan.upsert_dashboard(
+                    src_data,
+                    None if target_folder == FOLDER_GENERAL else target_folder,
+                    digest,
+                )
         else:
-            await self.dst_grafana.update_dashboard(
+            response = await self.dst_grafana.update_dashboard(
                 src_data,
                 folder_uid=target_folder,
             )
+            if self.dst_snapshot is not None:
+                self.dst_snapshot.add_dashboard(
+                    dashboard_uid, src_data.title, target_folder
+                )
+            self.record_dashboard(
+                src_dashboard, src_version, response.version, target_folder, digest
+            )
             logger.info(
                 "%s dashboard '%s' (uid: %s)",
-                "Updated" if dst_dashboard else "Created",
+                "Updated" if dst_exists else "Created",
                 src_data.title,
                 dashboard_uid,
             )
 
+    def record_dashboard(
+        self,
+        src_dashboard: "GetDashboardResponse",
+        src_version: int | None,
+        dst_version: int | None,
+        folder_uid: str | None,
+        digest: str,
+    ) -> None:
+        """Record a synced dashboard in the journal, if there is one."""
+        if self.journal is None:
+            return
+
+        dashboard_uid = src_dashboard.dashboard.uid
+        if src_version is None or dst_version is None:
+            # without versions the dashboard can never be skipped
+            self.journal.discard(dashboard_uid)
+            return
+
+        self.journal.record(
+            dashboard_uid,
+            JournalEntry(
+                src_version=src_version,
+                src_updated=src_dashboard.meta.updated,
+                dst_version=dst_version,
+                folder_uid=None if folder_uid == FOLDER_GENERAL else folder_uid,
+                digest=digest,
+            ),
+        )
+
     async def ensure_dst_parent_exists(self) -> None:
         """Verify destination parent exists if specified."""
         if self.dst_parent_uid is not None and self.dst_parent_uid != FOLDER_GENERAL:
@@ -343,59 +584,184 @@ class GrafanaSync:
         relocate_folders: bool = True,
         relocate_dashboards: bool = True,
         dry_run: bool = False,
+        walk_concurrency: int = 1,
+        inventory: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        snapshot: bool = True,
+        full: bool = False,
     ):
+        """Sync folders and dashboards from source to destination.
+
+        Dashboards are synced by a pool of concurrency workers fed by the folder
+        walk. A failed folder or dashboard does not abort the sync, relocation
+        and pruning still run.
+
+        With snapshot, the folders and dashboards of the destination subtree
+        being synced are captured upfront, existence checks and the dashboards
+        to prune are then answered from memory instead of a request per object.
+
+        With a journal, dashboards unchanged on both sides since the last sync
+        are skipped after comparing their versions, unless full is set. The
+        journal is saved when the sync ends, also if it failed.
+
+        Raises:
+            GrafanaSyncError: If any folder or dashboard failed to sync
+        """
+        try:
+            with tracing.span("sync", folder_uid=folder_uid):
+                await self._sync(
+                    folder_uid=folder_uid,
+                    recursive=recursive,
+                    include_dashboards=include_dashboards,
+                    prune=prune,
+                    relocate_folders=relocate_folders,
+                    relocate_dashboards=relocate_dashboards,
+                    dry_run=dry_run,
+                    walk_concurrency=walk_concurrency,
+                    inventory=inventory,
+                    concurrency=concurrency,
+                    snapshot=snapshot,
+                    full=full,
+                )
+        finally:
+            if self.journal is not None and not dry_run:
+                self.journal.save()
+
+    async def _sync(
+        self,
+        *,
+        folder_uid: str,
+        recursive: bool,
+        include_dashboards: bool,
+        prune: bool,
+        relocate_folders: bool,
+        relocate_dashboards: bool,
+        dry_run: bool,
+        walk_concurrency: int,
+        inventory: bool,
+        concurrency: int,
+        snapshot: bool,
+        full: bool,
+    ) -> None:
         await self.ensure_dst_parent_exists()
 
         # Track source dashboards if pruning is enabled
         src_dashboard_uids = set()
         dst_dashboard_uids = set()
 
-        if include_dashboards and prune:
-            # Get all dashboards in destination folders before we start syncing
-            dst_dashboard_uids = await self.get_folder_dashboards(
-                self.dst_grafana, folder_uid, recursive
+        self.dst_snapshot = (
+            await InstanceSnapshot.capture(
+                self.dst_grafana, walk_concurrency, folder_uid
             )
+            if snapshot
+            else None
+        )
+
+        if include_dashboards and prune and self.dst_snapshot is not None:
+            dst_dashboard_uids = self.dst_snapshot.dashboard_uids(folder_uid, recursive)
+        elif include_dashboards and prune:
+            # Get all dashboards in destination folders before we start syncing
+            with tracing.span("collect destination dashboards"):
+                dst_dashboard_uids = await self.get_folder_dashboards(
+                    self.dst_grafana,
+                    folder_uid,
+                    recursive,
+                    walk_concurrency,
+                    inventory,
+                )
+
+        self.unsynced_folders.clear()
+        folder_errors: dict[str, Exception] = {}
+        dashboard_errors: dict[str, Exception] = {}
+
+        async def sync_folder(uid: str, can_move: bool) -> None:
+            try:
+                with tracing.span("sync folder", uid=uid):
+                    await self.sync_folder(uid, can_move=can_move, dry_run=dry_run)
+            except Exception as ex:
+                logger.exception("Failed to sync folder %s", uid)
+                folder_errors[uid] = ex
+                # the subfolders and dashboards of this folder are skipped
+                self.unsynced_folders.add(uid)
 
         # if a folder was requested sync it first
         if folder_uid != FOLDER_GENERAL:
-            await self.sync_folder(folder_uid, can_move=False, dry_run=dry_run)
+            await sync_folder(folder_uid, can_move=False)
 
-        # Now walk and sync child folders and optionally dashboards
-        async for root_uid, folders, dashboards in self.src_grafana.walk(
-            folder_uid, recursive, include_dashboards=include_dashboards
-        ):
-            for folder in folders.root:
-                if folder == FOLDER_SHAREDWITHME:
-                    continue  # skip unsyncable folder
+        async def sync_dashboard(item: tuple[str, str]) -> None:
+            dashboard_uid, dashboard_folder_uid = item
+            with tracing.span("sync dashboard", uid=dashboard_uid):
+                await self.sync_dashboard(
+                    dashboard_uid,
+                    dashboard_folder_uid,
+                    relocate=relocate_dashboards,
+                    dry_run=dry_run,
+                    full=full,
+                )
 
-                await self.sync_folder(folder.uid, can_move=True, dry_run=dry_run)
+        # Walk the source and sync folders, while a pool of workers syncs
+        # the dashboards. The folders are synced by the walk itself, so a
+        # folder exists before its dashboards are queued.
+        async with WorkerPool(sync_dashboard, concurrency) as pool:
+            async for root_uid, folders, dashboards in self.src_grafana.walk(
+                folder_uid,
+                recursive,
+                include_dashboards=include_dashboards,
+                max_concurrency=walk_concurrency,
+                inventory=inventory,
+            ):
+                for folder in folders.root:
+                    if folder == FOLDER_SHAREDWITHME:
+                        continue  # skip unsyncable folder
+
+                    await sync_folder(folder.uid, can_move=True)
 
-            # Sync dashboards if requested
-            if include_dashboards:
                 for dashboard in dashboards.root:
-                    dashboard_uid = dashboard.uid
-                    await self.sync_dashboard(
-                        dashboard_uid,
-                        root_uid,
-                        relocate=relocate_dashboards,
-                        dry_run=dry_run,
-                    )
-                    src_dashboard_uids.add(dashboard_uid)
+                    # failed dashboards still exist in the source and
+                    # must not be pruned
+                    src_dashboard_uids.add(dashboard.uid)
+                    if root_uid in self.unsynced_folders:
+                        dashboard_errors[dashboard.uid] = FolderNotSyncedError(
+                            dashboard.uid, root_uid
+                        )
+                    else:
+                        await pool.put((dashboard.uid, root_uid))
+
+        dashboard_errors.update((uid, ex) for (uid, _), ex in pool.errors)
+        for uid, ex in dashboard_errors.items():
+            logger.error("Failed to sync dashboard %s: %s", uid, ex)
 
         if relocate_folders:
             logger.info("relocation folders to updated parents if needed")
-            await self.move_folders_to_new_parents(dry_run=dry_run)
+            with tracing.span("relocate folders"):
+                folder_errors.update(
+                    await self.move_folders_to_new_parents(dry_run=dry_run)
+                )
         else:
             logger.info("skipping folder relocation (disabled)")
 
         # Prune dashboards that don't exist in source
         if include_dashboards and prune:
             dashboards_to_delete = dst_dashboard_uids - src_dashboard_uids
-            for dashboard_uid in dashboards_to_delete:
-                logger.info(
-                    "%s dashboard with uid '%s' in destination",
-                    "Would delete" if dry_run else "Deleting",
-                    dashboard_uid,
-                )
-                if not dry_run:
-                    await self.delete_dashboard(dashboard_uid)
+            with tracing.span("prune", dashboards=len(dashboards_to_delete)):
+                for dashboard_uid in dashboards_to_delete:
+                    logger.info(
+                        "%s dashboard with uid '%s' in destination",
+                        "Would delete" if dry_run else "Deleting",
+                        dashboard_uid,
+                    )
+                    if not dry_run:
+                        try:
+                            await self.delete_dashboard(dashboard_uid)
+                        except Exception as ex:
+                            logger.exception(
+                                "Failed to delete dashboard %s", dashboard_uid
+                            )
+                            dashboard_errors[dashboard_uid] = ex
+                    elif self.plan is not None:
+                        self.plan.add(
+                            PlanStep(kind="delete_dashboard", uid=dashboard_uid)
+                        )
+
+        if folder_errors or dashboard_errors:
+            raise GrafanaSyncError(folder_errors, dashboard_errors)
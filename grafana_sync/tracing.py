@@ -0,0 +1,135 @@
+"""Export of API requests and sync phases as Chrome trace events.
+
+The trace is written in the Chrome trace event format and can be opened in
+Perfetto (https://ui.perfetto.dev) or chrome://tracing. Every asyncio task
+gets its own track, so concurrent requests and phases show up side by side.
+
+Spans are only recorded while a tracer is active (see start_tracing),
+otherwise span() does nothing.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from grafana_sync.api.instrumentation import RequestRecord
+
+_tracer: "Tracer | None" = None
+
+
+def _current_task_name() -> str | None:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return task.get_name() if task is not None else None
+
+
+class Tracer:
+    """Collects complete ("X") trace events with one track per asyncio task."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.events: list[dict] = []
+        self._tids: dict[str, int] = {}
+
+    def _tid(self, task: str | None) -> int:
+        name = task or "main"
+        tid = self._tids.get(name)
+        if tid is None:
+            tid = self._tids[name] = len(self._tids) + 1
+        return tid
+
+    def add_span(
+        self,
+        name: str,
+        cat: str,
+        started: float,
+        elapsed: float,
+        task: str | None,
+        args: dict | None = None,
+    ) -> None:
+        """Record a span given its time.perf_counter() start and duration."""
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (started - self.origin) * 1e6,
+            "dur": elapsed * 1e6,
+            "pid": 1,
+            "tid": self._tid(task),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def observe_request(self, record: RequestRecord) -> None:
+        """Record an HTTP request, usable as GrafanaClient request observer."""
+        self.add_span(
+            f"{record.method} {record.endpoint}",
+            "http",
+            record.started,
+            record.elapsed,
+            record.task,
+            {
+                "status": record.status_code,
+                "bytes_sent": record.bytes_sent,
+                "bytes_received": record.bytes_received,
+            },
+        )
+
+    def to_dict(self) -> dict:
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for name, tid in self._tids.items()
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path | str) -> None:
+        with Path(path).open("w") as f:
+            json.dump(self.to_dict(), f)
+
+
+def start_tracing() -> Tracer:
+    """Activate a new tracer receiving all spans."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Deactivate and return the current tracer."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def current_tracer() -> Tracer | None:
+    return _tracer
+
+
+@contextmanager
+def span(name: str, cat: str = "phase", **args) -> Generator[None, None, None]:
+    """Record the enclosed block as a span on the track of the current task."""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+
+    task = _current_task_name()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add_span(
+            name, cat, started, time.perf_counter() - started, task, args or None
+        )
@@ -0,0 +1,55 @@
+"""Benchmark the dashboard comparison of the sync.
+
+Compares two ways to check a source and a destination dashboard for equal
+content, ignoring id and version: comparing their model_dump dicts, and
+comparing their content digests as the sync does.
+
+Usage: python scripts/bench_digest.py [dashboard.json ...]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+from grafana_sync.dashboards.models import DASHBOARD_VOLATILE_FIELDS, DashboardData
+
+DEFAULT_DASHBOARD = (
+    Path(__file__).parent.parent / "tests" / "dashboards" / "haproxy-2-full.json"
+)
+
+
+def measure(func) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def dicts_equal(a: DashboardData, b: DashboardData) -> bool:
+    return a.model_dump(exclude=DASHBOARD_VOLATILE_FIELDS, by_alias=True) == (
+        b.model_dump(exclude=DASHBOARD_VOLATILE_FIELDS, by_alias=True)
+    )
+
+
+def digests_equal(a: DashboardData, b: DashboardData) -> bool:
+    return a.content_digest() == b.content_digest()
+
+
+def bench(path: Path) -> None:
+    src = DashboardData.model_validate_json(path.read_bytes())
+    dst = DashboardData.model_validate_json(path.read_bytes())
+    print(f"{path.name} ({path.stat().st_size / 1024:.0f} KiB)")
+
+    if not dicts_equal(src, dst) or not digests_equal(src, dst):
+        msg = f"{path.name}: unexpected comparison result"
+        raise SystemExit(msg)
+
+    for label, func in [
+        ("model_dump dicts", lambda: dicts_equal(src, dst)),
+        ("content digests", lambda: digests_equal(src, dst)),
+    ]:
+        print(f"  {label:<17} {measure(func) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or [DEFAULT_DASHBOARD]:
+        bench(Path(arg))
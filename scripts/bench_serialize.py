@@ -0,0 +1,62 @@
+"""Benchmark the serialization of dashboard update requests.
+
+Compares the former two-pass encoding (``model_dump`` to a dict, then
+httpx's stdlib JSON encoder) with a single ``model_dump_json`` pass.
+
+Usage: python scripts/bench_serialize.py [dashboard.json ...]
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import httpx
+
+from grafana_sync.api.models import UpdateDashboardRequest
+from grafana_sync.dashboards.models import DashboardData
+
+DEFAULT_DASHBOARD = (
+    Path(__file__).parent.parent / "tests" / "dashboards" / "haproxy-2-full.json"
+)
+EXCLUDE = {"dashboard": {"id"}}
+
+
+def two_pass(payload: UpdateDashboardRequest) -> bytes:
+    data = payload.model_dump(exclude=EXCLUDE, by_alias=True)
+    return httpx.Request("POST", "http://grafana", json=data).content
+
+
+def single_pass(payload: UpdateDashboardRequest) -> bytes:
+    data = payload.model_dump_json(exclude=EXCLUDE, by_alias=True)
+    return httpx.Request("POST", "http://grafana", content=data).content
+
+
+def bench(path: Path) -> None:
+    payload = UpdateDashboardRequest(
+        dashboard=DashboardData.model_validate_json(path.read_bytes()),
+        overwrite=True,
+    )
+    if json.loads(two_pass(payload)) != json.loads(single_pass(payload)):
+        msg = f"{path.name}: encodings differ"
+        raise SystemExit(msg)
+
+    size = len(single_pass(payload))
+    print(f"{path.name} ({size / 1024:.0f} KiB request body)")
+
+    results = {}
+    for func in (two_pass, single_pass):
+        timer = timeit.Timer(lambda func=func: func(payload))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        results[func.__name__] = best
+        print(f"  {func.__name__:<12} {best * 1e6:10.1f} µs/dashboard")
+
+    saved = results["two_pass"] - results["single_pass"]
+    print(f"  saved        {saved * 1e6:10.1f} µs/dashboard", end="")
+    print(f" ({saved / results['two_pass']:.0%})")
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or [DEFAULT_DASHBOARD]:
+        bench(Path(arg))
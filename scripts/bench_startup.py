@@ -0,0 +1,55 @@
+"""Benchmark the startup time of the command line interface.
+
+Measures the time to import the CLI module and to create a client, each in
+a fresh interpreter, and lists the slowest imports.
+
+Usage: python scripts/bench_startup.py [runs]
+"""
+
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "import cli": "import grafana_sync.cli",
+    "create 2 clients": (
+        "from grafana_sync.api.client import GrafanaClient;"
+        "GrafanaClient('https://grafana', 'key'); GrafanaClient('https://grafana', 'key')"
+    ),
+}
+
+
+def run(statement: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - started
+
+
+def slowest_imports(statement: str, count: int = 10) -> list[tuple[int, str]]:
+    """Get the cumulative import times in µs of the slowest top-level modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        if name.startswith("   ") and not name.startswith("    "):
+            times.append((int(cumulative), name.strip()))
+    return sorted(times, reverse=True)[:count]
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = min(run("pass") for _ in range(runs))
+    print(f"interpreter startup     {baseline * 1e3:8.1f} ms")
+
+    for label, statement in STATEMENTS.items():
+        best = min(run(statement) for _ in range(runs))
+        print(f"{label:<22}  {(best - baseline) * 1e3:8.1f} ms")
+
+    print("slowest imports of the cli module:")
+    for cumulative, name in slowest_imports(STATEMENTS["import cli"]):
+        print(f"  {name:<40} {cumulative / 1e3:8.1f} ms")
@@ -2,6 +2,7 @@ import httpx
 import pytest_asyncio
 
 from grafana_sync.api.client import GrafanaClient
+from grafana_sync.concurrency import DEFAULT_CONCURRENCY
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -31,8 +32,8 @@ async def grafana(docker_ip, docker_services):
         try:
             yield client
         finally:
-            await (
-                client.delete_all_folders_and_dashboards_and_datasources()
+            await client.delete_all_folders_and_dashboards_and_datasources(
+                cascade=True, concurrency=DEFAULT_CONCURRENCY
             )  # cleanup after test
             await client.check_pristine()  # check if deletion succeeded
 
@@ -64,7 +65,7 @@ async def grafana_dst(docker_ip, docker_services):
         try:
             yield client
         finally:
-            await (
-                client.delete_all_folders_and_dashboards_and_datasources()
+            await client.delete_all_folders_and_dashboards_and_datasources(
+                cascade=True, concurrency=DEFAULT_CONCURRENCY
             )  # cleanup after test
             await client.check_pristine()  # check if deletion succeeded
@@ -0,0 +1,192 @@
+import time
+
+import httpx
+import pytest
+
+from grafana_sync.api.auth import ServiceAccountTokenAuth, SessionAuth
+from grafana_sync.api.client import GrafanaClient
+from grafana_sync.exceptions import GrafanaApiError
+
+
+class FakeLogin:
+    """Minimal Grafana login endpoint handing out numbered sessions."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.valid_session: str | None = None
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(f"{request.method} {request.url.path}")
+
+        if request.url.path == "/login":
+            self.logins += 1
+            self.valid_session = f"session-{self.logins}"
+            return httpx.Response(
+                200,
+                json={"message": "Logged in"},
+                headers={"Set-Cookie": f"grafana_session={self.valid_session}"},
+            )
+
+        if request.headers.get("Cookie") != f"grafana_session={self.valid_session}":
+            return httpx.Response(401, json={"message": "Unauthorized"})
+
+        return httpx.Response(200, json=[])
+
+
+async def test_session_auth_logs_in_once():
+    server = FakeLogin()
+    async with httpx.AsyncClient(
+        base_url="http://grafana",
+        auth=SessionAuth("http://grafana", "admin", "admin"),
+        transport=httpx.MockTransport(server),
+    ) as client:
+        for _ in range(3):
+            response = await client.get("/api/folders")
+            assert response.status_code == 200
+
+    assert server.logins == 1
+    assert server.requests[0] == "POST /login"
+
+
+async def test_session_auth_refreshes_expired_session():
+    server = FakeLogin()
+    async with httpx.AsyncClient(
+        base_url="http://grafana",
+        auth=SessionAuth("http://grafana", "admin", "admin"),
+        transport=httpx.MockTransport(server),
+    ) as client:
+        await client.get("/api/folders")
+        server.valid_session = "expired"
+
+        response = await client.get("/api/folders")
+
+    assert response.status_code == 200
+    assert server.logins == 2
+
+
+async def test_session_auth_failed_login():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"message": "Invalid username or password"})
+
+    async with httpx.AsyncClient(
+        base_url="http://grafana",
+        auth=SessionAuth("http://grafana", "admin", "wrong"),
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        with pytest.raises(GrafanaApiError, match="Invalid username or password"):
+            await client.get("/api/folders")
+
+
+async def test_service_account_token_auth():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/api/serviceaccounts/search":
+            return httpx.Response(200, json={"totalCount": 0, "serviceAccounts": []})
+        if request.url.path == "/api/serviceaccounts":
+            return httpx.Response(201, json={"id": 7})
+        if request.url.path == "/api/serviceaccounts/7/tokens":
+            return httpx.Response(200, json={"key": "glsa_token"})
+        assert request.headers["Authorization"] == "Bearer glsa_token"
+        return httpx.Response(200, json=[])
+
+    auth = ServiceAccountTokenAuth("http://grafana", "admin", "admin")
+    async with httpx.AsyncClient(
+        base_url="http://grafana", auth=auth, transport=httpx.MockTransport(handler)
+    ) as client:
+        await client.get("/api/folders")
+        await client.get("/api/folders")
+
+    assert auth.name.startswith("grafana-sync-")
+    assert requests == [
+        ("GET", "/api/serviceaccounts/search"),
+        ("POST", "/api/serviceaccounts"),
+        ("POST", "/api/serviceaccounts/7/tokens"),
+        ("GET", "/api/folders"),
+        ("GET", "/api/folders"),
+    ]
+
+    cleanup = auth.cleanup_request()
+    assert cleanup is not None
+    assert cleanup.method == "DELETE"
+    assert cleanup.url.path == "/api/serviceaccounts/7"
+
+
+async def test_service_account_token_auth_sweeps_stale_accounts():
+    old = int(time.time()) - 3600
+    accounts = [
+        {"id": 1, "name": f"grafana-sync-{old}-aaaaaaaa", "tokens": 1},
+        {"id": 2, "name": f"grafana-sync-{old}-bbbbbbbb", "tokens": 1},
+        {"id": 3, "name": f"grafana-sync-{old}-cccccccc", "tokens": 0},
+        {"id": 4, "name": f"grafana-sync-{int(time.time())}-dddddddd", "tokens": 0},
+        {"id": 5, "name": "grafana-sync-ci", "tokens": 0},
+        {"id": 6, "name": f"grafana-sync-{old}-manual", "tokens": 0},
+        {"id": 8, "name": "other-grafana-sync-account", "tokens": 0},
+    ]
+    tokens = {1: [{"hasExpired": True}], 2: [{"hasExpired": False}]}
+    deleted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/serviceaccounts/search":
+            assert request.url.params["query"] == "grafana-sync-"
+            return httpx.Response(
+                200, json={"totalCount": len(accounts), "serviceAccounts": accounts}
+            )
+        if path == "/api/serviceaccounts":
+            return httpx.Response(201, json={"id": 7})
+        if path == "/api/serviceaccounts/7/tokens":
+            return httpx.Response(200, json={"key": "glsa_token"})
+        if path.endswith("/tokens"):
+            return httpx.Response(200, json=tokens[int(path.split("/")[3])])
+        if request.method == "DELETE":
+            deleted.append(int(path.split("/")[3]))
+            return httpx.Response(200, json={"message": "Service account deleted"})
+        return httpx.Response(200, json=[])
+
+    auth = ServiceAccountTokenAuth("http://grafana", "admin", "admin")
+    async with httpx.AsyncClient(
+        base_url="http://grafana", auth=auth, transport=httpx.MockTransport(handler)
+    ) as client:
+        response = await client.get("/api/folders")
+        assert response.status_code == 200
+
+    assert deleted == [1, 3]
+
+
+async def test_service_account_token_auth_ignores_failed_sweep():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/serviceaccounts/search":
+            return httpx.Response(403, json={"message": "Permission denied"})
+        if request.url.path == "/api/serviceaccounts":
+            return httpx.Response(201, json={"id": 7})
+        if request.url.path == "/api/serviceaccounts/7/tokens":
+            return httpx.Response(200, json={"key": "glsa_token"})
+        return httpx.Response(200, json=[])
+
+    async with httpx.AsyncClient(
+        base_url="http://grafana",
+        auth=ServiceAccountTokenAuth("http://grafana", "admin", "admin"),
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        response = await client.get("/api/folders")
+        assert response.status_code == 200
+
+
+def test_unsupported_auth_mode():
+    with pytest.raises(ValueError, match="Unsupported auth mode"):
+        GrafanaClient("http://grafana", username="a", password="b", auth_mode="x")
+
+
+@pytest.mark.docker
+@pytest.mark.parametrize("auth_mode", ["session", "token"])
+async def test_login_auth_modes(grafana: GrafanaClient, auth_mode: str):
+    await grafana.create_folder(title="dummy", uid="dummy")
+
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", auth_mode=auth_mode
+    ) as client:
+        folders = await client.get_folders()
+        assert [f.uid for f in folders.root] == ["dummy"]
@@ -0,0 +1,85 @@
+import datetime
+import json
+import os
+
+from grafana_sync.api.cache import DashboardCache
+
+UPDATED = datetime.datetime(2024, 5, 1, 12, 0, 0, tzinfo=datetime.UTC)
+STAMP = int(UPDATED.timestamp())
+
+
+def dashboard_body(
+    uid: str, version: int, size: int = 0, updated: datetime.datetime = UPDATED
+) -> bytes:
+    return json.dumps(
+        {
+            "dashboard": {"uid": uid, "title": "x" * size, "version": version},
+            "meta": {"folderUid": "", "updated": updated.isoformat()},
+        }
+    ).encode()
+
+
+def test_put_and_get(tmp_path):
+    cache = DashboardCache(tmp_path)
+    body = dashboard_body("a/b", 3)
+
+    cache.put("a/b", body)
+
+    assert cache.version("a/b") == 3
+    assert cache.get("a/b", 3, UPDATED) == body
+    assert cache.get("a/b", 4, UPDATED) is None
+
+
+def test_recreated_dashboard_is_not_served(tmp_path):
+    cache = DashboardCache(tmp_path)
+    cache.put("db", dashboard_body("db", 1))
+
+    # the dashboard was deleted and created again, restarting at version 1
+    recreated = UPDATED + datetime.timedelta(minutes=5)
+
+    assert cache.get("db", 1, recreated) is None
+    assert cache.get("db", 1, UPDATED + datetime.timedelta(seconds=1)) is not None
+
+
+def test_newer_version_replaces_entry(tmp_path):
+    cache = DashboardCache(tmp_path)
+    cache.put("db", dashboard_body("db", 1))
+    cache.put("db", dashboard_body("db", 2))
+
+    assert cache.version("db") == 2
+    assert [p.name for p in tmp_path.iterdir()] == [f"db.v2.{STAMP}.json"]
+
+
+def test_entries_survive_restart(tmp_path):
+    body = dashboard_body("db.v1", 5)
+    DashboardCache(tmp_path).put("db.v1", body)
+
+    cache = DashboardCache(tmp_path)
+
+    assert cache.version("db.v1") == 5
+    assert cache.get("db.v1", 5, UPDATED) == body
+
+
+def test_discard(tmp_path):
+    cache = DashboardCache(tmp_path)
+    cache.put("db", dashboard_body("db", 1))
+
+    cache.discard("db")
+
+    assert cache.version("db") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    size = len(dashboard_body("db1", 1, 100))
+    cache = DashboardCache(tmp_path, max_bytes=2 * size)
+
+    cache.put("db1", dashboard_body("db1", 1, 100))
+    cache.put("db2", dashboard_body("db2", 1, 100))
+    os.utime(tmp_path / f"db2.v1.{STAMP}.json", (0, 0))
+    cache.get("db1", 1, UPDATED)
+    cache.put("db3", dashboard_body("db3", 1, 100))
+
+    assert cache.version("db1") == 1
+    assert cache.version("db2") is None
+    assert cache.version("db3") == 1
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from grafana_sync.checkpoint import Checkpoint
+
+
+def test_checkpoint_is_resumed(tmp_path: Path):
+    path = tmp_path / "checkpoint"
+
+    with Checkpoint(path) as checkpoint:
+        checkpoint.add("1")
+        checkpoint.add("2")
+        checkpoint.add("1")
+        assert "1" in checkpoint
+        assert "3" not in checkpoint
+
+    assert path.read_text() == "1\n2\n"
+
+    with Checkpoint(path) as checkpoint:
+        assert len(checkpoint) == 2
+        checkpoint.add("3")
+
+    assert path.read_text() == "1\n2\n3\n"
+
+
+def test_added_keys_are_flushed(tmp_path: Path):
+    path = tmp_path / "checkpoint"
+    checkpoint = Checkpoint(path)
+    checkpoint.add("1")
+
+    # readable before the checkpoint is closed, e.g. after a crash
+    assert path.read_text() == "1\n"
+    checkpoint.close()
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from asyncclick.testing import CliRunner
 
 from grafana_sync.cli import cli
@@ -9,3 +12,54 @@ async def test_version():
         result = await runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
         assert result.output.startswith("cli, version ")
+
+
+def test_startup_imports():
+    # modules only needed by some subcommands must not slow down startup
+    code = "import sys, grafana_sync.cli; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.split())
+
+    for module in [
+        "rich",
+        "grafana_sync.backup",
+        "grafana_sync.generate",
+        "grafana_sync.restore",
+        "grafana_sync.sync",
+    ]:
+        assert module not in modules
+
+
+async def test_generate_offline_without_url(tmp_path):
+    runner = CliRunner()
+    result = await runner.invoke(
+        cli, ["generate", "--num-folders", "2", "-o", str(tmp_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert any((tmp_path / "dashboards").iterdir())
+
+    result = await runner.invoke(cli, ["generate"])
+    assert result.exit_code == 2
+
+
+async def test_logout_all_rejects_token_auth():
+    runner = CliRunner()
+    result = await runner.invoke(
+        cli,
+        [
+            "--url",
+            "http://grafana",
+            "--username",
+            "admin",
+            "--password",
+            "admin",
+            "--auth-mode",
+            "token",
+            "logout-all",
+            "--yes",
+        ],
+    )
+    assert result.exit_code == 2
+    assert "server admin API" in result.output
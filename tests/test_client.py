@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from grafana_sync.api.client import GrafanaClient
+from grafana_sync.api.models import DashboardData
+from grafana_sync.exceptions import (
+    ExistingDashboardsError,
+    GrafanaApiError,
+    GrafanaNotPristineError,
+)
+from grafana_sync.generate import TestDataGenerator
+
+pytestmark = pytest.mark.docker
+
+
+async def test_connection_reuse(grafana: GrafanaClient):
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", max_keepalive=1
+    ) as client:
+        for _ in range(3):
+            await client.get_folders()
+
+        stats = client.connection_stats()
+
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reused == 2
+
+
+async def test_memoized_reads_are_invalidated_by_writes(grafana: GrafanaClient):
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", memoize=True
+    ) as client:
+        with pytest.raises(GrafanaApiError):
+            await client.get_folder("memo")
+
+        await client.create_folder(title="Memo", uid="memo")
+        assert (await client.get_folder("memo")).title == "Memo"
+
+        await client.update_folder("memo", title="Renamed", overwrite=True)
+        assert (await client.get_folder("memo")).title == "Renamed"
+
+        await client.update_dashboard(DashboardData(uid="dash1", title="Dash"), "memo")
+        assert (await client.get_dashboard("dash1")).dashboard.title == "Dash"
+
+        await client.delete_folder("memo")
+        with pytest.raises(GrafanaApiError):
+            await client.get_dashboard("dash1")
+
+
+async def test_dashboard_cache_is_validated_by_version(
+    grafana: GrafanaClient, tmp_path
+):
+    await grafana.update_dashboard(DashboardData(uid="cached", title="One"))
+
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", cache_dir=tmp_path
+    ) as client:
+        assert (await client.get_dashboard("cached")).dashboard.title == "One"
+
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", cache_dir=tmp_path
+    ) as client:
+        assert (await client.get_dashboard("cached")).dashboard.title == "One"
+
+        dashboard = (await client.get_dashboard("cached")).dashboard
+        dashboard.title = "Two"
+        await grafana.update_dashboard(dashboard)
+
+        assert (await client.get_dashboard("cached")).dashboard.title == "Two"
+
+
+async def test_dashboard_cache_ignores_recreated_dashboard(
+    grafana: GrafanaClient, tmp_path
+):
+    await grafana.update_dashboard(DashboardData(uid="cached", title="One"))
+
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", cache_dir=tmp_path
+    ) as client:
+        assert (await client.get_dashboard("cached")).dashboard.title == "One"
+
+    # the new dashboard restarts at the same version, but is saved later
+    await grafana.delete_dashboard("cached")
+    await asyncio.sleep(2)
+    await grafana.update_dashboard(DashboardData(uid="cached", title="Two"))
+
+    async with GrafanaClient(
+        grafana.url, username="admin", password="admin", cache_dir=tmp_path
+    ) as client:
+        assert (await client.get_dashboard("cached")).dashboard.title == "Two"
+
+
+async def test_get_dashboards_captures_errors(grafana: GrafanaClient):
+    for uid in ["dash1", "dash2"]:
+        await grafana.update_dashboard(DashboardData(uid=uid, title=uid))
+
+    results = {
+        uid: result
+        async for uid, result in grafana.get_dashboards(
+            ["dash1", "missing", "dash2"], concurrency=2
+        )
+    }
+
+    assert results["dash1"].dashboard.title == "dash1"
+    assert results["dash2"].dashboard.title == "dash2"
+    assert isinstance(results["missing"], GrafanaApiError)
+
+
+async def test_cascading_wipe(grafana: GrafanaClient):
+    await grafana.create_folder(title="Top", uid="top")
+    await grafana.create_folder(title="Nested", uid="nested", parent_uid="top")
+    await grafana.update_dashboard(
+        DashboardData(uid="nested-dash", title="N"), "nested"
+    )
+    await grafana.update_dashboard(DashboardData(uid="general-dash", title="G"))
+
+    await grafana.delete_all_folders_and_dashboards_and_datasources(
+        cascade=True, concurrency=4
+    )
+
+    await grafana.check_pristine()
+
+
+async def test_check_pristine_detects_content(grafana: GrafanaClient):
+    await grafana.update_dashboard(DashboardData(uid="general-dash", title="G"))
+    with pytest.raises(ExistingDashboardsError):
+        await grafana.check_pristine()
+
+    await grafana.create_folder(title="Top", uid="top")
+    with pytest.raises(GrafanaNotPristineError):
+        await grafana.check_pristine()
+
+
+async def test_generate_test_data(grafana: GrafanaClient):
+    generator = TestDataGenerator(seed=1, num_folders=3, max_dashboards=2)
+    await generator.upload(grafana, concurrency=4)
+
+    folder_uids = set()
+    async for _, subfolders, _ in grafana.walk(
+        recursive=True, include_dashboards=False
+    ):
+        folder_uids.update(f.uid for f in subfolders.root)
+    dashboards = [d async for d in grafana.iter_search_dashboards()]
+    assert folder_uids == {f.uid for f in generator.folders}
+    assert {d.uid for d in dashboards} == {uid for _, uid in generator.dashboard_uids}
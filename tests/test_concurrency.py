@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from grafana_sync.concurrency import WorkerPool, map_as_completed, run_all
+
+
+async def test_results_in_completion_order():
+    async def sleep(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    results = [r async for r in map_as_completed([0.03, 0.01, 0.02], sleep)]
+
+    assert results == [(0.01, 0.01), (0.02, 0.02), (0.03, 0.03)]
+
+
+async def test_concurrency_is_bounded():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return item
+
+    results = [r async for r in map_as_completed(range(20), work, concurrency=3)]
+
+    assert sorted(item for item, _ in results) == list(range(20))
+    assert max_in_flight == 3
+
+
+async def test_errors_are_captured():
+    async def work(item: int) -> int:
+        if item == 1:
+            msg = "boom"
+            raise ValueError(msg)
+        return item
+
+    results = dict([r async for r in map_as_completed(range(3), work)])
+
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+
+async def test_pending_calls_are_cancelled():
+    cancelled = []
+
+    async def work(item: int) -> int:
+        try:
+            await asyncio.sleep(item)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    results = map_as_completed([0, 10, 10], work)
+    async for _ in results:
+        break
+    await results.aclose()
+
+    assert cancelled == [10, 10]
+
+
+async def test_invalid_concurrency():
+    async def work(item: int) -> int:
+        return item
+
+    with pytest.raises(ValueError, match="concurrency"):
+        async for _ in map_as_completed([1], work, concurrency=0):
+            pass
+
+
+async def test_worker_pool_processes_all_items():
+    in_flight = 0
+    max_in_flight = 0
+    processed = []
+
+    async def work(item: int) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if item == 3:
+            msg = "boom"
+            raise ValueError(msg)
+        processed.append(item)
+
+    async with WorkerPool(work, concurrency=3) as pool:
+        for item in range(10):
+            await pool.put(item)
+
+    assert sorted(processed) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert max_in_flight == 3
+    [(item, error)] = pool.errors
+    assert item == 3
+    assert isinstance(error, ValueError)
+
+
+async def test_worker_pool_is_cancelled_on_error():
+    cancelled = []
+
+    async def work(item: int) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    async def produce() -> None:
+        async with WorkerPool(work, concurrency=2) as pool:
+            await pool.put(1)
+            await pool.put(2)
+            await asyncio.sleep(0)
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await produce()
+
+    assert sorted(cancelled) == [1, 2]
+
+
+async def test_run_all_raises_first_error_after_all_calls():
+    calls = []
+
+    async def func(item: int) -> None:
+        calls.append(item)
+        if item % 2:
+            raise ValueError(item)
+
+    with pytest.raises(ValueError, match="1"):
+        await run_all(range(5), func, concurrency=1)
+    assert sorted(calls) == [0, 1, 2, 3, 4]
+
+    await run_all(range(5), func, ignore=lambda ex: isinstance(ex, ValueError))
@@ -63,3 +63,24 @@ def test_parse_variable_template_datasource():
             "title": "My Dashboard",
         }
     )
+
+
+def test_content_digest_ignores_volatile_fields():
+    db = read_db("haproxy-2-full.json")
+    other = db.model_copy(update={"id": 42, "version": 7}, deep=True)
+
+    assert db.content_digest() == other.content_digest()
+
+    other.title = "Changed"
+    assert db.content_digest() != other.content_digest()
+
+
+def test_content_digest_ignores_order_of_known_fields():
+    a = DashboardData.model_validate(
+        {"uid": "db", "title": "Db", "time": {"from": "now-6h", "to": "now"}}
+    )
+    b = DashboardData.model_validate(
+        {"time": {"from": "now-6h", "to": "now"}, "title": "Db", "uid": "db"}
+    )
+
+    assert a.content_digest() == b.content_digest()
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from grafana_sync.api.models import GetDashboardResponse, GetFolderResponse
+from grafana_sync.generate import TestDataGenerator
+
+
+def test_generation_is_deterministic():
+    a = TestDataGenerator(seed=1, num_folders=10)
+    b = TestDataGenerator(seed=1, num_folders=10)
+    c = TestDataGenerator(seed=2, num_folders=10)
+
+    assert a.folders == b.folders
+    assert list(a.dashboards()) == list(b.dashboards())
+    assert list(a.dashboards()) != list(c.dashboards())
+
+
+def test_dashboard_does_not_depend_on_order():
+    generator = TestDataGenerator(seed=1, num_folders=10)
+    _, uid = generator.dashboard_uids[-1]
+
+    assert generator.dashboard(uid) == list(generator.dashboards())[-1][1]
+
+
+def test_folder_tree():
+    generator = TestDataGenerator(num_folders=20, max_depth=3)
+
+    uids = [folder.uid for folder in generator.folders]
+    assert len(set(uids)) == len(uids)
+    assert sum(folder.parent_uid is None for folder in generator.folders) == 20
+
+    # parents are generated before their children
+    seen: set[str | None] = {None}
+    for folder in generator.folders:
+        assert folder.parent_uid in seen
+        seen.add(folder.uid)
+
+    assert {folder_uid for folder_uid, _ in generator.dashboard_uids} <= seen
+
+
+def test_dashboards_are_realistic():
+    generator = TestDataGenerator(num_folders=10, datasource_uids=["prom"])
+    dashboards = [dashboard for _, dashboard in generator.dashboards()]
+
+    assert dashboards
+    for dashboard in dashboards:
+        assert dashboard.panels
+        assert dashboard.templating.list_[0].type_ == "datasource"
+
+    panels = [
+        panel
+        for dashboard in dashboards
+        for row in dashboard.panels
+        for panel in [row, *(row.panels or [])]
+    ]
+    assert any(panel.panels for panel in panels), "no collapsed rows"
+    refs = {
+        target.datasource.uid
+        for panel in panels
+        for target in panel.targets or []
+        if target.datasource is not None
+    }
+    assert refs == {"${datasource}", "prom"}
+
+
+def test_write_backup(tmp_path: Path):
+    generator = TestDataGenerator(num_folders=3)
+    generator.write_backup(tmp_path)
+
+    folder_files = sorted((tmp_path / "folders").glob("*.json"))
+    dashboard_files = sorted((tmp_path / "dashboards").glob("*.json"))
+    assert len(folder_files) == len(generator.folders)
+    assert len(dashboard_files) == len(generator.dashboard_uids)
+
+    folder = GetFolderResponse.model_validate_json(folder_files[0].read_text())
+    assert folder.uid == generator.folders[0].uid
+
+    folder_uid, uid = generator.dashboard_uids[0]
+    dashboard = GetDashboardResponse.model_validate_json(
+        (tmp_path / "dashboards" / f"{uid}.json").read_text()
+    )
+    assert dashboard.dashboard == generator.dashboard(uid)
+    assert dashboard.meta.folder_uid == (folder_uid or "")
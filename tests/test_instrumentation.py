@@ -0,0 +1,91 @@
+import logging
+
+import httpx
+import pytest
+
+from grafana_sync.api.instrumentation import (
+    RequestHooks,
+    RequestRecord,
+    endpoint_template,
+    truncate_body,
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "endpoint"),
+    [
+        ("/api/folders", "/api/folders"),
+        ("/api/folders/abc", "/api/folders/{uid}"),
+        ("/api/folders/abc/move", "/api/folders/{uid}/move"),
+        ("/api/dashboards/uid/a.b/versions", "/api/dashboards/uid/{uid}/versions"),
+        ("/api/dashboards/db", "/api/dashboards/db"),
+        ("/api/reports/12", "/api/reports/{id}"),
+        ("/api/admin/users/3/logout", "/api/admin/users/{id}/logout"),
+        ("/api/users/search", "/api/users/search"),
+    ],
+)
+def test_endpoint_template(path, endpoint):
+    assert endpoint_template(path) == endpoint
+
+
+def test_truncate_body():
+    assert truncate_body(b"", 4) == "None"
+    assert truncate_body(b"abcd", 4) == "abcd"
+    assert truncate_body(b"abcdef", 4) == "abcd... (6 bytes)"
+
+
+def make_client(hooks: RequestHooks) -> httpx.AsyncClient:
+    async def body():
+        yield b"x" * 100
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # a streamed body, which is not read before the hooks run
+        return httpx.Response(200, content=body())
+
+    return httpx.AsyncClient(
+        base_url="http://grafana",
+        transport=httpx.MockTransport(handler),
+        event_hooks=hooks.event_hooks,
+    )
+
+
+async def test_observers_receive_records():
+    hooks = RequestHooks()
+    records: list[RequestRecord] = []
+    hooks.observers.append(records.append)
+
+    async with make_client(hooks) as client:
+        response = await client.put("/api/folders/abc", content=b"{}")
+
+    assert response.content == b"x" * 100
+    [record] = records
+    assert record.method == "PUT"
+    assert record.endpoint == "/api/folders/{uid}"
+    assert record.status_code == 200
+    assert record.bytes_sent == 2
+    assert record.bytes_received == 100
+    assert record.elapsed >= 0
+    assert record.task is not None
+
+
+async def test_debug_log_is_truncated(caplog):
+    caplog.set_level(logging.DEBUG, logger="grafana_sync.api.instrumentation")
+
+    async with make_client(RequestHooks(log_body_limit=10)) as client:
+        await client.get("/api/folders")
+
+    [message] = caplog.messages
+    assert "Response Body: xxxxxxxxxx... (100 bytes)" in message
+
+
+async def test_no_work_without_debug_and_observers(caplog):
+    caplog.set_level(logging.INFO)
+
+    async with (
+        make_client(RequestHooks()) as client,
+        client.stream("GET", "/api/folders") as response,
+    ):
+        # the hooks did not read the body
+        assert not response.is_stream_consumed
+
+    assert not [r for r in caplog.records if r.name.startswith("grafana_sync")]
@@ -0,0 +1,53 @@
+import datetime
+from pathlib import Path
+
+from grafana_sync.journal import JournalEntry, SyncJournal
+
+SCOPE = {"source": "http://src", "destination": "http://dst"}
+
+
+def entry(src_version: int = 1) -> JournalEntry:
+    return JournalEntry(
+        src_version=src_version,
+        src_updated=datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC),
+        dst_version=2,
+        folder_uid=None,
+        digest="abc",
+    )
+
+
+def test_journal_is_saved_and_loaded(tmp_path: Path):
+    path = tmp_path / "state" / "journal.json"
+
+    journal = SyncJournal(path, SCOPE)
+    assert len(journal) == 0
+    journal.record("dash1", entry())
+    journal.record("dash2", entry())
+    journal.discard("dash2")
+    journal.save()
+
+    journal = SyncJournal(path, SCOPE)
+    assert len(journal) == 1
+    assert journal.get("dash1") == entry()
+    assert journal.get("dash2") is None
+
+
+def test_journal_of_another_scope_is_ignored(tmp_path: Path):
+    path = tmp_path / "journal.json"
+    journal = SyncJournal(path, SCOPE)
+    journal.record("dash1", entry())
+    journal.save()
+
+    assert len(SyncJournal(path, {**SCOPE, "destination": "http://other"})) == 0
+
+
+def test_unreadable_journal_is_ignored(tmp_path: Path):
+    path = tmp_path / "journal.json"
+    path.write_text("{not json")
+
+    journal = SyncJournal(path, SCOPE)
+    assert len(journal) == 0
+
+    journal.record("dash1", entry())
+    journal.save()
+    assert SyncJournal(path, SCOPE).get("dash1") == entry()
@@ -1,6 +1,10 @@
+from pathlib import Path
+from uuid import uuid4
+
 import pytest
 
 from grafana_sync.api.client import GrafanaClient
+from grafana_sync.checkpoint import Checkpoint
 from grafana_sync.exceptions import GrafanaApiError
 
 pytestmark = pytest.mark.docker
@@ -13,3 +17,43 @@ async def test_logout_all_fails_without_skip(grafana: GrafanaClient):
 
 async def test_logout_all_succeeds_with_skip(grafana: GrafanaClient):
     await grafana.logout_all_users(skip_username="admin")
+
+
+async def test_logout_all_is_resumable(grafana: GrafanaClient, tmp_path: Path):
+    user_ids = []
+    for i in range(3):
+        response = await grafana.client.post(
+            "/api/admin/users",
+            json={
+                "login": f"logout-{uuid4().hex}",
+                "email": f"logout-{i}-{uuid4().hex}@example.com",
+                "password": "password123",
+            },
+        )
+        response.raise_for_status()
+        user_ids.append(response.json()["id"])
+
+    try:
+        with Checkpoint(tmp_path / "checkpoint") as checkpoint:
+            result = await grafana.logout_all_users(
+                skip_username="admin", concurrency=2, checkpoint=checkpoint
+            )
+            assert result.logged_out == result.total - 1
+            assert {str(user_id) for user_id in user_ids} <= checkpoint.keys
+
+        with Checkpoint(tmp_path / "checkpoint") as checkpoint:
+            result = await grafana.logout_all_users(
+                skip_username="admin", checkpoint=checkpoint
+            )
+            assert result.logged_out == 0
+            assert result.skipped == result.total
+    finally:
+        for user_id in user_ids:
+            await grafana.client.delete(f"/api/admin/users/{user_id}")
+
+
+async def test_logout_all_collects_failures(grafana: GrafanaClient):
+    result = await grafana.logout_all_users(raise_on_error=False)
+
+    assert "admin" in result.failed
+    assert result.processed == result.total
@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+
+from grafana_sync.api.memo import RequestMemo
+
+
+def make_fetch(responses: list[httpx.Response]):
+    calls = []
+
+    async def fetch() -> httpx.Response:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return responses.pop(0)
+
+    return fetch, calls
+
+
+async def test_concurrent_requests_are_coalesced():
+    memo = RequestMemo()
+    fetch, calls = make_fetch([httpx.Response(200, json={})])
+
+    responses = await asyncio.gather(*[memo.get("key", fetch) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(r.status_code == 200 for r in responses)
+    assert (memo.hits, memo.misses) == (4, 1)
+
+
+async def test_not_found_is_cached():
+    memo = RequestMemo()
+    fetch, calls = make_fetch([httpx.Response(404), httpx.Response(200)])
+
+    assert (await memo.get("key", fetch)).status_code == 404
+    assert (await memo.get("key", fetch)).status_code == 404
+    assert len(calls) == 1
+
+    memo.invalidate("key")
+    assert (await memo.get("key", fetch)).status_code == 200
+
+
+async def test_server_errors_are_not_cached():
+    memo = RequestMemo()
+    fetch, calls = make_fetch([httpx.Response(500), httpx.Response(200)])
+
+    assert (await memo.get("key", fetch)).status_code == 500
+    assert (await memo.get("key", fetch)).status_code == 200
+    assert len(calls) == 2
+
+
+async def test_invalidate_prefix():
+    memo = RequestMemo()
+    fetch, calls = make_fetch([httpx.Response(200) for _ in range(4)])
+
+    await memo.get("/api/folders/a", fetch)
+    await memo.get("/api/dashboards/uid/b", fetch)
+    memo.invalidate_prefix("/api/folders/")
+    await memo.get("/api/folders/a", fetch)
+    await memo.get("/api/dashboards/uid/b", fetch)
+
+    assert len(calls) == 3
+
+
+async def test_unkept_responses_are_only_coalesced():
+    memo = RequestMemo()
+    fetch, calls = make_fetch([httpx.Response(200) for _ in range(2)])
+
+    await asyncio.gather(*[memo.get("key", fetch, keep=False) for _ in range(3)])
+    assert len(calls) == 1
+
+    await memo.get("key", fetch, keep=False)
+    assert len(calls) == 2
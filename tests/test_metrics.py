@@ -0,0 +1,52 @@
+import pytest
+
+from grafana_sync.api.instrumentation import RequestRecord
+from grafana_sync.api.metrics import ApiMetrics, percentile
+
+
+def record(endpoint: str, status_code: int = 200, elapsed: float = 0.1):
+    return RequestRecord(
+        method="GET",
+        endpoint=endpoint,
+        status_code=status_code,
+        started=0.0,
+        elapsed=elapsed,
+        bytes_sent=10,
+        bytes_received=100,
+        task=None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("p", "expected"),
+    [(0, 1.0), (50, 50.0), (95, 95.0), (99, 99.0), (100, 100.0)],
+)
+def test_percentile(p, expected):
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, p) == expected
+
+
+def test_percentile_empty():
+    assert percentile([], 50) == 0.0
+
+
+def test_metrics_per_endpoint():
+    metrics = ApiMetrics()
+    for i in range(1, 11):
+        metrics(record("/api/folders", elapsed=i / 100))
+    metrics(record("/api/folders/{uid}", status_code=404))
+
+    folders = metrics.endpoints["GET /api/folders"]
+    assert folders.count == 10
+    assert folders.status_codes == {200: 10}
+    assert folders.latency_percentiles() == {50: 0.05, 95: 0.1, 99: 0.1}
+    assert folders.bytes_sent == 100
+    assert folders.bytes_received == 1000
+
+    total = metrics.total()
+    assert total.count == 11
+    assert total.status_codes == {200: 10, 404: 1}
+
+    data = metrics.to_dict()
+    assert list(data["endpoints"]) == ["GET /api/folders", "GET /api/folders/{uid}"]
+    assert data["total"]["status_codes"] == {"200": 10, "404": 1}
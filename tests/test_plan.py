@@ -0,0 +1,76 @@
+import importlib.resources
+from pathlib import Path
+
+import pytest
+
+from grafana_sync.dashboards.models import DashboardData
+from grafana_sync.exceptions import PlanStepError
+from grafana_sync.plan import PlanStep, SyncPlan, verified_dashboard
+
+from . import dashboards
+
+
+def read_db(filename: str) -> DashboardData:
+    ref = importlib.resources.files(dashboards) / filename
+    with importlib.resources.as_file(ref) as path, open(path, "rb") as f:
+        return DashboardData.model_validate_json(f.read())
+
+
+def test_levels_respect_dependencies():
+    plan = SyncPlan(source="src", destination="dst")
+    plan.upsert_dashboard(DashboardData(uid="dash1", title="D1"), "child")
+    plan.add(PlanStep(kind="create_folder", uid="child", parent_uid="top"))
+    plan.add(PlanStep(kind="create_folder", uid="top", parent_uid=None))
+    plan.add(PlanStep(kind="move_folder", uid="moved", parent_uid="top"))
+    plan.add(PlanStep(kind="delete_dashboard", uid="dash2"))
+    plan.upsert_dashboard(DashboardData(uid="dash3", title="D3"), "existing")
+
+    levels = [[step.uid for step in level] for level in plan.levels()]
+
+    assert levels == [
+        ["top", "dash2", "dash3"],
+        ["child", "moved"],
+        ["dash1"],
+    ]
+
+
+def test_plan_roundtrip_keeps_digests(tmp_path: Path):
+    plan = SyncPlan(source="src", destination="dst")
+    plan.upsert_dashboard(read_db("haproxy-2-full.json"), None)
+    plan.save(tmp_path / "plan.json")
+
+    loaded = SyncPlan.load(tmp_path / "plan.json")
+
+    assert loaded.steps[0].kind == "upsert_dashboard"
+    assert verified_dashboard(loaded.steps[0]) == plan.steps[0].dashboard
+
+
+def test_modified_payload_is_rejected():
+    plan = SyncPlan(source="src", destination="dst")
+    plan.upsert_dashboard(DashboardData(uid="dash1", title="D1"), None)
+    step = plan.steps[0]
+    assert step.dashboard is not None
+    step.dashboard.title = "Modified"
+
+    with pytest.raises(PlanStepError, match="does not match its digest"):
+        verified_dashboard(step)
+
+
+def test_unsupported_format_version(tmp_path: Path):
+    path = tmp_path / "plan.json"
+    SyncPlan(source="src", destination="dst", format_version=99).save(path)
+
+    with pytest.raises(ValueError, match="Unsupported plan format version 99"):
+        SyncPlan.load(path)
+
+
+def test_creates_folder(tmp_path: Path):
+    plan = SyncPlan(source="src", destination="dst")
+    plan.add(PlanStep(kind="create_folder", uid="top"))
+    plan.add(PlanStep(kind="move_folder", uid="moved", parent_uid="top"))
+
+    assert plan.creates_folder("top")
+    assert not plan.creates_folder("moved")
+
+    plan.save(tmp_path / "plan.json")
+    assert SyncPlan.load(tmp_path / "plan.json").creates_folder("top")
@@ -2,7 +2,7 @@ import importlib.resources
 
 import pytest
 
-from grafana_sync.api.models import GetDashboardResponse
+from grafana_sync.api.models import GetDashboardMetaResponse, GetDashboardResponse
 
 from . import responses
 
@@ -21,3 +21,23 @@ def read_response(filename: str) -> GetDashboardResponse:
 )
 def test_read(filename):
     read_response(filename)
+
+
+@pytest.mark.parametrize(
+    ("filename"),
+    [
+        ("get-dashboard-datasource-string.json"),
+        ("get-dashboard-panel-target.json"),
+    ],
+)
+def test_read_meta(filename):
+    full = read_response(filename)
+
+    ref = importlib.resources.files(responses) / filename
+    with importlib.resources.as_file(ref) as path, open(path, "rb") as f:
+        summary = GetDashboardMetaResponse.model_validate_json(f.read())
+
+    assert summary.dashboard.uid == full.dashboard.uid
+    assert summary.dashboard.title == full.dashboard.title
+    assert summary.dashboard.version == full.dashboard.version
+    assert summary.meta == full.meta
@@ -0,0 +1,43 @@
+from grafana_sync.api.client import FOLDER_GENERAL
+from grafana_sync.snapshot import InstanceSnapshot
+
+
+def make_snapshot() -> InstanceSnapshot:
+    snapshot = InstanceSnapshot()
+    snapshot.add_folder("a", "A", None)
+    snapshot.add_folder("b", "B", "a")
+    snapshot.add_folder("c", "C", "b")
+    snapshot.add_folder("d", "D", None)
+    snapshot.add_dashboard("root", "Root", None)
+    snapshot.add_dashboard("in-a", "In A", "a")
+    snapshot.add_dashboard("in-c", "In C", "c")
+    snapshot.add_dashboard("in-d", "In D", "d")
+    return snapshot
+
+
+def test_dashboard_uids():
+    snapshot = make_snapshot()
+
+    assert snapshot.dashboard_uids("a", recursive=False) == {"in-a"}
+    assert snapshot.dashboard_uids("a", recursive=True) == {"in-a", "in-c"}
+    assert snapshot.dashboard_uids(FOLDER_GENERAL, recursive=False) == {"root"}
+    assert snapshot.dashboard_uids(FOLDER_GENERAL, recursive=True) == {
+        "root",
+        "in-a",
+        "in-c",
+        "in-d",
+    }
+    assert snapshot.dashboard_uids("missing", recursive=True) == set()
+
+
+def test_changes_are_tracked():
+    snapshot = make_snapshot()
+
+    snapshot.move_folder("b", "d")
+    snapshot.remove_dashboard("in-a")
+    snapshot.add_dashboard("new", "New", "b")
+
+    assert snapshot.folders["b"].parent_uid == "d"
+    assert snapshot.dashboards["root"].folder_uid == FOLDER_GENERAL
+    assert snapshot.dashboard_uids("a", recursive=True) == set()
+    assert snapshot.dashboard_uids("d", recursive=True) == {"in-c", "in-d", "new"}
@@ -1,5 +1,7 @@
+import asyncio
 import importlib.resources
 import io
+import logging
 
 import pytest
 from rich import box
@@ -12,7 +14,14 @@ from grafana_sync.api.models import (
     GetDashboardResponse,
 )
 from grafana_sync.dashboards.models import DataSource
-from grafana_sync.exceptions import DestinationParentNotFoundError, GrafanaApiError
+from grafana_sync.exceptions import (
+    DestinationParentNotFoundError,
+    GrafanaApiError,
+    GrafanaSyncError,
+)
+from grafana_sync.journal import SyncJournal
+from grafana_sync.plan import SyncPlan, apply_plan
+from grafana_sync.snapshot import InstanceSnapshot
 from grafana_sync.sync import GrafanaSync
 
 from . import dashboards, responses
@@ -696,3 +705,272 @@ async def test_sync_table_output(grafana: GrafanaClient, grafana_dst: GrafanaCli
 +------------------------------------------------------------------------------+
 """
     )
+
+
+async def test_sync_continues_after_failures(
+    grafana: GrafanaClient, grafana_dst: GrafanaClient
+):
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="Dashboard 1"))
+    await grafana.update_dashboard(DashboardData(uid="dash2", title="Dashboard 2"))
+    # a different dashboard with the same title blocks the sync of dash1
+    await grafana_dst.update_dashboard(DashboardData(uid="other", title="Dashboard 1"))
+
+    syncer = GrafanaSync(src_grafana=grafana, dst_grafana=grafana_dst)
+    with pytest.raises(GrafanaSyncError) as excinfo:
+        await syncer.sync(concurrency=2)
+
+    assert set(excinfo.value.dashboard_errors) == {"dash1"}
+    assert not excinfo.value.folder_errors
+    assert (await grafana_dst.get_dashboard("dash2")).dashboard.title == "Dashboard 2"
+
+
+async def test_snapshot_capture(grafana: GrafanaClient):
+    await grafana.create_folder(title="Top", uid="top")
+    await grafana.create_folder(title="Nested", uid="nested", parent_uid="top")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "nested")
+    await grafana.update_dashboard(DashboardData(uid="dash2", title="D2"))
+
+    snapshot = await InstanceSnapshot.capture(grafana)
+
+    assert snapshot.folders["top"] == ("Top", None)
+    assert snapshot.folders["nested"] == ("Nested", "top")
+    assert snapshot.dashboards["dash1"] == ("D1", "nested")
+    assert snapshot.dashboards["dash2"] == ("D2", FOLDER_GENERAL)
+
+
+async def test_snapshot_capture_subtree(grafana: GrafanaClient):
+    await grafana.create_folder(title="Top", uid="top")
+    await grafana.create_folder(title="Nested", uid="nested", parent_uid="top")
+    await grafana.create_folder(title="Other", uid="other")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "nested")
+    await grafana.update_dashboard(DashboardData(uid="dash2", title="D2"), "other")
+
+    snapshot = await InstanceSnapshot.capture(grafana, folder_uid="top")
+
+    assert not snapshot.complete
+    assert snapshot.folders == {
+        "top": ("Top", None),
+        "nested": ("Nested", "top"),
+    }
+    assert snapshot.dashboards == {"dash1": ("D1", "nested")}
+
+    missing = await InstanceSnapshot.capture(grafana, folder_uid="missing")
+    assert not missing.folders
+    assert not missing.dashboards
+
+
+async def test_sync_folder_with_subtree_snapshot(
+    grafana: GrafanaClient, grafana_dst: GrafanaClient
+):
+    await grafana.create_folder(title="Top", uid="top")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "top")
+
+    # dash1 exists outside of the synced subtree in the destination
+    await grafana_dst.create_folder(title="Top", uid="top")
+    await grafana_dst.create_folder(title="Elsewhere", uid="elsewhere")
+    await grafana_dst.update_dashboard(
+        DashboardData(uid="dash1", title="D1"), "elsewhere"
+    )
+    await grafana_dst.update_dashboard(DashboardData(uid="stale", title="S"), "top")
+
+    syncer = GrafanaSync(src_grafana=grafana, dst_grafana=grafana_dst)
+    await syncer.sync(folder_uid="top", prune=True, relocate_dashboards=False)
+
+    assert syncer.dst_snapshot is not None
+    assert "elsewhere" not in syncer.dst_snapshot.folders
+    dash1 = await grafana_dst.get_dashboard("dash1")
+    assert dash1.meta.folder_uid == "elsewhere"
+    with pytest.raises(GrafanaApiError):
+        await grafana_dst.get_dashboard("stale")
+
+
+async def test_sync_journal(
+    grafana: GrafanaClient,
+    grafana_dst: GrafanaClient,
+    tmp_path,
+    caplog: pytest.LogCaptureFixture,
+):
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="Dashboard 1"))
+    await grafana.update_dashboard(DashboardData(uid="dash2", title="Dashboard 2"))
+    path = tmp_path / "journal.json"
+
+    async def sync(full: bool = False) -> None:
+        journal = SyncJournal(path, {"source": "src", "destination": "dst"})
+        syncer = GrafanaSync(grafana, grafana_dst, journal=journal)
+        await syncer.sync(full=full)
+
+    await sync()
+    assert len(SyncJournal(path, {"source": "src", "destination": "dst"})) == 2
+
+    # a dashboard changed in the destination is synced again
+    await grafana_dst.update_dashboard(DashboardData(uid="dash2", title="Changed"))
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        await sync()
+
+    assert "Dashboard dash1 is unchanged since the last sync" in caplog.text
+    assert "Dashboard dash2 is unchanged" not in caplog.text
+    assert (await grafana_dst.get_dashboard("dash2")).dashboard.title == "Dashboard 2"
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        await sync(full=True)
+
+    assert "unchanged since the last sync" not in caplog.text
+
+
+async def test_sync_journal_compares_changed_source_with_digest(
+    grafana: GrafanaClient,
+    grafana_dst: GrafanaClient,
+    tmp_path,
+    caplog: pytest.LogCaptureFixture,
+):
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="Dashboard 1"))
+    path = tmp_path / "journal.json"
+
+    async def sync() -> None:
+        journal = SyncJournal(path, {"source": "src", "destination": "dst"})
+        await GrafanaSync(grafana, grafana_dst, journal=journal).sync()
+
+    await sync()
+
+    # saving the source again creates a version with the same content
+    await grafana.update_dashboard((await grafana.get_dashboard("dash1")).dashboard)
+    dst_requests = []
+    grafana_dst.add_request_observer(dst_requests.append)
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        await sync()
+
+    assert "Dashboard 'Dashboard 1' (uid: dash1) is identical" in caplog.text
+    # only the version of the destination dashboard was requested
+    assert ("GET", "/api/dashboards/uid/{uid}") not in {
+        (r.method, r.endpoint) for r in dst_requests
+    }
+
+
+async def test_sync_journal_detects_recreated_source(
+    grafana: GrafanaClient,
+    grafana_dst: GrafanaClient,
+    tmp_path,
+):
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="Dashboard 1"))
+    path = tmp_path / "journal.json"
+
+    async def sync() -> None:
+        journal = SyncJournal(path, {"source": "src", "destination": "dst"})
+        await GrafanaSync(grafana, grafana_dst, journal=journal).sync()
+
+    await sync()
+
+    # the new dashboard restarts at the same version, but is saved later
+    await grafana.delete_dashboard("dash1")
+    await asyncio.sleep(2)
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="Recreated"))
+    await sync()
+
+    assert (await grafana_dst.get_dashboard("dash1")).dashboard.title == "Recreated"
+
+
+async def test_datasource_digest_changes_with_mapping(
+    grafana: GrafanaClient, grafana_dst: GrafanaClient
+):
+    await grafana.create_datasource(
+        DatasourceDefinition(
+            name="prometheus", uid="src-uid", type="prometheus", access="proxy"
+        )
+    )
+
+    async def digest() -> str:
+        syncer = GrafanaSync(grafana, grafana_dst, migrate_datasources=True)
+        return await syncer.get_datasource_digest()
+
+    unmapped = await digest()
+    assert await digest() == unmapped
+
+    await grafana_dst.create_datasource(
+        DatasourceDefinition(
+            name="prometheus", uid="dst-uid", type="prometheus", access="proxy"
+        )
+    )
+
+    assert await digest() != unmapped
+
+
+async def test_plan_and_apply(grafana: GrafanaClient, grafana_dst: GrafanaClient):
+    await grafana.create_folder(title="Top", uid="top")
+    await grafana.create_folder(title="Nested", uid="nested", parent_uid="top")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "nested")
+    await grafana.update_dashboard(DashboardData(uid="dash2", title="D2"))
+    await grafana_dst.update_dashboard(DashboardData(uid="stale", title="Stale"))
+
+    plan = SyncPlan(source="src", destination="dst")
+    syncer = GrafanaSync(grafana, grafana_dst, plan=plan)
+    await syncer.sync(prune=True, dry_run=True)
+
+    assert {(step.kind, step.uid) for step in plan.steps} == {
+        ("create_folder", "top"),
+        ("create_folder", "nested"),
+        ("upsert_dashboard", "dash1"),
+        ("upsert_dashboard", "dash2"),
+        ("delete_dashboard", "stale"),
+    }
+    # planning does not modify the destination
+    assert (await grafana_dst.get_dashboard("stale")).dashboard.title == "Stale"
+
+    await apply_plan(grafana_dst, plan)
+
+    assert (await grafana_dst.get_folder("nested")).parent_uid == "top"
+    dash1 = await grafana_dst.get_dashboard("dash1")
+    assert dash1.meta.folder_uid == "nested"
+    with pytest.raises(GrafanaApiError):
+        await grafana_dst.get_dashboard("stale")
+
+    replan = SyncPlan(source="src", destination="dst")
+    syncer = GrafanaSync(grafana, grafana_dst, plan=replan)
+    await syncer.sync(prune=True, dry_run=True)
+    assert replan.steps == []
+
+
+async def test_sync_skips_children_of_failed_folder(
+    grafana: GrafanaClient, grafana_dst: GrafanaClient
+):
+    await grafana.create_folder(title="Blocked", uid="blocked")
+    await grafana.create_folder(title="Child", uid="child", parent_uid="blocked")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "child")
+    await grafana.create_folder(title="Leaf", uid="leaf")
+    # a different folder with the same title blocks the creation of "blocked"
+    await grafana_dst.create_folder(title="Blocked", uid="other")
+
+    syncer = GrafanaSync(src_grafana=grafana, dst_grafana=grafana_dst)
+    with pytest.raises(GrafanaSyncError) as excinfo:
+        await syncer.sync()
+
+    assert set(excinfo.value.folder_errors) == {"blocked", "child"}
+    assert set(excinfo.value.dashboard_errors) == {"dash1"}
+    assert await grafana_dst.get_folder("leaf")
+    # the children are not created at the top level instead
+    with pytest.raises(GrafanaApiError):
+        await grafana_dst.get_folder("child")
+
+
+async def test_sync_skips_children_of_failed_root_folder(
+    grafana: GrafanaClient, grafana_dst: GrafanaClient
+):
+    await grafana.create_folder(title="Root", uid="root")
+    await grafana.create_folder(title="Child", uid="child", parent_uid="root")
+    await grafana.update_dashboard(DashboardData(uid="dash1", title="D1"), "root")
+    # the existing root folder cannot be renamed to the title of another one
+    await grafana_dst.create_folder(title="Old", uid="root")
+    await grafana_dst.create_folder(title="Root", uid="other")
+
+    syncer = GrafanaSync(src_grafana=grafana, dst_grafana=grafana_dst)
+    with pytest.raises(GrafanaSyncError) as excinfo:
+        await syncer.sync(folder_uid="root")
+
+    assert set(excinfo.value.folder_errors) == {"root", "child"}
+    assert set(excinfo.value.dashboard_errors) == {"dash1"}
+    with pytest.raises(GrafanaApiError):
+        await grafana_dst.get_folder("child")
+    with pytest.raises(GrafanaApiError):
+        await grafana_dst.get_dashboard("dash1")
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from grafana_sync import tracing
+from grafana_sync.api.instrumentation import RequestRecord
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.start_tracing()
+    yield tracer
+    tracing.stop_tracing()
+
+
+def test_span_without_tracer():
+    assert tracing.current_tracer() is None
+    with tracing.span("noop"):
+        pass
+
+
+async def test_spans_per_task(tracer: tracing.Tracer):
+    async def work(name: str) -> None:
+        with tracing.span("work", uid=name):
+            await asyncio.sleep(0.01)
+
+    with tracing.span("outer"):
+        await asyncio.gather(
+            asyncio.create_task(work("a"), name="worker-a"),
+            asyncio.create_task(work("b"), name="worker-b"),
+        )
+
+    spans = {e["args"]["uid"] if "args" in e else e["name"]: e for e in tracer.events}
+    assert spans.keys() == {"a", "b", "outer"}
+    assert len({e["tid"] for e in tracer.events}) == 3
+    assert spans["outer"]["dur"] >= spans["a"]["dur"] >= 10_000
+    assert spans["a"]["ph"] == "X"
+
+    threads = {
+        e["args"]["name"] for e in tracer.to_dict()["traceEvents"] if e["ph"] == "M"
+    }
+    assert {"worker-a", "worker-b"} <= threads
+
+
+def test_observe_request(tracer: tracing.Tracer, tmp_path):
+    tracer.observe_request(
+        RequestRecord(
+            method="GET",
+            endpoint="/api/folders/{uid}",
+            status_code=200,
+            started=tracer.origin + 1,
+            elapsed=0.5,
+            bytes_sent=0,
+            bytes_received=42,
+            task="Task-1",
+        )
+    )
+    tracer.write(tmp_path / "trace.json")
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    [event] = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert event["name"] == "GET /api/folders/{uid}"
+    assert event["cat"] == "http"
+    assert event["ts"] == pytest.approx(1e6)
+    assert event["dur"] == pytest.approx(5e5)
+    assert event["args"]["status"] == 200
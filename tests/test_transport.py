@@ -0,0 +1,251 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from grafana_sync.api.client import GrafanaClient, ssl_context
+from grafana_sync.api.transport import (
+    AdaptiveLimiter,
+    GrafanaTransport,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def make_client(statuses: list[int], **kwargs) -> tuple[httpx.AsyncClient, list]:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, headers={"Retry-After": "0"})
+
+    transport = GrafanaTransport(httpx.MockTransport(handler), **kwargs)
+    return httpx.AsyncClient(base_url="http://grafana", transport=transport), calls
+
+
+async def test_retry_idempotent_on_server_error():
+    client, calls = make_client(
+        [503, 502], retry_policy=RetryPolicy(max_retries=3, backoff_factor=0)
+    )
+    async with client:
+        response = await client.get("/api/folders")
+
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+
+
+async def test_no_retry_of_post_on_server_error():
+    client, calls = make_client(
+        [503], retry_policy=RetryPolicy(max_retries=3, backoff_factor=0)
+    )
+    async with client:
+        response = await client.post("/api/folders", json={})
+
+    assert response.status_code == 503
+    assert calls == ["POST"]
+
+
+async def test_retry_post_on_too_many_requests():
+    client, calls = make_client(
+        [429], retry_policy=RetryPolicy(max_retries=3, backoff_factor=0)
+    )
+    async with client:
+        response = await client.post("/api/folders", json={})
+
+    assert response.status_code == 200
+    assert calls == ["POST", "POST"]
+
+
+async def test_retries_exhausted():
+    client, calls = make_client(
+        [500, 500, 500], retry_policy=RetryPolicy(max_retries=2, backoff_factor=0)
+    )
+    async with client:
+        response = await client.get("/api/folders")
+
+    assert response.status_code == 500
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("3", 3.0),
+        ("-1", 0.0),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", 0.0),
+        ("garbage", None),
+    ],
+)
+def test_parse_retry_after(header, expected):
+    response = httpx.Response(429, headers={"Retry-After": header})
+    assert parse_retry_after(response) == expected
+
+
+def test_backoff_honors_retry_after():
+    policy = RetryPolicy(max_backoff=10)
+    response = httpx.Response(429, headers={"Retry-After": "120"})
+    assert policy.backoff(1, response) == 10
+
+
+def test_backoff_is_exponential():
+    policy = RetryPolicy(backoff_factor=1, jitter=False)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3)] == [1, 2, 4]
+
+
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_separate_read_and_write_budgets():
+    client, _ = make_client([], write_limiter=TokenBucket(rate=20, burst=1))
+    async with client:
+        start = time.monotonic()
+        for _ in range(5):
+            await client.get("/api/folders")
+        read_elapsed = time.monotonic() - start
+
+        start = time.monotonic()
+        for _ in range(3):
+            await client.post("/api/folders", json={})
+        write_elapsed = time.monotonic() - start
+
+    assert read_elapsed < 0.05
+    assert write_elapsed >= 0.09
+
+
+async def release_full_window(limiter: AdaptiveLimiter) -> None:
+    window = [await limiter.acquire() for _ in range(limiter.limit)]
+    for slot in window:
+        await limiter.release(slot, 200)
+
+
+async def test_adaptive_limit_increases_additively():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+
+    await release_full_window(limiter)
+    assert limiter.limit == 3
+
+    await release_full_window(limiter)
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        await release_full_window(limiter)
+    assert limiter.limit == 4
+
+
+async def test_adaptive_limit_does_not_grow_without_saturation():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+
+    for _ in range(20):
+        await limiter.release(await limiter.acquire(), 200)
+
+    assert limiter.limit == 2
+    assert limiter.increases == 0
+
+
+async def test_adaptive_limit_decreases_once_per_burst():
+    limiter = AdaptiveLimiter(initial_limit=8)
+    burst = [await limiter.acquire() for _ in range(8)]
+
+    for slot in burst:
+        await limiter.release(slot, 503)
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+    await limiter.release(await limiter.acquire(), 429)
+    assert limiter.limit == 2
+
+
+async def test_adaptive_limit_decreases_on_latency_spike():
+    limiter = AdaptiveLimiter(initial_limit=4, min_spike=0.005)
+    limiter.baseline_latency = 0.001
+
+    slot = await limiter.acquire()
+    await asyncio.sleep(0.01)
+    await limiter.release(slot, 200)
+
+    assert limiter.limit == 2
+
+
+async def test_adaptive_limit_ignores_body_download_time():
+    async def body():
+        await asyncio.sleep(0.02)
+        yield b"{}"
+
+    limiter = AdaptiveLimiter(initial_limit=4, min_spike=0.005)
+    limiter.baseline_latency = 0.001
+    transport = GrafanaTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, content=body())),
+        concurrency_limiter=limiter,
+    )
+    async with httpx.AsyncClient(
+        base_url="http://grafana", transport=transport
+    ) as client:
+        await client.get("/api/dashboards/uid/large")
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+async def test_adaptive_limit_bounds_requests_in_flight():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    transport = GrafanaTransport(
+        httpx.MockTransport(handler), concurrency_limiter=limiter
+    )
+    async with httpx.AsyncClient(
+        base_url="http://grafana", transport=transport
+    ) as client:
+        await asyncio.gather(*[client.get("/api/folders") for _ in range(10)])
+
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+def test_ssl_context_is_shared():
+    import certifi
+
+    assert ssl_context() is ssl_context()
+    assert ssl_context(certifi.where()) is not ssl_context()
+
+
+def test_environment_proxies_are_mounted(monkeypatch: pytest.MonkeyPatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+    client = GrafanaClient(
+        "https://grafana", username="admin", password="admin", read_rate=10
+    )
+
+    proxied = client.proxy_mounts["https://"]
+    assert isinstance(proxied, GrafanaTransport)
+    assert proxied.read_limiter is client.transport.read_limiter
+    assert client.proxy_mounts["all://*internal.example.com"] is None
+
+    mounts = {
+        pattern.pattern: transport
+        for pattern, transport in client.client._mounts.items()
+    }
+    assert mounts["https://"] is proxied
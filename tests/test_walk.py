@@ -132,3 +132,87 @@ async def test_list_command(grafana: "GrafanaClient"):
         ],
     )
     assert result.exit_code == 0
+
+
+async def test_walk_concurrent_ordered(grafana: "GrafanaClient"):
+    await grafana.create_folder(title="l1", uid="l1", parent_uid=None)
+    await grafana.create_folder(title="l2", uid="l2", parent_uid="l1")
+    await grafana.create_folder(title="l3", uid="l3", parent_uid=None)
+    await grafana.update_dashboard(
+        DashboardData(uid="dash1", title="Dashboard 1"), "l2"
+    )
+
+    sequential = [res async for res in grafana.walk("general", True, True)]
+    concurrent = [
+        res
+        async for res in grafana.walk(
+            "general", True, True, max_concurrency=4, ordered=True
+        )
+    ]
+
+    assert [
+        (folder_uid, _to_dicts(folders), _to_dicts(dashboards))
+        for folder_uid, folders, dashboards in concurrent
+    ] == [
+        (folder_uid, _to_dicts(folders), _to_dicts(dashboards))
+        for folder_uid, folders, dashboards in sequential
+    ]
+
+
+async def test_walk_concurrent_parent_first(grafana: "GrafanaClient"):
+    await grafana.create_folder(title="l1", uid="l1", parent_uid=None)
+    await grafana.create_folder(title="l2", uid="l2", parent_uid="l1")
+    await grafana.create_folder(title="l3", uid="l3", parent_uid="l2")
+
+    seen = [
+        folder_uid
+        async for folder_uid, _, _ in grafana.walk(
+            "general", True, False, max_concurrency=4
+        )
+    ]
+
+    assert seen == ["general", "l1", "l2", "l3"]
+
+
+async def test_walk_with_inventory(grafana: "GrafanaClient"):
+    await grafana.create_folder(title="l1", uid="l1", parent_uid=None)
+    await grafana.create_folder(title="l2", uid="l2", parent_uid="l1")
+    await grafana.update_dashboard(DashboardData(uid="dash0", title="Dashboard 0"))
+    await grafana.update_dashboard(
+        DashboardData(uid="dash1", title="Dashboard 1"), "l1"
+    )
+    await grafana.update_dashboard(
+        DashboardData(uid="dash2", title="Dashboard 2"), "l2"
+    )
+
+    searched = [res async for res in grafana.walk("general", True, True)]
+    inventoried = [
+        res async for res in grafana.walk("general", True, True, inventory=True)
+    ]
+
+    assert [
+        (folder_uid, _to_dicts(folders), _to_dicts(dashboards))
+        for folder_uid, folders, dashboards in inventoried
+    ] == [
+        (folder_uid, _to_dicts(folders), _to_dicts(dashboards))
+        for folder_uid, folders, dashboards in searched
+    ]
+
+
+async def test_paginated_folders_and_search(grafana: "GrafanaClient"):
+    for i in range(5):
+        await grafana.create_folder(title=f"f{i}", uid=f"f{i}", parent_uid=None)
+        await grafana.update_dashboard(
+            DashboardData(uid=f"dash{i}", title=f"Dashboard {i}"), f"f{i}"
+        )
+
+    folders = [folder.uid async for folder in grafana.iter_folders(page_size=2)]
+    assert sorted(folders) == [f"f{i}" for i in range(5)]
+
+    dashboards = [
+        dashboard.uid async for dashboard in grafana.iter_search_dashboards(page_size=2)
+    ]
+    assert sorted(dashboards) == [f"dash{i}" for i in range(5)]
+
+    assert len((await grafana.get_folders(page_size=3)).root) == 5
+    assert len((await grafana.search_dashboards(page_size=5)).root) == 5